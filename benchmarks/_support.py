@@ -0,0 +1,61 @@
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks run against a throwaway SQLite file (via aiosqlite) so they need
+no external services; absolute numbers are only comparable on one machine.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from core.application.dtos.user_dto import CreateUserRequestDto
+from core.infrastructure.database.database import Base
+from core.infrastructure.database.models import user  # noqa: F401  (registers tables)
+
+
+def user_dto(i: int) -> CreateUserRequestDto:
+    return CreateUserRequestDto(
+        name=f"user{i}",
+        email=f"user{i}@example.com",
+        password_hash="hashed",
+        role="user",
+    )
+
+
+@asynccontextmanager
+async def sqlite_engine() -> AsyncIterator[AsyncEngine]:
+    """Yield an engine on a fresh SQLite file with the schema created."""
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        yield engine
+    finally:
+        await engine.dispose()
+        os.remove(path)
+
+
+class StatementCounter:
+    """Counts statements sent to the database (one per driver round trip)."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine.sync_engine
+        self.count = 0
+
+    def _on_execute(self, *args) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "StatementCounter":
+        self.count = 0
+        event.listen(self._engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._on_execute)
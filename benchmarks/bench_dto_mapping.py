@@ -0,0 +1,62 @@
+"""Rows/sec for reading ``UserResponseDto`` lists: ORM + model_validate vs fast mapping.
+
+``orm`` selects ORM entities and validates each with
+``model_validate(from_attributes=True)``; ``fast`` selects plain columns and
+builds DTOs with ``model_construct``.  ``+json`` adds serializing the list
+to bytes the way the list endpoints do.
+
+Usage::
+
+    python -m benchmarks.bench_dto_mapping [-n 5000] [--repeat 5]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from pydantic_core import to_json
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from benchmarks._support import sqlite_engine, user_dto
+from server.infrastructure.repositories.user_repository import UserRepository
+
+
+class _OrmUserRepository(UserRepository):
+    @property
+    def fast_mapping(self) -> bool:
+        return False
+
+
+REPOSITORIES = {"orm": _OrmUserRepository, "fast": UserRepository}
+
+
+async def main(n: int, repeat: int) -> None:
+    async with sqlite_engine() as engine:
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_maker() as session:
+            await UserRepository(session).create_many([user_dto(i) for i in range(n)])
+            await session.commit()
+
+        print(f"{'mapping':<8} {'rows/sec':>12} {'rows/sec +json':>15}")
+        for name, repo_class in REPOSITORIES.items():
+            best = best_json = 0.0
+            for _ in range(repeat):
+                async with session_maker() as session:
+                    repo = repo_class(session)
+                    start = time.perf_counter()
+                    rows = await repo.get_list()
+                    fetched = time.perf_counter()
+                    to_json(rows)
+                    done = time.perf_counter()
+                best = max(best, len(rows) / (fetched - start))
+                best_json = max(best_json, len(rows) / (done - start))
+            print(f"{name:<8} {best:>12,.0f} {best_json:>15,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=5000, help="rows in the table")
+    parser.add_argument("--repeat", type=int, default=5, help="runs; best is kept")
+    args = parser.parse_args()
+    asyncio.run(main(args.n, args.repeat))
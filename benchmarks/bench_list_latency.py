@@ -0,0 +1,100 @@
+"""p50/p99 latency of ``GET /users/?page_size=500``: stock FastAPI route vs DtoRoute.
+
+Both apps serve the same ``UserService`` over a SQLite table of 500 users,
+driven in-process through httpx's ASGI transport (no sockets), so the
+numbers isolate database read + mapping + response serialization.
+
+``stock``    — ``APIRoute`` + ``JSONResponse``: response_model validation,
+               ``jsonable_encoder`` and stdlib ``json``
+``dto``      — ``DtoRoute`` + ``DtoJSONResponse``, as wired in ``create_app``
+
+Usage::
+
+    python -m benchmarks.bench_list_latency [-n 300]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import httpx
+from fastapi import APIRouter, FastAPI, Query
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from benchmarks._support import sqlite_engine, user_dto
+from core.application.dtos.user_dto import UserResponseDto
+from core.infrastructure.database.session import ManagedSession
+from server.application.controllers.responses import DtoJSONResponse, DtoRoute
+from server.application.services.user_service import UserService
+from server.infrastructure.repositories.user_repository import UserRepository
+
+
+def _app(service: UserService, route_class: type[APIRoute], response_class) -> FastAPI:
+    router = APIRouter(prefix="/users", route_class=route_class)
+
+    @router.get("/", response_model=List[UserResponseDto])
+    async def get_users(
+        page: int = Query(1, ge=1), page_size: int = Query(10, ge=1)
+    ):
+        return await service.get_users(page=page, page_size=page_size)
+
+    app = FastAPI(default_response_class=response_class)
+    app.include_router(router)
+    return app
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * pct), len(ordered) - 1)]
+
+
+async def _measure(app: FastAPI, n: int) -> list[float]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(20):  # warm up
+            await client.get("/users/", params={"page_size": 500})
+        samples = []
+        for _ in range(n):
+            start = time.perf_counter()
+            response = await client.get("/users/", params={"page_size": 500})
+            samples.append((time.perf_counter() - start) * 1e3)
+            assert response.status_code == 200 and len(response.json()) == 500
+    return samples
+
+
+async def main(n: int) -> None:
+    async with sqlite_engine() as engine:
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_maker() as session:
+            await UserRepository(session).create_many([user_dto(i) for i in range(500)])
+            await session.commit()
+
+        service = UserService(
+            session_factory=lambda **kw: ManagedSession(session_maker, **kw),
+            repo_class=UserRepository,
+            config=None,
+        )
+        variants = {
+            "stock": _app(service, APIRoute, JSONResponse),
+            "dto": _app(service, DtoRoute, DtoJSONResponse),
+        }
+
+        print(f"{'variant':<8} {'p50 ms':>8} {'p99 ms':>8} {'mean ms':>8}")
+        for name, app in variants.items():
+            samples = await _measure(app, n)
+            print(
+                f"{name:<8} {_percentile(samples, 0.50):>8.2f} "
+                f"{_percentile(samples, 0.99):>8.2f} {statistics.mean(samples):>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=300, help="requests per variant")
+    args = parser.parse_args()
+    asyncio.run(main(args.n))
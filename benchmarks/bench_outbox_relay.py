@@ -0,0 +1,65 @@
+"""Outbox relay throughput: messages/s by batch size and number of relays.
+
+Each run seeds ``-n`` events and drains them with ``--relays`` concurrent
+relays into an in-memory sink.  SQLite serializes the claim transactions,
+so extra relays only show their overhead here; on PostgreSQL ``SKIP
+LOCKED`` lets them claim in parallel.
+
+Usage::
+
+    python -m benchmarks.bench_outbox_relay [-n 5000] [--relays 1 4]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from benchmarks._support import sqlite_engine
+from core.domain.events import DomainEvent
+from core.infrastructure.database.models import outbox  # noqa: F401  (registers tables)
+from core.infrastructure.outbox import InMemorySink, OutboxRelay
+from core.infrastructure.repositories.outbox_repository import OutboxRepository
+
+BATCH_SIZES = (1, 10, 100, 500)
+
+
+async def _run(n: int, batch_size: int, relays: int) -> float:
+    async with sqlite_engine() as engine:
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_maker() as session:
+            await OutboxRepository(session).add(
+                [
+                    DomainEvent("User", "UserCreated", str(i), {"id": i, "name": f"u{i}"})
+                    for i in range(n)
+                ]
+            )
+            await session.commit()
+
+        sink = InMemorySink()
+        workers = [
+            OutboxRelay(session_maker, sink, batch_size=batch_size) for _ in range(relays)
+        ]
+        start = time.perf_counter()
+        await asyncio.gather(*(w.drain() for w in workers))
+        elapsed = time.perf_counter() - start
+        assert len(sink.messages) == n, "every message is delivered exactly once"
+    return n / elapsed
+
+
+async def main(n: int, relay_counts: list[int]) -> None:
+    print(f"{'batch':>6} {'relays':>7} {'msg/s':>10}")
+    for batch_size in BATCH_SIZES:
+        for relays in relay_counts:
+            rate = await _run(n, batch_size, relays)
+            print(f"{batch_size:>6} {relays:>7} {rate:>10.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=5000, help="events to relay")
+    parser.add_argument("--relays", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+    asyncio.run(main(args.n, args.relays))
@@ -0,0 +1,88 @@
+"""Per-request Python cost of building list queries: per-call specs vs a cacheable chain.
+
+``build`` is what happens before SQLAlchemy can look the statement up in its
+compiled cache (construct the ``Select`` and compute its cache key);
+``execute`` adds the round trip against a 20-row SQLite table.
+
+Usage::
+
+    python -m benchmarks.bench_query_build [-n 20000]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any, Callable
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from benchmarks._support import sqlite_engine, user_dto
+from core.infrastructure.database.models.user import UserModel
+from core.specs.base import SpecChain
+from core.specs.common import OrderBy, Paginate, Where
+from server.infrastructure.repositories.user_repository import (
+    ACTIVE_USERS_SPEC,
+    UserRepository,
+)
+
+
+def _per_call_spec(page: int, page_size: int) -> tuple[Any, Any]:
+    # The shape UserRepository used before chains were pre-built.
+    spec = SpecChain(
+        [
+            Where.of(UserModel.deleted_at.is_(None)),
+            OrderBy.of(UserModel.id.desc()),
+            Paginate(page=page, page_size=page_size),
+        ]
+    )
+    return spec, None
+
+
+def _cached_spec(page: int, page_size: int) -> tuple[Any, Any]:
+    return ACTIVE_USERS_SPEC, Paginate.params(page, page_size)
+
+
+VARIANTS: dict[str, Callable[[int, int], tuple[Any, Any]]] = {
+    "per-call": _per_call_spec,
+    "cacheable": _cached_spec,
+}
+
+
+def _time_build(repo: UserRepository, variant: Callable, n: int) -> float:
+    start = time.perf_counter()
+    for i in range(n):
+        spec, _ = variant(i % 10 + 1, 20)
+        repo._list_select(spec)._generate_cache_key()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+async def _time_execute(repo: UserRepository, variant: Callable, n: int) -> float:
+    start = time.perf_counter()
+    for i in range(n):
+        spec, params = variant(i % 2 + 1, 10)
+        await repo.get_list(spec=spec, params=params)
+    return (time.perf_counter() - start) / n * 1e6
+
+
+async def main(n: int) -> None:
+    async with sqlite_engine() as engine:
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_maker() as session:
+            repo = UserRepository(session)
+            await repo.create_many([user_dto(i) for i in range(20)])
+            await session.commit()
+
+            print(f"{'variant':<10} {'build us/call':>14} {'execute us/call':>16}")
+            for name, variant in VARIANTS.items():
+                _time_build(repo, variant, 100)  # warm up caches
+                build = _time_build(repo, variant, n)
+                execute = await _time_execute(repo, variant, max(n // 10, 1))
+                print(f"{name:<10} {build:>14.1f} {execute:>16.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=20000, help="queries per variant")
+    args = parser.parse_args()
+    asyncio.run(main(args.n))
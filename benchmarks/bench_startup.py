@@ -0,0 +1,107 @@
+"""Cold-start budget: import + ``create_app()`` + lifespan startup, in fresh processes.
+
+Every run is a new interpreter (nothing cached in ``sys.modules``), as a
+new autoscaled replica or serverless instance would start.  The median
+total is checked against ``--budget-ms``; the script exits 1 when it is
+over, so CI can keep startup from creeping up.  ``python -X importtime``
+then lists the modules with the most import time of their own — the first
+place to look when the budget is blown.
+
+The lifespan opens no database connection (engines connect on first
+checkout), so no database has to be running.
+
+Usage::
+
+    python -m benchmarks.bench_startup [--runs 5] [--budget-ms 1500] [--top 15]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# config.yml requires these; nothing connects during startup
+ENV = {
+    "DATABASE_USER": "bench",
+    "DATABASE_PASSWORD": "bench",
+    "DATABASE_HOST": "127.0.0.1",
+    "DATABASE_PORT": "5432",
+    "DATABASE_NAME": "bench",
+}
+
+COLD_START = """
+import asyncio, json, time
+started = time.perf_counter()
+import server.app as server_app
+imported = time.perf_counter()
+app = server_app.create_app()
+created = time.perf_counter()
+
+async def lifespan():
+    async with app.router.lifespan_context(app):
+        return time.perf_counter()
+
+ready = asyncio.run(lifespan())
+print(json.dumps({
+    "import_ms": (imported - started) * 1e3,
+    "create_app_ms": (created - imported) * 1e3,
+    "lifespan_ms": (ready - created) * 1e3,
+    "total_ms": (ready - started) * 1e3,
+}))
+"""
+
+
+def _python(*args: str) -> subprocess.CompletedProcess[str]:
+    env = {**ENV, **os.environ}
+    return subprocess.run(
+        [sys.executable, *args], env=env, capture_output=True, text=True, check=True
+    )
+
+
+def cold_start(runs: int) -> dict[str, float]:
+    """Median of each phase over ``runs`` fresh interpreters."""
+    samples = [json.loads(_python("-c", COLD_START).stdout) for _ in range(runs)]
+    return {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+
+
+def import_profile(top: int) -> list[tuple[str, float, float]]:
+    """(module, self ms, cumulative ms) of the ``top`` slowest imports by self time."""
+    stderr = _python("-X", "importtime", "-c", "import server.app").stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(own) / 1e3, int(cumulative) / 1e3))
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows[:top]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1500.0)
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to list")
+    args = parser.parse_args()
+
+    phases = cold_start(args.runs)
+    for key, value in phases.items():
+        print(f"{key:<14} {value:>8.1f}")
+
+    print(f"\n{'self ms':>8} {'cum ms':>8}  module")
+    for name, own, cumulative in import_profile(args.top):
+        print(f"{own:>8.1f} {cumulative:>8.1f}  {name}")
+
+    total = phases["total_ms"]
+    if total > args.budget_ms:
+        print(f"\nOVER BUDGET: cold start {total:.0f} ms > {args.budget_ms:.0f} ms")
+        return 1
+    print(f"\ncold start {total:.0f} ms within {args.budget_ms:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,344 @@
+"""Load test of the ``/users`` API as served by ``create_app()``.
+
+The real app — container, middleware, routes, ``UserService`` — runs
+in-process behind httpx's ASGI transport, with its ``database`` provider
+pointed at a local stand-in: a fresh SQLite file (default) or a throwaway
+PostgreSQL database (``--database-url``; its tables are created and dropped).
+The table is seeded with ``--users`` rows, then each scenario is driven by
+``--concurrency`` clients for ``--requests`` requests.
+
+Per scenario it reports:
+
+``rps``                   completed requests per second (all clients)
+``p50/p95/p99 ms``        request latency
+``queries_per_request``   statements sent to the database
+``alloc_kib_per_request`` median peak Python allocation of one request,
+                          from a separate sequential ``tracemalloc`` pass
+                          (so tracing does not skew the latency numbers)
+
+``--save`` writes the results as a JSON baseline; ``--baseline`` compares
+against one and exits 1 on a regression: throughput or latency worse than
+``--tolerance`` (default 15%), allocation growth beyond it, or any extra
+query per request.  Baselines are only comparable on the same machine and
+database.
+
+Usage::
+
+    python -m benchmarks.bench_user_api [--users 10000] [--concurrency 32]
+        [--requests 2000] [--database-url postgresql+psycopg://...]
+        [--save benchmarks/results/user_api.json]
+        [--baseline benchmarks/results/user_api.json] [--tolerance 0.15]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+import httpx
+from dependency_injector import providers
+
+from benchmarks._support import StatementCounter, user_dto
+from core.infrastructure.database.database import Base, Database
+from core.infrastructure.database.engine import EngineOptions
+from core.infrastructure.database.models import user  # noqa: F401  (registers tables)
+from server.infrastructure.repositories.user_repository import UserRepository
+
+SEED_CHUNK = 5_000
+ALLOC_SAMPLES = 50
+
+Request = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+# ---- scenarios ----
+
+
+def _scenarios(users: int) -> dict[str, Request]:
+    """name → request; the int argument is the request's sequence number."""
+    pages = max(users // 50, 1)
+    emails = itertools.count()
+
+    def list_page(client: httpx.AsyncClient, i: int) -> Awaitable[httpx.Response]:
+        return client.get("/users/", params={"page": i % pages + 1, "page_size": 50})
+
+    def paged(client: httpx.AsyncClient, i: int) -> Awaitable[httpx.Response]:
+        params = {"page": i % pages + 1, "page_size": 50}
+        return client.get("/users/paged", params=params)
+
+    def cursor(client: httpx.AsyncClient, i: int) -> Awaitable[httpx.Response]:
+        # the hot "newest first" page: identical concurrent reads coalesce
+        return client.get("/users/cursor", params={"page_size": 50})
+
+    def active(client: httpx.AsyncClient, i: int) -> Awaitable[httpx.Response]:
+        params = {"page": i % pages + 1, "page_size": 50}
+        return client.get("/users/activate-user", params=params)
+
+    def get_one(client: httpx.AsyncClient, i: int) -> Awaitable[httpx.Response]:
+        return client.get(f"/users/{i % users + 1}")
+
+    def create(client: httpx.AsyncClient, i: int) -> Awaitable[httpx.Response]:
+        n = users + next(emails)
+        return client.post("/users/", json=user_dto(n).model_dump(mode="json"))
+
+    def update(client: httpx.AsyncClient, i: int) -> Awaitable[httpx.Response]:
+        return client.put(f"/users/{i % users + 1}", json={"name": f"renamed{i}"})
+
+    return {
+        "list": list_page,
+        "paged": paged,
+        "cursor": cursor,
+        "active": active,
+        "get_by_id": get_one,
+        "create": create,
+        "update": update,
+    }
+
+
+# ---- measurement ----
+
+
+@dataclass
+class Result:
+    requests: int
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    queries_per_request: float
+    alloc_kib_per_request: float
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * pct), len(ordered) - 1)]
+
+
+async def _drive(
+    client: httpx.AsyncClient, request: Request, total: int, concurrency: int
+) -> tuple[list[float], float]:
+    """``total`` requests from ``concurrency`` clients; (latencies ms, wall s)."""
+    sequence = itertools.count()
+    samples: list[float] = []
+
+    async def worker() -> None:
+        for i in sequence:
+            if i >= total:
+                return
+            start = time.perf_counter()
+            response = await request(client, i)
+            samples.append((time.perf_counter() - start) * 1e3)
+            if response.status_code >= 400:
+                raise RuntimeError(f"{response.status_code}: {response.text[:200]}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, time.perf_counter() - started
+
+
+async def _allocations(
+    client: httpx.AsyncClient, request: Request, offset: int
+) -> float:
+    """Median peak KiB allocated while serving one request."""
+    peaks = []
+    tracemalloc.start()
+    try:
+        for i in range(ALLOC_SAMPLES):
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            await request(client, offset + i)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return statistics.median(peaks) / 1024
+
+
+async def _measure(
+    client: httpx.AsyncClient,
+    counter: StatementCounter,
+    request: Request,
+    total: int,
+    concurrency: int,
+) -> Result:
+    await _drive(client, request, min(total // 10 + 1, 100), concurrency)  # warm up
+    with counter:
+        samples, elapsed = await _drive(client, request, total, concurrency)
+    queries = counter.count / total
+    alloc = await _allocations(client, request, total)
+    return Result(
+        requests=total,
+        rps=total / elapsed,
+        p50_ms=_percentile(samples, 0.50),
+        p95_ms=_percentile(samples, 0.95),
+        p99_ms=_percentile(samples, 0.99),
+        queries_per_request=queries,
+        alloc_kib_per_request=alloc,
+    )
+
+
+# ---- app against the stand-in database ----
+
+
+@asynccontextmanager
+async def _database(url: Optional[str], users: int) -> AsyncIterator[Database]:
+    path = None
+    if url is None:
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        url = f"sqlite+aiosqlite:///{path}"
+    options = EngineOptions(pool_size=20, max_overflow=20, slow_query_ms=-1)
+    database = Database.from_url(url, options=options)
+    try:
+        async with database.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        async with database.session_maker() as session:
+            repo = UserRepository(session)
+            for start in range(0, users, SEED_CHUNK):
+                stop = min(start + SEED_CHUNK, users)
+                await repo.create_many([user_dto(i) for i in range(start, stop)])
+            await session.commit()
+        yield database
+    finally:
+        if path is None:
+            async with database.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+        await database.engine.dispose()
+        if path is not None:
+            os.remove(path)
+
+
+def _create_app(database: Database) -> Any:
+    # config.yml requires these; the database provider is overridden below
+    for key, value in {
+        "DATABASE_USER": "bench",
+        "DATABASE_PASSWORD": "bench",
+        "DATABASE_HOST": "127.0.0.1",
+        "DATABASE_PORT": "5432",
+        "DATABASE_NAME": "bench",
+    }.items():
+        os.environ.setdefault(key, value)
+    import server.app as server_app
+
+    app = server_app.create_app()
+    server_app.container.database.override(providers.Object(database))
+    return app
+
+
+async def run(
+    users: int, concurrency: int, total: int, url: Optional[str], only: list[str]
+) -> dict[str, Result]:
+    results: dict[str, Result] = {}
+    async with _database(url, users) as database:
+        app = _create_app(database)
+        counter = StatementCounter(database.engine)
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app), httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            for name, request in _scenarios(users).items():
+                if only and name not in only:
+                    continue
+                results[name] = await _measure(
+                    client, counter, request, total, concurrency
+                )
+    return results
+
+
+# ---- baseline ----
+
+
+def _report(args: argparse.Namespace, results: dict[str, Result]) -> dict[str, Any]:
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "database": "postgresql" if args.database_url else "sqlite",
+            "users": args.users,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+        },
+        "scenarios": {name: asdict(r) for name, r in results.items()},
+    }
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> list[str]:
+    """Regressions of ``current`` against ``baseline`` (empty when none)."""
+    problems = []
+    for name, base in baseline["scenarios"].items():
+        now = current["scenarios"].get(name)
+        if now is None:
+            continue
+        if now["rps"] < base["rps"] * (1 - tolerance):
+            problems.append(f"{name}: rps {base['rps']:.0f} -> {now['rps']:.0f}")
+        for key in ("p50_ms", "p95_ms", "p99_ms", "alloc_kib_per_request"):
+            if now[key] > base[key] * (1 + tolerance):
+                problems.append(f"{name}: {key} {base[key]:.2f} -> {now[key]:.2f}")
+        # statement counts are deterministic: any increase is a regression
+        if now["queries_per_request"] > base["queries_per_request"] + 0.01:
+            problems.append(
+                f"{name}: queries_per_request {base['queries_per_request']:.2f}"
+                f" -> {now['queries_per_request']:.2f}"
+            )
+    return problems
+
+
+def _print(results: dict[str, Result]) -> None:
+    print(
+        f"{'scenario':<10} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+        f" {'queries':>8} {'KiB':>8}"
+    )
+    for name, r in results.items():
+        print(
+            f"{name:<10} {r.rps:>8.0f} {r.p50_ms:>8.2f} {r.p95_ms:>8.2f}"
+            f" {r.p99_ms:>8.2f} {r.queries_per_request:>8.2f}"
+            f" {r.alloc_kib_per_request:>8.1f}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=10_000, help="rows to seed")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2_000, help="per scenario")
+    parser.add_argument("--database-url", help="throwaway database (default: SQLite)")
+    parser.add_argument("--only", nargs="*", default=[], help="scenario names")
+    parser.add_argument("--save", type=Path, help="write results as a JSON baseline")
+    parser.add_argument("--baseline", type=Path, help="compare against a saved run")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    results = asyncio.run(
+        run(args.users, args.concurrency, args.requests, args.database_url, args.only)
+    )
+    _print(results)
+    report = _report(args, results)
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(report, indent=2) + "\n")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        problems = compare(report, baseline, args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""Round trips per single-row write: legacy flush/refresh path vs RETURNING.
+
+Usage::
+
+    python -m benchmarks.bench_write_roundtrips [-n 200]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from benchmarks._support import StatementCounter, sqlite_engine, user_dto
+from core.application.dtos.user_dto import UpdateUserRequestDto
+from core.infrastructure.database.models.user import UserModel
+from server.infrastructure.repositories.user_repository import UserRepository
+
+
+# ---- the pre-RETURNING write path, kept here for comparison ----
+
+
+async def _legacy_create(session: AsyncSession, i: int) -> int:
+    obj = UserModel(**user_dto(i).model_dump(exclude_none=True))
+    session.add(obj)
+    await session.flush()
+    await session.refresh(obj)
+    return obj.id
+
+
+async def _legacy_update(session: AsyncSession, obj_id: int) -> None:
+    stmt = update(UserModel).where(UserModel.id == obj_id).values(role="admin")
+    await session.execute(stmt)
+    await session.flush()
+    await session.execute(select(UserModel).where(UserModel.id == obj_id))
+
+
+async def _legacy_delete(session: AsyncSession, obj_id: int) -> None:
+    await session.execute(select(UserModel).where(UserModel.id == obj_id))
+    await session.execute(delete(UserModel).where(UserModel.id == obj_id))
+    await session.flush()
+
+
+async def _returning_create(session: AsyncSession, i: int) -> int:
+    return (await UserRepository(session).create(user_dto(i))).id
+
+
+async def _returning_update(session: AsyncSession, obj_id: int) -> None:
+    await UserRepository(session).update_by_id(
+        obj_id, UpdateUserRequestDto(role="admin")
+    )
+
+
+async def _returning_delete(session: AsyncSession, obj_id: int) -> None:
+    await UserRepository(session).delete_by_id(obj_id)
+
+
+PATHS = {
+    "legacy": (_legacy_create, _legacy_update, _legacy_delete),
+    "returning": (_returning_create, _returning_update, _returning_delete),
+}
+
+
+async def _run_path(name: str, n: int) -> dict[str, tuple[float, float]]:
+    create, update_, delete_ = PATHS[name]
+    results: dict[str, tuple[float, float]] = {}
+    async with sqlite_engine() as engine:
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_maker() as session:
+            ids: list[int] = []
+            for op, fn, args in (
+                ("create", create, range(n)),
+                ("update", update_, None),
+                ("delete", delete_, None),
+            ):
+                with StatementCounter(engine) as counter:
+                    start = time.perf_counter()
+                    if op == "create":
+                        ids = [await fn(session, i) for i in args]
+                    else:
+                        for obj_id in ids:
+                            await fn(session, obj_id)
+                    elapsed = time.perf_counter() - start
+                results[op] = (counter.count / n, elapsed / n * 1e6)
+            await session.commit()
+    return results
+
+
+async def main(n: int) -> None:
+    print(f"{'path':<10} {'op':<8} {'round trips/op':>15} {'us/op':>10}")
+    for name in PATHS:
+        for op, (trips, us) in (await _run_path(name, n)).items():
+            print(f"{name:<10} {op:<8} {trips:>15.2f} {us:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=200, help="rows per operation")
+    args = parser.parse_args()
+    asyncio.run(main(args.n))
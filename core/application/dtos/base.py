@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from abc import ABC
+from typing import Generic, Optional, TypeVar
 
 from pydantic import BaseModel, ConfigDict
 
@@ -19,3 +20,31 @@ class BaseRequest(ABC, BaseModel):
 
 class BaseResponse(ABC, BaseModel):
     model_config = dto_model_config
+
+
+ItemT = TypeVar("ItemT")
+
+
+class CursorPage(BaseResponse, Generic[ItemT]):
+    """One page of a keyset-paginated listing.
+
+    ``next_cursor`` / ``prev_cursor`` are opaque tokens to pass back as
+    ``cursor``; ``None`` means there is no page in that direction.
+    """
+
+    items: list[ItemT]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+class Page(BaseResponse, Generic[ItemT]):
+    """One page of an offset-paginated listing together with the total count.
+
+    ``total`` is exact unless an approximate count was requested, in which
+    case it may come from planner statistics.
+    """
+
+    items: list[ItemT]
+    total: int
+    page: int
+    page_size: int
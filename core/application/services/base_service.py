@@ -1,17 +1,45 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Any, Callable, Generic, Optional, TypeVar
+from weakref import WeakValueDictionary
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+)
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.domain.events import DomainEvent
 from core.domain.repositories.base import AbstractRepository
-from core.infrastructure.database.session import ManagedSession
-from core.application.dtos.base import BaseRequest, BaseResponse
+from core.infrastructure.background import BatchHook, HookRunner, is_deferred
+from core.infrastructure.cache.entity_cache import EntityCache
+from core.infrastructure.concurrency import DataLoader, SingleFlight
+from core.infrastructure.database.replicas import last_write_marker
+from core.infrastructure.database.session import ManagedSession, on_commit
+from core.infrastructure.database.unit_of_work import current_unit_of_work
+from core.infrastructure.metrics import registry
+from core.infrastructure.repositories.outbox_repository import OutboxRepository
+from core.application.dtos.base import BaseRequest, BaseResponse, CursorPage
+from core.specs.base import spec_cache_key
 
 CreateDTO = TypeVar("CreateDTO", bound=BaseRequest)
 UpdateDTO = TypeVar("UpdateDTO", bound=BaseRequest)
 ResponseDTO = TypeVar("ResponseDTO", bound=BaseResponse)
+T = TypeVar("T")
+
+coalesced_calls = registry.counter(
+    "service_coalesced_calls_total",
+    "Database calls saved by sharing an identical in-flight read",
+    ("service", "method"),
+)
 
 
 class BaseService(ABC, Generic[CreateDTO, ResponseDTO, UpdateDTO]):
@@ -23,12 +51,45 @@ class BaseService(ABC, Generic[CreateDTO, ResponseDTO, UpdateDTO]):
     multiple operations within a **single transaction**.
 
     Constructor args:
-        session_factory  — callable that returns a ``ManagedSession`` context manager
+        session_factory  — callable that returns a ``ManagedSession`` context manager;
+                           read-only methods call it with ``read_only=True`` so
+                           they can be routed to a replica
         repo_class       — primary repository class; instantiated with ``(session)``
+        cache            — optional ``EntityCache`` in front of ``get_by_id``;
+                           entries are invalidated by every update/delete, both
+                           immediately and again once the transaction commits
+        coalescer        — optional ``SingleFlight`` shared by service instances;
+                           identical concurrent reads (same method, arguments
+                           and compiled spec) then await one query instead of
+                           each running their own.  Results are never reused
+                           once the query finishes, so this is safe for data
+                           that must not be stale
+        hooks            — optional ``HookRunner`` for ``@deferred`` hooks;
+                           without one they still run after commit, but
+                           inline in the caller
+        outbox           — write ``<event_topic>Created`` / ``Updated`` /
+                           ``Deleted`` events to the outbox table in the same
+                           transaction as each write (one extra statement
+                           per write call); see ``core.infrastructure.outbox``
+
+    Optionally override:
+        event_topic   — aggregate name for outbox events (None: no events)
+        event_payload — DTO → event payload (default: all fields, JSON mode)
 
     Optionally override hooks:
         validate_create / validate_update — pre-mutation validation
         after_create / after_update / after_delete — post-mutation side effects
+        after_create_many / after_update_many / after_delete_many
+            — batched variants used by the bulk API; by default they call the
+              single-row hook once per row
+
+    Hooks run inside the transaction unless marked ``@deferred`` (see
+    ``core.infrastructure.background``).  Marking either the single-row hook
+    or its ``_many`` variant defers the whole kind: after commit, rows are
+    queued and delivered in batches through the ``_many`` variant, with
+    retries — so deferred hooks must be idempotent.  Deferred hooks only
+    see rows that exist: failed updates (``None``) and no-op deletes are
+    not delivered.
 
     Multi-repo injection (Pattern 2)::
 
@@ -45,15 +106,29 @@ class BaseService(ABC, Generic[CreateDTO, ResponseDTO, UpdateDTO]):
                 return self._product_repo_class(session)
     """
 
+    event_topic: Optional[str] = None
+
     def __init__(
         self,
         session_factory: Callable[..., ManagedSession],
         repo_class: Callable[
             [AsyncSession], AbstractRepository[CreateDTO, ResponseDTO, UpdateDTO]
         ],
+        *,
+        cache: Optional[EntityCache[ResponseDTO]] = None,
+        coalescer: Optional[SingleFlight[Any]] = None,
+        hooks: Optional[HookRunner] = None,
+        outbox: bool = False,
     ) -> None:
         self._session_factory = session_factory
         self._repo_class = repo_class
+        self._cache = cache
+        self._coalescer = coalescer
+        self._hooks = hooks
+        self._outbox = outbox and self.event_topic is not None
+        self._id_loaders: WeakValueDictionary[
+            Hashable, DataLoader[int, Optional[ResponseDTO]]
+        ] = WeakValueDictionary()
 
     def _create_repo(
         self,
@@ -62,6 +137,116 @@ class BaseService(ABC, Generic[CreateDTO, ResponseDTO, UpdateDTO]):
         """Create the primary repo. Override in subclass to narrow the return type."""
         return self._repo_class(session)
 
+    def _read_session(self) -> ManagedSession:
+        """Session scope for queries that never write (replica-eligible)."""
+        return self._session_factory(read_only=True)
+
+    async def _read(
+        self,
+        method: str,
+        key: Hashable | Callable[[], Hashable],
+        op: Callable[[Any], Awaitable[T]],
+    ) -> T:
+        """Run ``op(repo)`` in a read session, sharing identical in-flight calls.
+
+        ``key`` must capture every argument that affects the result; specs
+        go through ``spec_cache_key``.  Pass a costly key as a callable: it
+        is only built when the call can actually be shared.  The caller's last-commit marker is
+        part of the key so a request inside its read-your-writes window
+        never joins a replica read started by someone else; likewise reads
+        inside a request-scoped unit of work with uncommitted writes are
+        never shared.
+        """
+
+        async def run() -> T:
+            async with self._read_session() as session:
+                return await op(self._create_repo(session))
+
+        coalescer = self._coalescer
+        if coalescer is None or not self._may_share_reads():
+            return await run()
+        if callable(key):
+            key = key()
+        flight_key = (type(self), self._repo_class, method, key, last_write_marker())
+        result, shared = await coalescer.do(flight_key, run)
+        if shared:
+            coalesced_calls.inc(service=type(self).__name__, method=method)
+            if isinstance(result, list):
+                result = list(result)  # callers must not see each other's edits
+        return result
+
+    @staticmethod
+    def _may_share_reads() -> bool:
+        """Whether what this caller reads may be shown to other requests.
+
+        Not inside a request-scoped unit of work with uncommitted writes: a
+        cache fill would read them, and a rollback would leave them cached.
+        """
+        uow = current_unit_of_work()
+        return uow is None or uow.allows_coalescing()
+
+    async def _invalidate(self, session: AsyncSession, *obj_ids: int) -> None:
+        cache = self._cache
+        if cache is None or not obj_ids:
+            return
+        await cache.invalidate(*obj_ids)
+        # again after commit: a concurrent reader may have re-filled the entry
+        # from the pre-commit row in between
+        on_commit(session, lambda: cache.invalidate(*obj_ids))
+
+    def event_payload(self, dto: ResponseDTO) -> dict[str, Any]:
+        return dto.model_dump(mode="json")
+
+    async def _emit(
+        self,
+        session: AsyncSession,
+        event: str,
+        rows: Sequence[tuple[Any, dict[str, Any]]],
+    ) -> None:
+        """Record one ``<event_topic><event>`` per ``(id, payload)`` in the outbox."""
+        if not self._outbox or not rows:
+            return
+        topic = self.event_topic
+        assert topic is not None
+        await OutboxRepository(session).add(
+            [
+                DomainEvent(topic, topic + event, str(obj_id), payload)
+                for obj_id, payload in rows
+            ]
+        )
+
+    def _changed(
+        self, repo: AbstractRepository[Any, Any, Any], dtos: Sequence[ResponseDTO]
+    ) -> list[tuple[Any, dict[str, Any]]]:
+        if not self._outbox:
+            return []
+        pk = repo.pk_column
+        return [(getattr(dto, pk), self.event_payload(dto)) for dto in dtos]
+
+    def _removed(
+        self, repo: AbstractRepository[Any, Any, Any], obj_ids: Sequence[Any]
+    ) -> list[tuple[Any, dict[str, Any]]]:
+        return [(obj_id, {repo.pk_column: obj_id}) for obj_id in obj_ids]
+
+    def _defers(self, kind: str) -> bool:
+        """Whether ``after_<kind>`` hooks are ``@deferred``."""
+        return is_deferred(getattr(self, f"after_{kind}")) or is_deferred(
+            getattr(self, f"after_{kind}_many")
+        )
+
+    def _defer(
+        self, session: AsyncSession, hook: BatchHook, items: Sequence[Any]
+    ) -> None:
+        """Hand ``items`` to ``hook`` once the transaction commits."""
+        if not items:
+            return
+        items = list(items)
+        runner = self._hooks
+        if runner is None:
+            on_commit(session, lambda: hook(items))
+        else:
+            on_commit(session, lambda: runner.submit(hook, items))
+
     # ---- hooks (override optional) ----
 
     async def validate_create(self, dto: CreateDTO) -> None: ...
@@ -71,13 +256,29 @@ class BaseService(ABC, Generic[CreateDTO, ResponseDTO, UpdateDTO]):
     async def after_update(self, updated: Optional[ResponseDTO]) -> None: ...
     async def after_delete(self, obj_id: int, deleted: bool) -> None: ...
 
+    async def after_create_many(self, created: list[ResponseDTO]) -> None:
+        for obj in created:
+            await self.after_create(obj)
+
+    async def after_update_many(self, updated: list[ResponseDTO]) -> None:
+        for obj in updated:
+            await self.after_update(obj)
+
+    async def after_delete_many(self, obj_ids: list[int]) -> None:
+        for obj_id in obj_ids:
+            await self.after_delete(obj_id, True)
+
     # ---- internal (composable within the same transaction, NO commit) ----
 
     async def _create(self, session: AsyncSession, dto: CreateDTO) -> ResponseDTO:
         repo = self._create_repo(session)
         await self.validate_create(dto)
         created = await repo.create(dto)
-        await self.after_create(created)
+        await self._emit(session, "Created", self._changed(repo, [created]))
+        if self._defers("create"):
+            self._defer(session, self.after_create_many, [created])
+        else:
+            await self.after_create(created)
         return created
 
     async def _update(
@@ -89,13 +290,79 @@ class BaseService(ABC, Generic[CreateDTO, ResponseDTO, UpdateDTO]):
         repo = self._create_repo(session)
         await self.validate_update(obj_id, dto)
         updated = await repo.update_by_id(obj_id, dto)
-        await self.after_update(updated)
+        await self._invalidate(session, obj_id)
+        if updated is not None:
+            await self._emit(session, "Updated", self._changed(repo, [updated]))
+        if self._defers("update"):
+            self._defer(session, self.after_update_many, [updated] if updated else [])
+        else:
+            await self.after_update(updated)
         return updated
 
     async def _delete(self, session: AsyncSession, obj_id: int) -> bool:
         repo = self._create_repo(session)
         deleted = await repo.delete_by_id(obj_id)
-        await self.after_delete(obj_id, deleted)
+        if deleted:
+            await self._invalidate(session, obj_id)
+            await self._emit(session, "Deleted", self._removed(repo, [obj_id]))
+        if self._defers("delete"):
+            self._defer(session, self.after_delete_many, [obj_id] if deleted else [])
+        else:
+            await self.after_delete(obj_id, deleted)
+        return deleted
+
+    async def _create_many(
+        self,
+        session: AsyncSession,
+        dtos: Sequence[CreateDTO],
+        *,
+        chunk_size: Optional[int] = None,
+    ) -> list[ResponseDTO]:
+        repo = self._create_repo(session)
+        for dto in dtos:
+            await self.validate_create(dto)
+        created = await repo.create_many(dtos, chunk_size=chunk_size)
+        await self._emit(session, "Created", self._changed(repo, created))
+        if self._defers("create"):
+            self._defer(session, self.after_create_many, created)
+        else:
+            await self.after_create_many(created)
+        return created
+
+    async def _update_many(
+        self,
+        session: AsyncSession,
+        updates: Mapping[int, UpdateDTO],
+        *,
+        chunk_size: Optional[int] = None,
+    ) -> list[ResponseDTO]:
+        repo = self._create_repo(session)
+        for obj_id, dto in updates.items():
+            await self.validate_update(obj_id, dto)
+        updated = await repo.update_many(updates, chunk_size=chunk_size)
+        await self._invalidate(session, *updates)
+        await self._emit(session, "Updated", self._changed(repo, updated))
+        if self._defers("update"):
+            self._defer(session, self.after_update_many, updated)
+        else:
+            await self.after_update_many(updated)
+        return updated
+
+    async def _delete_many(
+        self,
+        session: AsyncSession,
+        obj_ids: Sequence[int],
+        *,
+        chunk_size: Optional[int] = None,
+    ) -> list[int]:
+        repo = self._create_repo(session)
+        deleted = await repo.delete_many(obj_ids, chunk_size=chunk_size)
+        await self._invalidate(session, *deleted)
+        await self._emit(session, "Deleted", self._removed(repo, deleted))
+        if self._defers("delete"):
+            self._defer(session, self.after_delete_many, deleted)
+        else:
+            await self.after_delete_many(deleted)
         return deleted
 
     # ---- public API (one transaction per call) ----
@@ -109,14 +376,126 @@ class BaseService(ABC, Generic[CreateDTO, ResponseDTO, UpdateDTO]):
     async def get_by_id(
         self, obj_id: int, *, spec: Any = None
     ) -> Optional[ResponseDTO]:
+        if self._cache is not None and spec is None and self._may_share_reads():
+            return await self._cache.get_or_load(
+                obj_id, lambda: self._load_for_cache(obj_id)
+            )
+        return await self._read(
+            "get_by_id",
+            lambda: (obj_id, spec_cache_key(spec)),
+            lambda repo: repo.get_by_id(obj_id, spec=spec),
+        )
+
+    async def get_by_ids(self, obj_ids: Sequence[int]) -> list[Optional[ResponseDTO]]:
+        """One row per id, in input order (``None`` where missing), in one query."""
+        ids = list(obj_ids)
+        return await self._read(
+            "get_by_ids", tuple(ids), lambda repo: repo.get_by_ids(ids)
+        )
+
+    async def load_by_id(self, obj_id: int) -> Optional[ResponseDTO]:
+        """``get_by_id`` for resolvers: concurrent calls share one query.
+
+        Calls made in the same event-loop tick — ``asyncio.gather`` in a
+        composite endpoint or a resolver — become one ``get_by_ids``.  They
+        batch only with calls that read the same data: same request unit of
+        work, same read-your-writes state; otherwise, and with an entity
+        cache, this is ``get_by_id``.  Batching waits one tick and reads
+        through ``repo.get_by_ids``, so it is opt-in: plain lookups should
+        call ``get_by_id``.
+        """
+        loader = self._id_loader() if self._cache is None else None
+        if loader is None:
+            return await self.get_by_id(obj_id)
+        return await loader.load(obj_id)
+
+    def _id_loader(self) -> Optional[DataLoader[int, Optional[ResponseDTO]]]:
+        """This caller's batch, or ``None`` if the read must run here.
+
+        ``None`` when the unit of work has uncommitted writes or this task
+        holds its connection: the read must run on that connection.
+        """
+        uow = current_unit_of_work()
+        if uow is not None and not uow.allows_coalescing():
+            return None
+        key = (uow, last_write_marker())
+        loader = self._id_loaders.get(key)
+        if loader is None:
+            loader = self._id_loaders[key] = DataLoader(self.get_by_ids)
+        return loader
+
+    async def get_version(self, obj_id: int) -> Optional[Any]:
+        """The row's version column (``updated_at``), or None if it is missing."""
+        return await self._read(
+            "get_version", obj_id, lambda repo: repo.get_version(obj_id)
+        )
+
+    async def _load_for_cache(self, obj_id: int) -> Optional[ResponseDTO]:
+        # Cache fills read the primary so a lagging replica cannot seed the
+        # cache with a row that predates the last invalidation.
         async with self._session_factory() as session:
             repo = self._create_repo(session)
-            return await repo.get_by_id(obj_id, spec=spec)
+            return await repo.get_by_id(obj_id)
 
-    async def get_list(self, *, spec: Any = None) -> list[ResponseDTO]:
-        async with self._session_factory() as session:
+    async def get_list(
+        self, *, spec: Any = None, params: Optional[Mapping[str, Any]] = None
+    ) -> list[ResponseDTO]:
+        return await self._read(
+            "get_list",
+            lambda: (spec_cache_key(spec), tuple(sorted((params or {}).items()))),
+            lambda repo: repo.get_list(spec=spec, params=params),
+        )
+
+    async def get_page_with_total(
+        self,
+        *,
+        spec: Any = None,
+        params: Optional[Mapping[str, Any]] = None,
+        approximate: bool = False,
+    ) -> tuple[list[ResponseDTO], int]:
+        """Items and total count from one query (see the repository method)."""
+        return await self._read(
+            "get_page_with_total",
+            lambda: (
+                spec_cache_key(spec),
+                tuple(sorted((params or {}).items())),
+                approximate,
+            ),
+            lambda repo: repo.get_page_with_total(
+                spec=spec, params=params, approximate=approximate
+            ),
+        )
+
+    async def stream_list(
+        self,
+        *,
+        spec: Any = None,
+        params: Optional[Mapping[str, Any]] = None,
+        chunk_size: Optional[int] = None,
+        include_deleted: bool = False,
+    ) -> AsyncIterator[ResponseDTO]:
+        """Stream ``get_list`` results without materializing them.
+
+        The read session stays open while iterating; close the iterator
+        (``contextlib.aclosing``) if you stop early.
+        """
+        async with self._read_session() as session:
             repo = self._create_repo(session)
-            return await repo.get_list(spec=spec)
+            if include_deleted:
+                repo = repo.including_deleted()
+            async for dto in repo.stream(
+                spec=spec, params=params, chunk_size=chunk_size
+            ):
+                yield dto
+
+    async def get_page(
+        self, paginate: Any, *, spec: Any = None
+    ) -> CursorPage[ResponseDTO]:
+        return await self._read(
+            "get_page",
+            lambda: (spec_cache_key(paginate), spec_cache_key(spec)),
+            lambda repo: repo.get_page(paginate, spec=spec),
+        )
 
     async def update_by_id(
         self,
@@ -135,6 +514,41 @@ class BaseService(ABC, Generic[CreateDTO, ResponseDTO, UpdateDTO]):
             return deleted
 
     async def count(self, *, spec: Any = None) -> int:
+        return await self._read(
+            "count",
+            lambda: spec_cache_key(spec),
+            lambda repo: repo.count(spec=spec),
+        )
+
+    # ---- bulk public API (one transaction per call) ----
+
+    async def create_many(
+        self, dtos: Sequence[CreateDTO], *, chunk_size: Optional[int] = None
+    ) -> list[ResponseDTO]:
         async with self._session_factory() as session:
-            repo = self._create_repo(session)
-            return await repo.count(spec=spec)
+            created = await self._create_many(session, dtos, chunk_size=chunk_size)
+            await session.commit()
+            return created
+
+    async def update_many(
+        self,
+        updates: Mapping[int, UpdateDTO],
+        *,
+        chunk_size: Optional[int] = None,
+    ) -> list[ResponseDTO]:
+        async with self._session_factory() as session:
+            updated = await self._update_many(
+                session, updates, chunk_size=chunk_size
+            )
+            await session.commit()
+            return updated
+
+    async def delete_many(
+        self, obj_ids: Sequence[int], *, chunk_size: Optional[int] = None
+    ) -> list[int]:
+        async with self._session_factory() as session:
+            deleted = await self._delete_many(
+                session, obj_ids, chunk_size=chunk_size
+            )
+            await session.commit()
+            return deleted
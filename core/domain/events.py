@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class DomainEvent:
+    """Something that happened to one aggregate, e.g. ``UserCreated`` for user 7.
+
+    ``payload`` must be JSON-serializable; it is stored in the outbox and
+    published as is.
+    """
+
+    topic: str
+    event_type: str
+    aggregate_id: str
+    payload: dict[str, Any] = field(default_factory=dict)
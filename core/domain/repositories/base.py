@@ -1,7 +1,19 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Generic, Optional, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Generic,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from core.application.dtos.base import CursorPage
 
 CreateEntityT = TypeVar("CreateEntityT")
 ReadEntityT = TypeVar("ReadEntityT")
@@ -20,6 +32,12 @@ class NotFoundError(RepositoryError):
     pass
 
 
+class ConflictError(RepositoryError):
+    """Raised when a write collides with an existing row (a unique constraint)."""
+
+    pass
+
+
 class AbstractRepository(ABC, Generic[CreateEntityT, ReadEntityT, UpdateEntityT]):
     """Repository port — domain layer defines the contract, infrastructure implements.
 
@@ -41,7 +59,49 @@ class AbstractRepository(ABC, Generic[CreateEntityT, ReadEntityT, UpdateEntityT]
     ) -> Optional[ReadEntityT]: ...
 
     @abstractmethod
-    async def get_list(self, *, spec: Any = None) -> list[ReadEntityT]: ...
+    async def get_by_ids(
+        self,
+        obj_ids: Sequence[int],
+        *,
+        spec: Any = None,
+        chunk_size: Optional[int] = None,
+    ) -> list[Optional[ReadEntityT]]: ...
+
+    @abstractmethod
+    async def get_by_field(
+        self, field: Any, value: Any, *, spec: Any = None
+    ) -> Optional[ReadEntityT]: ...
+
+    @abstractmethod
+    async def get_version(self, obj_id: int) -> Optional[Any]: ...
+
+    @abstractmethod
+    async def get_list(
+        self, *, spec: Any = None, params: Optional[Mapping[str, Any]] = None
+    ) -> list[ReadEntityT]: ...
+
+    @abstractmethod
+    def stream(
+        self,
+        *,
+        spec: Any = None,
+        params: Optional[Mapping[str, Any]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[ReadEntityT]: ...
+
+    @abstractmethod
+    async def get_page_with_total(
+        self,
+        *,
+        spec: Any = None,
+        params: Optional[Mapping[str, Any]] = None,
+        approximate: bool = False,
+    ) -> tuple[list[ReadEntityT], int]: ...
+
+    @abstractmethod
+    async def get_page(
+        self, paginate: Any, *, spec: Any = None
+    ) -> CursorPage[ReadEntityT]: ...
 
     @abstractmethod
     async def update_by_id(
@@ -53,3 +113,34 @@ class AbstractRepository(ABC, Generic[CreateEntityT, ReadEntityT, UpdateEntityT]
 
     @abstractmethod
     async def count(self, *, spec: Any = None) -> int: ...
+
+    @property
+    def pk_column(self) -> str:
+        """Name of the primary key field on read entities."""
+        return "id"
+
+    def including_deleted(
+        self,
+    ) -> AbstractRepository[CreateEntityT, ReadEntityT, UpdateEntityT]:
+        """A view that also reads soft-deleted rows (``self`` if none exist)."""
+        return self
+
+    # ---- bulk ----
+
+    @abstractmethod
+    async def create_many(
+        self, dtos: Sequence[CreateEntityT], *, chunk_size: Optional[int] = None
+    ) -> list[ReadEntityT]: ...
+
+    @abstractmethod
+    async def update_many(
+        self,
+        updates: Mapping[int, UpdateEntityT],
+        *,
+        chunk_size: Optional[int] = None,
+    ) -> list[ReadEntityT]: ...
+
+    @abstractmethod
+    async def delete_many(
+        self, obj_ids: Sequence[int], *, chunk_size: Optional[int] = None
+    ) -> list[int]: ...
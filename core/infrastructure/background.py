@@ -0,0 +1,247 @@
+"""In-process worker pool for lifecycle hooks deferred past the commit.
+
+Mark a ``BaseService`` hook with :func:`deferred` and it no longer runs
+inside the transaction: once the transaction commits, its arguments are
+queued on a :class:`HookRunner` and a background worker calls it, outside
+the request path.
+
+Usage::
+
+    class UserService(BaseService[...]):
+        @deferred
+        async def after_create_many(self, created: list[UserResponseDto]) -> None:
+            await search_index.add(created)
+
+Workers batch queued items per hook (up to ``batch_size`` items, waiting at
+most ``batch_window_ms`` for more), retry a failing batch with exponential
+backoff, and drop it after ``max_attempts`` — so deferred hooks must be
+idempotent.  The queue is bounded: when it is full, ``submit`` waits for
+space (backpressure on the committing caller) and counts the wait.
+
+Delivery is at-most-once across restarts: queued items live in memory and
+are lost if the process dies.  Side effects that must survive a crash
+belong in the transactional outbox instead.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional, Sequence, TypeVar
+
+from core.infrastructure.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+BatchHook = Callable[[list[Any]], Awaitable[None]]
+
+BATCH_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 1_000)
+
+queue_depth = registry.gauge(
+    "deferred_hook_queue_depth", "Jobs waiting for a deferred-hook worker"
+)
+queue_full = registry.counter(
+    "deferred_hook_queue_full_total", "Submits that had to wait for queue space"
+)
+backpressure_seconds = registry.histogram(
+    "deferred_hook_backpressure_seconds", "Time submit waited for queue space"
+)
+queue_wait_seconds = registry.histogram(
+    "deferred_hook_queue_wait_seconds", "Time from submit until a worker started the job"
+)
+hook_items = registry.counter(
+    "deferred_hook_items_total",
+    "Items handed to deferred hooks by outcome",
+    ("hook", "outcome"),
+)
+hook_seconds = registry.histogram(
+    "deferred_hook_seconds", "Deferred hook call duration (successful calls)", ("hook",)
+)
+hook_batch_size = registry.histogram(
+    "deferred_hook_batch_size", "Items per deferred hook call", ("hook",), buckets=BATCH_BUCKETS
+)
+
+
+def deferred(fn: F) -> F:
+    """Run this ``after_*`` hook after commit, on the service's ``HookRunner``."""
+    fn.__deferred__ = True  # type: ignore[attr-defined]
+    return fn
+
+
+def is_deferred(fn: Any) -> bool:
+    return getattr(fn, "__deferred__", False)
+
+
+def hook_name(hook: Any) -> str:
+    owner = getattr(hook, "__self__", None)
+    name = getattr(hook, "__name__", type(hook).__name__)
+    return f"{type(owner).__name__}.{name}" if owner is not None else name
+
+
+def _batch_key(hook: BatchHook) -> Any:
+    """Jobs whose hooks share this key are delivered in one call.
+
+    Services are built per request (a ``Factory`` provider), so the same
+    hook arrives bound to a different instance each time: bound methods
+    are keyed by class and function, and the batch goes to the first
+    job's instance.
+    """
+    owner = getattr(hook, "__self__", None)
+    func = getattr(hook, "__func__", None)
+    return (type(owner), func) if owner is not None and func is not None else hook
+
+
+@dataclass
+class _Job:
+    hook: BatchHook
+    items: list[Any]
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class HookRunner:
+    """Bounded queue plus ``workers`` tasks calling batched hooks.
+
+    Workers start on the first ``submit`` (or ``start()``) in the running
+    event loop; ``stop()`` drains the queue and cancels them — call it on
+    shutdown (the app lifespan does).
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 4,
+        queue_size: int = 1000,
+        batch_size: int = 100,
+        batch_window_ms: float = 10.0,
+        max_attempts: int = 5,
+        retry_backoff_ms: float = 100.0,
+    ) -> None:
+        self.workers = max(workers, 1)
+        self.queue_size = max(queue_size, 1)
+        self.batch_size = max(batch_size, 1)
+        self.batch_window = max(batch_window_ms, 0.0) / 1000
+        self.max_attempts = max(max_attempts, 1)
+        self.retry_backoff = max(retry_backoff_ms, 0.0) / 1000
+        self._queue: Optional[asyncio.Queue[_Job]] = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks) and self._loop is asyncio.get_running_loop()
+
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[_Job] = asyncio.Queue(maxsize=self.queue_size)
+        self._queue = queue
+        self._tasks = [
+            asyncio.create_task(self._work(queue), name=f"hook-worker-{i}")
+            for i in range(self.workers)
+        ]
+        queue_depth.set_function(queue.qsize)
+
+    async def submit(self, hook: BatchHook, items: Sequence[Any]) -> None:
+        """Queue ``items`` for ``hook``; waits while the queue is full."""
+        if not items:
+            return
+        self.start()
+        assert self._queue is not None
+        job = _Job(hook, list(items))
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            queue_full.inc()
+            started = time.perf_counter()
+            await self._queue.put(job)
+            backpressure_seconds.observe(time.perf_counter() - started)
+
+    async def join(self) -> None:
+        """Wait until every queued job has been handled."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Drain the queue for up to ``timeout`` seconds, then stop the workers."""
+        if not self.running:
+            self._tasks = []
+            return
+        try:
+            await asyncio.wait_for(self.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("stopping with %d deferred hook jobs still queued", self.pending())
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # ---- workers ----
+
+    async def _work(self, queue: asyncio.Queue[_Job]) -> None:
+        while True:
+            jobs = [await queue.get()]
+            try:
+                await self._collect(queue, jobs)
+                now = time.perf_counter()
+                for job in jobs:
+                    queue_wait_seconds.observe(now - job.enqueued_at)
+                await self._dispatch(jobs)
+            finally:
+                for _ in jobs:
+                    queue.task_done()
+
+    async def _collect(self, queue: asyncio.Queue[_Job], jobs: list[_Job]) -> None:
+        """Add queued jobs to ``jobs`` until the batch or the window is full."""
+        items = len(jobs[0].items)
+        deadline = time.perf_counter() + self.batch_window
+        while items < self.batch_size:
+            try:
+                job = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return
+                try:
+                    job = await asyncio.wait_for(queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    return
+            jobs.append(job)
+            items += len(job.items)
+
+    async def _dispatch(self, jobs: list[_Job]) -> None:
+        batches: dict[Any, tuple[BatchHook, list[Any]]] = {}
+        for job in jobs:
+            _, items = batches.setdefault(_batch_key(job.hook), (job.hook, []))
+            items.extend(job.items)
+        for hook, items in batches.values():
+            await self._call(hook, items)
+
+    async def _call(self, hook: BatchHook, items: list[Any]) -> None:
+        name = hook_name(hook)
+        hook_batch_size.observe(len(items), hook=name)
+        for attempt in range(1, self.max_attempts + 1):
+            started = time.perf_counter()
+            try:
+                await hook(items)
+            except Exception:
+                if attempt == self.max_attempts:
+                    hook_items.inc(len(items), hook=name, outcome="failed")
+                    logger.exception(
+                        "deferred hook %s failed %d times; dropping %d items",
+                        name,
+                        attempt,
+                        len(items),
+                    )
+                    return
+                hook_items.inc(len(items), hook=name, outcome="retried")
+                await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+            else:
+                hook_seconds.observe(time.perf_counter() - started, hook=name)
+                hook_items.inc(len(items), hook=name, outcome="succeeded")
+                return
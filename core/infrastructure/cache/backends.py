@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class CacheBackend(ABC):
+    """Byte-oriented key/value store used by ``EntityCache``."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None: ...
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Per-process LRU with per-entry TTL.
+
+    Invalidations only reach the process that performed the write, so with
+    several workers keep ``ttl`` short or use ``RedisCacheBackend``.
+    """
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Backend for any client speaking the redis-py asyncio API.
+
+    Only ``get``, ``set(..., px=)`` and ``delete`` are used, so tests can
+    pass a small fake instead of a real client.
+    """
+
+    def __init__(self, client: Any, *, key_prefix: str = "") -> None:
+        self._client = client
+        self._prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url: str, *, key_prefix: str = "") -> "RedisCacheBackend":
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:  # optional dependency
+            raise RuntimeError(
+                "cache.backend=redis requires the 'redis' package"
+            ) from e
+        return cls(redis.from_url(url), key_prefix=key_prefix)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(self._prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._client.set(self._prefix + key, value, px=max(int(ttl * 1000), 1))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self._client.delete(*(self._prefix + k for k in keys))
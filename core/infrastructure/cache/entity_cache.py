@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from core.infrastructure.cache.backends import CacheBackend
+from core.infrastructure.concurrency import SingleFlight
+from core.infrastructure.metrics import registry
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+cache_requests = registry.counter(
+    "entity_cache_requests_total",
+    "Entity cache lookups by result (hit, miss, coalesced)",
+    ("namespace", "result"),
+)
+cache_invalidations = registry.counter(
+    "entity_cache_invalidations_total", "Entity cache invalidations", ("namespace",)
+)
+
+
+class EntityCache(Generic[SchemaT]):
+    """Read-through cache of serialized read DTOs keyed by primary key.
+
+    Misses for the same id are loaded once (single-flight) and shared by
+    every concurrent caller.  A load that races with an invalidation of the
+    same id is returned but not stored, so it cannot re-seed the cache with
+    the pre-write row.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        schema: type[SchemaT],
+        *,
+        namespace: str,
+        ttl: float = 60.0,
+    ) -> None:
+        self.backend = backend
+        self.schema = schema
+        self.namespace = namespace
+        self.ttl = ttl
+        self._flight: SingleFlight[Optional[SchemaT]] = SingleFlight()
+        # ids with a load in flight -> invalidated while loading?
+        self._loading: dict[Hashable, bool] = {}
+
+    def key(self, obj_id: Hashable) -> str:
+        return f"{self.namespace}:{obj_id}"
+
+    def _count(self, result: str) -> None:
+        cache_requests.inc(namespace=self.namespace, result=result)
+
+    async def get_or_load(
+        self, obj_id: Hashable, loader: Callable[[], Awaitable[Optional[SchemaT]]]
+    ) -> Optional[SchemaT]:
+        key = self.key(obj_id)
+        raw = await self.backend.get(key)
+        if raw is not None:
+            self._count("hit")
+            return self.schema.model_validate_json(raw)
+
+        async def load() -> Optional[SchemaT]:
+            self._loading[obj_id] = False
+            try:
+                obj = await loader()
+            finally:
+                invalidated = self._loading.pop(obj_id)
+            if obj is not None and not invalidated:
+                await self.backend.set(key, obj.model_dump_json().encode(), self.ttl)
+            return obj
+
+        obj, shared = await self._flight.do(key, load)
+        self._count("coalesced" if shared else "miss")
+        return obj
+
+    async def invalidate(self, *obj_ids: Hashable) -> None:
+        for obj_id in obj_ids:
+            if obj_id in self._loading:
+                self._loading[obj_id] = True
+        await self.backend.delete(*(self.key(i) for i in obj_ids))
+        cache_invalidations.inc(len(obj_ids), namespace=self.namespace)
+
+
+def build_entity_cache(
+    backend: Optional[CacheBackend],
+    schema: type[SchemaT],
+    *,
+    namespace: str,
+    ttl: float,
+) -> Optional[EntityCache[SchemaT]]:
+    """DI helper: no backend configured means no cache."""
+    if backend is None:
+        return None
+    return EntityCache(backend, schema, namespace=namespace, ttl=ttl)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, Hashable, Sequence, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[V]):
+    """Collapse concurrent calls with the same key into one execution.
+
+    The first caller for a key starts ``fn`` as a task; callers arriving
+    while it runs await the same task instead of starting their own.
+    Cancelling one caller does not cancel the shared work.
+
+    Usage::
+
+        flight = SingleFlight()
+        user, shared = await flight.do(("user", 1), lambda: load_user(1))
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future[V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(
+        self, key: Hashable, fn: Callable[[], Awaitable[V]]
+    ) -> tuple[V, bool]:
+        """Return ``(result, shared)``; ``shared`` is True for followers."""
+        task = self._inflight.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: Hashable, task: asyncio.Future[V]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every caller went away
+
+
+class DataLoader(Generic[K, V]):
+    """Batch ``load(key)`` calls made in the same event-loop tick.
+
+    The first ``load`` of a tick schedules a dispatch with ``call_soon``;
+    every ``load`` issued before it runs — typically the coroutines of one
+    ``asyncio.gather`` — joins the batch, and ``batch_fn`` is called once
+    with the distinct keys (split into ``max_batch_size`` pieces).
+    ``batch_fn`` must return one value per key, in key order.  A failing
+    batch fails every ``load`` in it.
+
+    Nothing is cached after a batch completes, so a loader never serves a
+    stale value and may live as long as its owner.
+
+    Usage::
+
+        loader = DataLoader(repo.get_by_ids)
+        a, b = await asyncio.gather(loader.load(1), loader.load(2))  # one query
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[K]], Awaitable[Sequence[V]]],
+        *,
+        max_batch_size: int = 1000,
+    ) -> None:
+        self._batch_fn = batch_fn
+        self.max_batch_size = max(max_batch_size, 1)
+        self._pending: dict[K, asyncio.Future[V]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> V:
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = loop.create_future()
+            future.add_done_callback(_retrieve)
+            self._pending[key] = future
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Sequence[K]) -> list[V]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        keys = list(pending)
+        size = self.max_batch_size
+        for start in range(0, len(keys), size):
+            batch = {key: pending[key] for key in keys[start : start + size]}
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[K, asyncio.Future[V]]) -> None:
+        try:
+            values = list(await self._batch_fn(list(batch)))
+            if len(values) != len(batch):
+                raise ValueError(
+                    f"batch function returned {len(values)} values"
+                    f" for {len(batch)} keys"
+                )
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for future, value in zip(batch.values(), values):
+                if not future.done():
+                    future.set_result(value)
+        finally:
+            for future in batch.values():
+                if not future.done():
+                    future.cancel()
+
+
+def _retrieve(future: asyncio.Future[Any]) -> None:
+    if not future.cancelled():
+        future.exception()  # mark retrieved even if every caller went away
@@ -1,14 +1,45 @@
 # -*- coding: utf-8 -*-
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from __future__ import annotations
+
+from typing import Callable, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.engine import URL
+from sqlalchemy.engine import URL, make_url
+
+from core.infrastructure.database.engine import EngineOptions, build_engine
+from core.infrastructure.database.replicas import ReplicaRouter
 
 
 class Base(DeclarativeBase):
     pass
 
 
+def _parse_hosts(hosts: Sequence[str] | str | None, default_port: int) -> list[tuple[str, int]]:
+    """``"a:5433,b"`` → ``[("a", 5433), ("b", default_port)]``."""
+    if not hosts:
+        return []
+    if isinstance(hosts, str):
+        hosts = hosts.split(",")
+    parsed = []
+    for entry in (h.strip() for h in hosts):
+        if not entry:
+            continue
+        host, _, port = entry.partition(":")
+        parsed.append((host, int(port) if port else int(default_port)))
+    return parsed
+
+
 class Database:
+    """Primary engine plus optional read replicas.
+
+    ``session_maker`` always targets the primary.  ``read_session_maker``
+    targets a replica chosen by ``replica_balancing`` (or the primary when
+    no replicas are configured); ``ManagedSession(read_only=True)`` uses it
+    unless the current request committed within ``read_your_writes_window``
+    seconds.
+    """
+
     def __init__(
         self,
         database_user: str,
@@ -16,20 +47,111 @@ class Database:
         database_host: str,
         database_port: int,
         database_name: str,
+        driver: str = "psycopg",
+        echo: bool = False,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        null_pool: bool = False,
+        statement_cache_size: int = 100,
+        query_cache_size: int = 500,
+        slow_query_ms: float = 200.0,
+        replica_hosts: Sequence[str] | str | None = None,
+        replica_balancing: str = "round_robin",
+        read_your_writes_window: float = 5.0,
     ) -> None:
+        options = EngineOptions(
+            driver=driver,
+            echo=echo,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            null_pool=null_pool,
+            statement_cache_size=statement_cache_size,
+            query_cache_size=query_cache_size,
+            slow_query_ms=slow_query_ms,
+        )
+
         dsn = URL.create(
-            drivername="postgresql+psycopg",
+            drivername=options.drivername,
             username=database_user,
             password=database_password,
             host=database_host,
             port=database_port,
             database=database_name,
         )
+        replica_dsns = [
+            dsn.set(host=host, port=port)
+            for host, port in _parse_hosts(replica_hosts, database_port)
+        ]
+
+        self._setup(
+            dsn,
+            replica_dsns,
+            options=options,
+            replica_balancing=replica_balancing,
+            read_your_writes_window=read_your_writes_window,
+        )
+
+    @classmethod
+    def from_url(
+        cls,
+        url: URL | str,
+        *,
+        replica_urls: Sequence[URL | str] = (),
+        options: Optional[EngineOptions] = None,
+        replica_balancing: str = "round_robin",
+        read_your_writes_window: float = 5.0,
+    ) -> "Database":
+        """Build from complete URLs, e.g. ``sqlite+aiosqlite:///local.db``."""
+        db = cls.__new__(cls)
+        db._setup(
+            make_url(url),
+            [make_url(u) for u in replica_urls],
+            options=options or EngineOptions(),
+            replica_balancing=replica_balancing,
+            read_your_writes_window=read_your_writes_window,
+        )
+        return db
+
+    def _setup(
+        self,
+        dsn: URL,
+        replica_dsns: Sequence[URL],
+        *,
+        options: EngineOptions,
+        replica_balancing: str,
+        read_your_writes_window: float,
+    ) -> None:
+        self.options = options
+        self.read_your_writes_window = read_your_writes_window
+
+        self.engine = build_engine(dsn, options, name="primary")
+
+        session_kwargs = {"expire_on_commit": False, "autoflush": False}
+        self.session_maker = async_sessionmaker(bind=self.engine, **session_kwargs)
+
+        self.replica_engines = [
+            build_engine(replica, options, name=f"replica-{i}")
+            for i, replica in enumerate(replica_dsns)
+        ]
+        self.replica_router: Optional[ReplicaRouter] = (
+            ReplicaRouter(
+                self.replica_engines, strategy=replica_balancing, **session_kwargs
+            )
+            if self.replica_engines
+            else None
+        )
 
-        self.engine = create_async_engine(url=dsn, echo=True)
+    @property
+    def read_session_maker(self) -> Callable[[], AsyncSession]:
+        return self.replica_router or self.session_maker
 
-        self.session_maker = async_sessionmaker(
-            bind=self.engine,
-            expire_on_commit=False,
-            autoflush=False,
-        )
\ No newline at end of file
+    async def dispose(self) -> None:
+        """Close every pooled connection (primary and replicas); call on shutdown."""
+        for engine in (self.engine, *self.replica_engines):
+            await engine.dispose()
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import os
+import weakref
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import URL, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from core.infrastructure.database.instrumentation import instrument_engine
+from core.infrastructure.database.pool import (
+    InstrumentedNullPool,
+    InstrumentedQueuePool,
+    register_pool_metrics,
+)
+
+DRIVERS = {
+    "psycopg": "postgresql+psycopg",
+    "asyncpg": "postgresql+asyncpg",
+}
+
+
+@dataclass(frozen=True)
+class EngineOptions:
+    """Engine and pool tuning, one instance per process (i.e. per worker).
+
+    ``statement_cache_size`` sizes the driver's server-side prepared
+    statement cache; ``0`` disables server-side preparation, which is
+    required behind pgbouncer in transaction mode (usually together with
+    ``null_pool``).  ``query_cache_size`` sizes SQLAlchemy's compiled SQL
+    cache.  Statements slower than ``slow_query_ms`` are logged to
+    ``core.db.slow_query`` (negative disables the log).
+    """
+
+    driver: str = "psycopg"
+    echo: bool = False
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = -1
+    pool_pre_ping: bool = False
+    null_pool: bool = False
+    statement_cache_size: int = 100
+    query_cache_size: int = 500
+    slow_query_ms: float = 200.0
+
+    def __post_init__(self) -> None:
+        if self.driver not in DRIVERS:
+            raise ValueError(
+                f"unsupported database driver {self.driver!r}; "
+                f"expected one of {sorted(DRIVERS)}"
+            )
+
+    @property
+    def drivername(self) -> str:
+        return DRIVERS[self.driver]
+
+    @property
+    def slow_query_threshold(self) -> Optional[float]:
+        """Seconds, or None when the slow-query log is disabled."""
+        return self.slow_query_ms / 1000 if self.slow_query_ms >= 0 else None
+
+    def connect_args(self) -> dict[str, Any]:
+        if self.driver == "asyncpg":
+            return {
+                "statement_cache_size": self.statement_cache_size,
+                "prepared_statement_cache_size": self.statement_cache_size,
+            }
+        # psycopg prepares a statement after ``prepare_threshold`` executions.
+        return {"prepare_threshold": 5 if self.statement_cache_size > 0 else None}
+
+    def engine_kwargs(self) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {
+            "echo": self.echo,
+            "query_cache_size": self.query_cache_size,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
+        if self.null_pool:
+            kwargs["poolclass"] = InstrumentedNullPool
+        else:
+            kwargs.update(
+                poolclass=InstrumentedQueuePool,
+                pool_size=self.pool_size,
+                max_overflow=self.max_overflow,
+                pool_timeout=self.pool_timeout,
+                pool_recycle=self.pool_recycle,
+            )
+        return kwargs
+
+
+def build_engine(url: URL | str, options: EngineOptions, *, name: str) -> AsyncEngine:
+    """Create an instrumented async engine; ``name`` labels its pool metrics."""
+    is_postgres = str(url).startswith("postgresql")
+    engine = create_async_engine(
+        url,
+        connect_args=options.connect_args() if is_postgres else {},
+        **options.engine_kwargs(),
+    )
+
+    if is_postgres and options.driver == "psycopg" and options.statement_cache_size > 0:
+        @event.listens_for(engine.sync_engine, "connect")
+        def _size_prepared_cache(dbapi_connection: Any, _record: Any) -> None:
+            dbapi_connection.driver_connection.prepared_max = (
+                options.statement_cache_size
+            )
+
+    register_pool_metrics(engine.pool, name)
+    instrument_engine(engine, slow_query_threshold=options.slow_query_threshold)
+    _reset_pool_after_fork(engine, name)
+    return engine
+
+
+def _reset_pool_after_fork(engine: AsyncEngine, name: str) -> None:
+    """Give ``engine`` a fresh pool in every process forked from this one."""
+    _forkable[engine.sync_engine] = name
+
+
+# Engines built in this process, and the pool label each one publishes under.
+# Weak, so disposed engines drop out instead of being kept alive by the hook.
+_forkable: weakref.WeakKeyDictionary[Engine, str] = weakref.WeakKeyDictionary()
+
+
+def _reset_pools_in_child() -> None:
+    """Give a forked worker its own, empty pools.
+
+    Connections inherited from the parent (a preloading server that touched
+    the database before forking) are shared sockets: the child drops them
+    without closing — ``dispose(close=False)`` — so the parent's stay
+    intact, and opens its own on first checkout.
+    """
+    for sync_engine, name in list(_forkable.items()):
+        sync_engine.dispose(close=False)
+        register_pool_metrics(sync_engine.pool, name)
+
+
+# fork hooks can't be unregistered: install one for the module, not per engine
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_in_child)
@@ -0,0 +1,226 @@
+"""Per-statement and per-repository-call instrumentation.
+
+Three layers feed each other through context variables (plus the N+1
+audit in ``query_audit``, which hooks into the first two):
+
+* repository methods are wrapped (see ``instrument_repository``) so every
+  statement knows which operation issued it, e.g.
+  ``UserRepository.get_users`` or ``SQLAlchemyRepository.get_list[users]``;
+* engine events time each statement, feed ``db_query_duration_seconds``
+  and write statements slower than the threshold to the
+  ``core.db.slow_query`` logger;
+* ``QueryTimingMiddleware`` collects a per-request summary and sends it as
+  a ``Server-Timing`` header.
+
+Pool wait comes from the checkout timing in ``pool.py``.
+"""
+from __future__ import annotations
+
+import functools
+import inspect
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.infrastructure.database.query_audit import auditor, record_statement
+from core.infrastructure.metrics import registry
+
+slow_query_log = logging.getLogger("core.db.slow_query")
+
+ROW_BUCKETS = (0, 1, 10, 100, 1_000, 10_000, 100_000)
+
+query_duration = registry.histogram(
+    "db_query_duration_seconds",
+    "Statement execution time by originating repository operation",
+    ("operation",),
+)
+slow_queries = registry.counter(
+    "db_slow_queries_total",
+    "Statements slower than the slow-query threshold",
+    ("operation",),
+)
+operation_duration = registry.histogram(
+    "db_operation_duration_seconds",
+    "Repository call time, including row mapping",
+    ("operation",),
+)
+operation_rows = registry.histogram(
+    "db_operation_rows",
+    "Rows returned per repository call",
+    ("operation",),
+    buckets=ROW_BUCKETS,
+)
+
+_START = "instrumentation.started_at"
+
+_operation: ContextVar[Optional[str]] = ContextVar("db_operation", default=None)
+_stats: ContextVar[Optional["QueryStats"]] = ContextVar("db_query_stats", default=None)
+
+
+@dataclass
+class QueryStats:
+    """Running totals for one request."""
+
+    queries: int = 0
+    seconds: float = 0.0
+    pool_wait: float = 0.0
+
+    def server_timing(self) -> str:
+        return (
+            f'db;dur={self.seconds * 1e3:.1f};desc="{self.queries} queries", '
+            f"db-pool;dur={self.pool_wait * 1e3:.1f}"
+        )
+
+
+def current_operation() -> Optional[str]:
+    return _operation.get()
+
+
+def note_pool_wait(seconds: float) -> None:
+    """Called by the instrumented pools after each checkout."""
+    stats = _stats.get()
+    if stats is not None:
+        stats.pool_wait += seconds
+
+
+# ---- engine events ----
+
+
+def instrument_engine(
+    engine: AsyncEngine, *, slow_query_threshold: Optional[float]
+) -> None:
+    """Time every statement on ``engine``; log those above the threshold (s)."""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info[_START] = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _finish(conn, cursor, statement, parameters, context, executemany) -> None:
+        started = conn.info.pop(_START, None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        record_statement(statement, executemany)
+        operation = _operation.get() or "other"
+        query_duration.observe(elapsed, operation=operation)
+
+        stats = _stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.seconds += elapsed
+
+        if slow_query_threshold is not None and elapsed >= slow_query_threshold:
+            slow_queries.inc(operation=operation)
+            # parameters are deliberately not logged: they carry user data
+            slow_query_log.warning(
+                "slow query: %.1f ms in %s (rowcount=%s): %s",
+                elapsed * 1e3,
+                operation,
+                cursor.rowcount,
+                " ".join(statement.split())[:1000],
+            )
+
+
+# ---- repository methods ----
+
+
+def spec_label(spec: Any) -> str:
+    """Short, low-cardinality name for a spec: its ``name`` or its parts."""
+    name = getattr(spec, "name", None)
+    if name:
+        return name
+    parts = getattr(spec, "specs", None)
+    if parts is not None:
+        return "+".join(type(s).__name__ for s in parts)
+    return type(spec).__name__
+
+
+def _rows(result: Any) -> int:
+    if result is None:
+        return 0
+    if isinstance(result, list):
+        return len(result)
+    items = getattr(result, "items", None)
+    if isinstance(items, list):
+        return len(items)
+    if isinstance(result, tuple) and result and isinstance(result[0], list):
+        return len(result[0])
+    return 1
+
+
+def _instrument(name: str, fn: Callable[..., Awaitable[Any]]) -> Callable[..., Any]:
+    @functools.wraps(fn)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if _operation.get() is not None:  # nested call: keep the outer label
+            return await fn(self, *args, **kwargs)
+
+        label = f"{type(self).__name__}.{name}"
+        spec = kwargs.get("spec")
+        if spec is not None:
+            label += f"[{spec_label(spec)}]"
+        token = _operation.set(label)
+        start = time.perf_counter()
+        try:
+            with auditor.scope(label):
+                result = await fn(self, *args, **kwargs)
+        finally:
+            _operation.reset(token)
+            operation_duration.observe(time.perf_counter() - start, operation=label)
+        operation_rows.observe(_rows(result), operation=label)
+        return result
+
+    wrapper.__instrumented__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def instrument_repository(cls: type) -> type:
+    """Wrap the public coroutine methods defined on ``cls`` (idempotent)."""
+    for name, attr in list(vars(cls).items()):
+        if (
+            not name.startswith("_")
+            and inspect.iscoroutinefunction(attr)
+            and not getattr(attr, "__instrumented__", False)
+        ):
+            setattr(cls, name, _instrument(name, attr))
+    return cls
+
+
+# ---- per-request summary ----
+
+
+class QueryTimingMiddleware:
+    """Pure ASGI middleware adding ``Server-Timing: db;dur=…`` to responses.
+
+    Summarizes the statements run while handling the request (including the
+    final commit of a request-scoped unit of work when installed inside it).
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]]) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _stats.set(stats)
+
+        async def send_with_timing(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing().encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _stats.reset(token)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy import DateTime, Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.infrastructure.database.database import Base
@@ -23,9 +23,32 @@ class UserModel(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
         server_default=func.now(),
+        onupdate=func.now(),
         server_onupdate=func.now(),
     )
     deleted_at: Mapped[datetime] = mapped_column(
         DateTime,
         nullable=True,
-    )
\ No newline at end of file
+    )
+
+_live = UserModel.deleted_at.is_(None)
+
+# Active listings (``WHERE deleted_at IS NULL ORDER BY id DESC``) walk this
+# partial index instead of scanning past soft-deleted rows.
+Index(
+    "ix_user_live_id",
+    UserModel.id.desc(),
+    postgresql_where=_live,
+    sqlite_where=_live,
+)
+# One live account per email, case-insensitively; backs ``get_by_email``.
+# A soft-deleted user's address can be registered again.
+Index(
+    "ux_user_email_lower",
+    func.lower(UserModel.email),
+    unique=True,
+    postgresql_where=_live,
+    sqlite_where=_live,
+)
+# Time-range filters and sorts on signup date.
+Index("ix_user_created_at", UserModel.created_at)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool
+
+from core.infrastructure.database.instrumentation import note_pool_wait
+from core.infrastructure.metrics import registry
+
+checkout_seconds = registry.histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting for a pooled connection (includes new connects)",
+    ("pool",),
+)
+checkout_timeouts = registry.counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout",
+    ("pool",),
+)
+pool_size = registry.gauge("db_pool_size", "Configured pool size", ("pool",))
+pool_checked_out = registry.gauge(
+    "db_pool_checked_out", "Connections currently checked out", ("pool",)
+)
+pool_overflow = registry.gauge(
+    "db_pool_overflow", "Overflow connections currently open", ("pool",)
+)
+pool_saturation = registry.gauge(
+    "db_pool_saturation",
+    "Checked-out connections / (pool_size + max_overflow)",
+    ("pool",),
+)
+
+
+class _CheckoutTimingMixin:
+    """Times ``Pool.connect()`` — the whole wait for a usable connection."""
+
+    metrics_label = "primary"
+
+    def connect(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super().connect()  # type: ignore[misc]
+        except exc.TimeoutError:
+            checkout_timeouts.inc(pool=self.metrics_label)
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            checkout_seconds.observe(waited, pool=self.metrics_label)
+            note_pool_wait(waited)
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class InstrumentedNullPool(_CheckoutTimingMixin, NullPool):
+    pass
+
+
+def register_pool_metrics(pool: Pool, label: str) -> None:
+    """Label ``pool``'s checkout timings and publish its occupancy gauges."""
+    if isinstance(pool, _CheckoutTimingMixin):
+        pool.metrics_label = label
+    if not isinstance(pool, AsyncAdaptedQueuePool):
+        return
+
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    pool_size.set_function(pool.size, pool=label)
+    pool_checked_out.set_function(pool.checkedout, pool=label)
+    pool_overflow.set_function(lambda: max(pool.overflow(), 0), pool=label)
+    pool_saturation.set_function(
+        lambda: pool.checkedout() / capacity if capacity else 0.0, pool=label
+    )
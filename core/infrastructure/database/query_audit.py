@@ -0,0 +1,172 @@
+"""N+1 detection: flag identical statements repeated within one scope.
+
+A scope is one repository call (opened by the instrumentation wrapper) or
+one HTTP request (``QueryAuditMiddleware``).  Every statement executed
+inside it is counted by its SQL text — bind parameters are already
+placeholders, so ``SELECT ... WHERE id = ?`` issued in a loop shows up as
+one text seen N times.  When a text reaches ``threshold`` the scope is
+flagged: ``warn`` logs to ``core.db.n_plus_one`` and counts
+``db_n_plus_one_total``, ``raise`` additionally raises
+:class:`NPlusOneError` (for tests).  A repetition is reported once, by the
+innermost scope that saw it.
+
+Off by default; meant for development and test runs
+(``database.instrumentation.n_plus_one``).
+"""
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Iterator, Optional
+
+from core.infrastructure.metrics import registry
+
+N_PLUS_ONE_MODES = ("off", "warn", "raise")
+
+n_plus_one_log = logging.getLogger("core.db.n_plus_one")
+
+detections = registry.counter(
+    "db_n_plus_one_total",
+    "Scopes that repeated one statement at least the N+1 threshold",
+    ("scope",),
+)
+
+_audit: ContextVar[Optional["QueryAudit"]] = ContextVar("db_query_audit", default=None)
+
+
+class NPlusOneError(RuntimeError):
+    """Raised in ``raise`` mode when a scope repeats a statement."""
+
+
+class QueryAudit:
+    """Statement counts of one scope; counts also roll up into the parent."""
+
+    def __init__(self, label: str, threshold: int, parent: Optional[QueryAudit]) -> None:
+        self.label = label
+        self.threshold = threshold
+        self.parent = parent
+        self.counts: Counter[str] = Counter()
+        self.reported: set[str] = set()
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def record(self, statement: str) -> None:
+        audit: Optional[QueryAudit] = self
+        while audit is not None:
+            audit.counts[statement] += 1
+            audit = audit.parent
+
+    def repeated(self) -> dict[str, int]:
+        return {
+            stmt: n
+            for stmt, n in self.counts.items()
+            if n >= self.threshold and stmt not in self.reported
+        }
+
+
+def record_statement(statement: str, executemany: bool) -> None:
+    """Called by the engine instrumentation after each statement."""
+    audit = _audit.get()
+    # executemany is one batched round trip, not a loop
+    if audit is not None and not executemany:
+        audit.record(statement)
+
+
+class QueryAuditor:
+    """Process-wide N+1 settings plus the scope context manager."""
+
+    def __init__(self) -> None:
+        self.mode = "off"
+        self.threshold = 5
+
+    def configure(self, mode: str, threshold: int = 5) -> None:
+        if mode not in N_PLUS_ONE_MODES:
+            raise ValueError(f"n_plus_one must be one of {N_PLUS_ONE_MODES}, got {mode!r}")
+        if threshold < 2:
+            raise ValueError("n_plus_one_threshold must be at least 2")
+        self.mode = mode
+        self.threshold = threshold
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    @contextmanager
+    def scope(self, label: str) -> Iterator[Optional[QueryAudit]]:
+        """Audit the statements run inside the block (no-op when off).
+
+        Checked when the block exits normally; an exception from the block
+        takes precedence over any finding.
+        """
+        if not self.enabled:
+            yield None
+            return
+        audit = QueryAudit(label, self.threshold, _audit.get())
+        token = _audit.set(audit)
+        try:
+            yield audit
+        finally:
+            _audit.reset(token)
+        self.check(audit)
+
+    def check(self, audit: QueryAudit) -> None:
+        repeated = audit.repeated()
+        if not repeated:
+            return
+        parent = audit.parent
+        while parent is not None:
+            parent.reported.update(repeated)
+            parent = parent.parent
+        detections.inc(scope=audit.label)
+
+        lines = [
+            f"{n}x {' '.join(stmt.split())[:300]}"
+            for stmt, n in sorted(repeated.items(), key=lambda item: -item[1])
+        ]
+        message = (
+            f"possible N+1 in {audit.label}: {audit.total} statements, repeated: "
+            + "; ".join(lines)
+        )
+        n_plus_one_log.warning(message)
+        if self.mode == "raise":
+            raise NPlusOneError(message)
+
+
+auditor = QueryAuditor()
+
+
+class QueryAuditMiddleware:
+    """Pure ASGI middleware auditing each HTTP request as one scope.
+
+    The check runs just before ``http.response.start``, so in ``raise`` mode
+    the request fails with a 500 instead of returning normally.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]]) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or not auditor.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        audit = QueryAudit("request", auditor.threshold, None)
+        token = _audit.set(audit)
+
+        async def send_checked(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                # the router has matched by now; label by route template
+                route = getattr(scope.get("route"), "path", None)
+                if route is not None:
+                    audit.label = f"{scope['method']} {route}"
+                auditor.check(audit)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_checked)
+        finally:
+            _audit.reset(token)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import itertools
+import time
+from contextvars import ContextVar
+from typing import Any, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from core.infrastructure.metrics import registry
+
+BALANCING_STRATEGIES = ("round_robin", "least_connections")
+
+routed_sessions = registry.counter(
+    "db_routed_sessions_total", "Read-only sessions by routing target", ("target",)
+)
+
+# Monotonic time of the last commit made in the current context (request).
+_last_write_at: ContextVar[Optional[float]] = ContextVar(
+    "db_last_write_at", default=None
+)
+
+
+def mark_write() -> None:
+    """Record that the current context has just committed a write."""
+    _last_write_at.set(time.monotonic())
+
+
+def last_write_marker() -> Optional[float]:
+    """Opaque marker of this context's last commit (None if it never wrote)."""
+    return _last_write_at.get()
+
+
+def wrote_recently(window: float) -> bool:
+    """True while a commit made in this context is younger than ``window`` s."""
+    last = _last_write_at.get()
+    return last is not None and time.monotonic() - last < window
+
+
+class ReplicaRouter:
+    """Chooses a replica for each read-only session.
+
+    ``round_robin`` cycles through the replicas; ``least_connections``
+    picks the replica whose pool has the fewest checked-out connections,
+    rotating among ties.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        *,
+        strategy: str = "round_robin",
+        **session_kwargs: Any,
+    ) -> None:
+        if not engines:
+            raise ValueError("ReplicaRouter needs at least one replica engine")
+        if strategy not in BALANCING_STRATEGIES:
+            raise ValueError(
+                f"unknown balancing strategy {strategy!r}; "
+                f"expected one of {BALANCING_STRATEGIES}"
+            )
+        self.engines = list(engines)
+        self.strategy = strategy
+        self._makers = [
+            async_sessionmaker(bind=engine, **session_kwargs) for engine in engines
+        ]
+        self._turn = itertools.count()
+
+    def _pick(self) -> int:
+        start = next(self._turn) % len(self.engines)
+        if self.strategy == "round_robin":
+            return start
+        order = [(start + i) % len(self.engines) for i in range(len(self.engines))]
+        return min(order, key=self._in_use)
+
+    def _in_use(self, index: int) -> int:
+        checkedout = getattr(self.engines[index].pool, "checkedout", None)
+        return checkedout() if checkedout else 0
+
+    def __call__(self) -> AsyncSession:
+        index = self._pick()
+        routed_sessions.inc(target=f"replica-{index}")
+        return self._makers[index]()
@@ -1,8 +1,47 @@
 from __future__ import annotations
 
-from typing import Callable, Optional
+import logging
+from typing import Awaitable, Callable, Optional
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from core.infrastructure.database.replicas import mark_write, routed_sessions, wrote_recently
+from core.infrastructure.database.unit_of_work import UnitOfWork, current_unit_of_work
+
+logger = logging.getLogger(__name__)
+
+_COMMITTED = "managed_session.committed"
+_PENDING = "managed_session.pending_on_commit"
+_READY = "managed_session.ready_on_commit"
+
+OnCommitCallback = Callable[[], Awaitable[None]]
+
+
+@event.listens_for(Session, "after_commit")
+def _flag_commit(session: Session) -> None:
+    session.info[_COMMITTED] = True
+    pending = session.info.pop(_PENDING, None)
+    if pending:
+        session.info.setdefault(_READY, []).extend(pending)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_pending(session: Session, previous: SessionTransaction) -> None:
+    if previous.parent is None:
+        session.info.pop(_PENDING, None)
+
+
+def on_commit(session: AsyncSession | Session, callback: OnCommitCallback) -> None:
+    """Run ``callback`` once the current transaction commits.
+
+    Callbacks run when the enclosing ``ManagedSession`` exits, after the
+    session is closed — or, inside a request-scoped unit of work, after the
+    unit's final COMMIT.  They are dropped if the transaction rolls back.
+    Failures are logged, never raised to the caller.
+    """
+    session.info.setdefault(_PENDING, []).append(callback)
 
 
 class ManagedSession:
@@ -17,14 +56,51 @@ class ManagedSession:
             await repo.create(dto)
             await session.commit()          # explicit commit required
             # if an exception is raised before commit(), auto-rollback kicks in
+
+    With ``read_only=True`` the session comes from ``read_session_maker``
+    (a replica) — except within ``read_your_writes_window`` seconds of a
+    commit made earlier in the same request, so callers see their own writes.
+
+    Inside a request-scoped ``UnitOfWork`` (``database.session_scope:
+    request``) the session joins the request's shared connection and
+    transaction instead: ``commit()`` only flushes and the unit commits once
+    at the end of the request.
     """
 
-    def __init__(self, session_maker: Callable[[], AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_maker: Callable[[], AsyncSession],
+        *,
+        read_session_maker: Optional[Callable[[], AsyncSession]] = None,
+        read_only: bool = False,
+        read_your_writes_window: float = 0.0,
+    ) -> None:
         self._session_maker = session_maker
+        self._read_session_maker = read_session_maker
+        self._read_only = read_only
+        self._read_your_writes_window = read_your_writes_window
         self._session: Optional[AsyncSession] = None
+        self._uow: Optional[UnitOfWork] = None
+
+    def _select_maker(self) -> Callable[[], AsyncSession]:
+        if not self._read_only or self._read_session_maker is None:
+            return self._session_maker
+        if wrote_recently(self._read_your_writes_window):
+            routed_sessions.inc(target="primary")
+            return self._session_maker
+        return self._read_session_maker
 
     async def __aenter__(self) -> AsyncSession:
-        self._session = self._session_maker()
+        uow = current_unit_of_work()
+        if uow is not None and uow.accepts(
+            self._session_maker,
+            read_only=self._read_only,
+            has_replica=self._read_session_maker is not None,
+        ):
+            self._session = await uow.acquire(self._session_maker)
+            self._uow = uow
+            return self._session
+        self._session = self._select_maker()()
         return self._session
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
@@ -33,5 +109,23 @@ class ManagedSession:
             if exc:
                 await self._session.rollback()
         finally:
+            info = self._session.info
+            committed = info.pop(_COMMITTED, False)
+            ready = info.pop(_READY, ())
+            info.pop(_PENDING, None)
             await self._session.close()
             self._session = None
+            uow, self._uow = self._uow, None
+            if uow is not None:
+                uow.release(
+                    committed=committed, rolled_back=exc is not None, callbacks=ready
+                )
+                ready = ()
+            elif committed:
+                mark_write()
+
+        for callback in ready:
+            try:
+                await callback()
+            except Exception:
+                logger.exception("on_commit callback failed")
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from core.infrastructure.database.replicas import mark_write
+from core.infrastructure.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+SESSION_SCOPES = ("call", "request")
+
+unit_of_work_commits = registry.counter(
+    "db_unit_of_work_total", "Request-scoped units of work by outcome", ("outcome",)
+)
+
+_current: ContextVar[Optional["UnitOfWork"]] = ContextVar(
+    "db_unit_of_work", default=None
+)
+
+
+def current_unit_of_work() -> Optional["UnitOfWork"]:
+    """The unit of work of the current request, if one is open."""
+    uow = _current.get()
+    return uow if uow is not None and uow.active else None
+
+
+class _TaskLock:
+    """``asyncio.Lock`` that the owning task may re-enter (nested sessions)."""
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self._owner: Optional[asyncio.Task[Any]] = None
+        self._depth = 0
+
+    def held_by_current_task(self) -> bool:
+        return self._owner is not None and self._owner is asyncio.current_task()
+
+    async def acquire(self) -> None:
+        if self.held_by_current_task():
+            self._depth += 1
+            return
+        await self._lock.acquire()
+        self._owner = asyncio.current_task()
+        self._depth = 1
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self._owner = None
+            self._lock.release()
+
+
+class UnitOfWork:
+    """One connection and one transaction shared by every session of a request.
+
+    ``ManagedSession`` joins it with ``join_transaction_mode="rollback_only"``:
+    ``session.commit()`` only flushes, ``session.rollback()`` rolls back the
+    whole unit.  The real COMMIT happens once, in :meth:`commit`; ``on_commit``
+    callbacks collected along the way run after it.  Sessions are serialized
+    on the shared connection, so concurrent calls within one request queue.
+
+    Read-only sessions join only when no replica is configured or the unit
+    already holds a connection (so they see the request's own writes);
+    otherwise they keep going to a replica.
+    """
+
+    def __init__(self) -> None:
+        self.active = True
+        self.has_writes = False
+        self._connection: Optional[AsyncConnection] = None
+        self._lock = _TaskLock()
+        self._callbacks: list[Callable[[], Awaitable[None]]] = []
+
+    @property
+    def has_connection(self) -> bool:
+        return self._connection is not None
+
+    def allows_coalescing(self) -> bool:
+        """Whether a read may be shared with other requests.
+
+        Not once this unit has uncommitted writes (they would leak), nor
+        while the current task holds the connection (the shared read would
+        wait for it forever).
+        """
+        return not self.has_writes and not self._lock.held_by_current_task()
+
+    def accepts(self, session_maker: Any, *, read_only: bool, has_replica: bool) -> bool:
+        if not self.active or getattr(session_maker, "kw", {}).get("bind") is None:
+            return False
+        return not read_only or not has_replica or self.has_connection
+
+    async def acquire(self, session_maker: Any) -> AsyncSession:
+        await self._lock.acquire()
+        try:
+            if self._connection is None:
+                self._connection = await session_maker.kw["bind"].connect()
+            if not self._connection.in_transaction():
+                await self._connection.begin()
+            return session_maker(
+                bind=self._connection, join_transaction_mode="rollback_only"
+            )
+        except BaseException:
+            self._lock.release()
+            raise
+
+    def release(
+        self,
+        *,
+        committed: bool,
+        rolled_back: bool,
+        callbacks: Iterable[Callable[[], Awaitable[None]]] = (),
+    ) -> None:
+        if rolled_back:
+            # the shared transaction is gone, and with it every earlier write
+            self.has_writes = False
+            self._callbacks.clear()
+        else:
+            self.has_writes = self.has_writes or committed
+            self._callbacks.extend(callbacks)
+        self._lock.release()
+
+    async def commit(self) -> None:
+        """COMMIT the shared transaction, then run deferred callbacks.
+
+        Afterwards the unit is inactive and sessions go back to one
+        transaction per call.
+        """
+        if not self.active:
+            return
+        self.active = False
+        conn, self._connection = self._connection, None
+        try:
+            if conn is not None and conn.in_transaction():
+                await conn.commit()
+        except BaseException:
+            unit_of_work_commits.inc(outcome="failed")
+            raise
+        finally:
+            if conn is not None:
+                await conn.close()
+        unit_of_work_commits.inc(outcome="committed" if self.has_writes else "read_only")
+        if self.has_writes:
+            mark_write()
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception:
+                logger.exception("on_commit callback failed")
+
+    async def close(self) -> None:
+        """Roll back whatever was not committed and return the connection."""
+        self.active = False
+        conn, self._connection = self._connection, None
+        self._callbacks.clear()
+        if conn is not None:
+            unit_of_work_commits.inc(outcome="rolled_back")
+            await conn.close()
+
+
+class UnitOfWorkMiddleware:
+    """Pure ASGI middleware opening a :class:`UnitOfWork` per HTTP request.
+
+    The unit commits just before ``http.response.start`` is sent, so the
+    client never sees a success status for work that failed to commit — a
+    failed COMMIT turns into a 500.  If the application raises, everything
+    is rolled back.  Enabled by ``database.session_scope: request``.
+    """
+
+    def __init__(self, app: Callable[..., Awaitable[None]]) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        uow = UnitOfWork()
+        token = _current.set(uow)
+        commit_failed = False
+
+        async def send_after_commit(message: dict) -> None:
+            nonlocal commit_failed
+            if commit_failed:
+                return
+            if message["type"] == "http.response.start":
+                try:
+                    await uow.commit()
+                except Exception:
+                    logger.exception("unit of work commit failed")
+                    commit_failed = True
+                    await send(
+                        {
+                            "type": "http.response.start",
+                            "status": 500,
+                            "headers": [(b"content-type", b"text/plain; charset=utf-8")],
+                        }
+                    )
+                    await send(
+                        {"type": "http.response.body", "body": b"Internal Server Error"}
+                    )
+                    return
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_after_commit)
+        finally:
+            _current.reset(token)
+            await uow.close()
@@ -0,0 +1,136 @@
+"""Startup warm-up: fill the pool and the statement caches before traffic.
+
+A fresh worker otherwise pays, on its first requests, for connection setup
+(TCP, TLS, auth) and for compiling every repository query.  ``warm_up``
+runs in the app lifespan (``database.warmup.enabled``):
+
+1. opens ``connections`` connections per engine (primary and replicas)
+   concurrently and returns them to the pool;
+2. on each of them runs every registered repository's ``warm_up()`` reads
+   (read-only, harmless arguments, rolled back).  The first run fills
+   SQLAlchemy's compiled-statement cache; with ``prepare`` each connection
+   also prepares the statements server-side — asyncpg does so on first
+   execution, psycopg is told to (``prepare_threshold = 0``) for the
+   duration of the warm-up.
+
+A warm-up that fails or exceeds its timeout is logged and abandoned; the
+worker still starts and warms up on demand as before.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from core.infrastructure.database.database import Database
+
+logger = logging.getLogger(__name__)
+
+RepositoryFactory = Callable[[AsyncSession], Any]
+
+
+@dataclass(frozen=True)
+class WarmupReport:
+    connections: int
+    statements: int
+    seconds: float
+
+
+def _pool_size(engine: AsyncEngine) -> int:
+    size = getattr(engine.pool, "size", None)
+    return size() if callable(size) else 0  # NullPool keeps nothing to warm
+
+
+async def _prepare_all(conn: AsyncConnection) -> Callable[[], None]:
+    """Make psycopg prepare on first execution; returns the undo."""
+    raw = await conn.get_raw_connection()
+    driver = raw.driver_connection
+    if not hasattr(driver, "prepare_threshold"):
+        return lambda: None  # asyncpg prepares everything it runs
+    threshold = driver.prepare_threshold
+
+    def restore() -> None:
+        driver.prepare_threshold = threshold
+
+    driver.prepare_threshold = 0
+    return restore
+
+
+async def _warm_connection(
+    engine: AsyncEngine,
+    repositories: Sequence[RepositoryFactory],
+    opened: asyncio.Barrier,
+    prepare: bool,
+) -> int:
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        # hold this connection until all are open, or the pool hands the
+        # same one out again and fewer than ``connections`` get opened
+        await opened.wait()
+        restore = await _prepare_all(conn) if prepare else (lambda: None)
+        statements = 0
+        try:
+            async with AsyncSession(bind=conn) as session:
+                for repository in repositories:
+                    statements += await repository(session).warm_up()
+                await session.rollback()
+        finally:
+            restore()
+        return statements
+
+
+async def warm_up(
+    database: Database,
+    repositories: Sequence[RepositoryFactory],
+    *,
+    connections: int = -1,
+    prepare: bool = True,
+    timeout: float = 10.0,
+) -> WarmupReport:
+    """Warm every engine of ``database``; ``connections < 0`` means pool_size."""
+    started = time.perf_counter()
+    prepare = prepare and database.options.statement_cache_size > 0
+    engines = [database.engine, *database.replica_engines]
+    jobs = []
+    for engine in engines:
+        n = _pool_size(engine)
+        if connections >= 0:
+            n = min(n, connections)
+        if n <= 0:
+            continue
+        opened = asyncio.Barrier(n)
+        jobs += [
+            _warm_connection(engine, repositories, opened, prepare) for _ in range(n)
+        ]
+
+    try:
+        # a task group cancels (and awaits) the rest when one connection
+        # fails or time runs out, so none is left at the barrier holding
+        # a checked-out connection
+        async with asyncio.timeout(timeout), asyncio.TaskGroup() as group:
+            tasks = [group.create_task(job) for job in jobs]
+        counts = [task.result() for task in tasks]
+    except Exception:
+        logger.warning(
+            "database warm-up abandoned after %.0f ms",
+            (time.perf_counter() - started) * 1e3,
+            exc_info=True,
+        )
+        counts = []
+    report = WarmupReport(
+        connections=len(counts),
+        statements=sum(counts),
+        seconds=time.perf_counter() - started,
+    )
+    logger.info(
+        "database warm-up: %d connections, %d statements in %.0f ms",
+        report.connections,
+        report.statements,
+        report.seconds * 1e3,
+    )
+    return report
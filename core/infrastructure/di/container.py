@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 from dependency_injector import containers, providers
+from core.infrastructure.background import HookRunner
+from core.infrastructure.cache.backends import InMemoryCacheBackend, RedisCacheBackend
+from core.infrastructure.concurrency import SingleFlight
 from core.infrastructure.database.database import Database
+from core.infrastructure.outbox import FileSink, InMemorySink, LoggingSink, OutboxRelay
 
 
 class CoreContainer(containers.DeclarativeContainer):
@@ -13,4 +17,56 @@ class CoreContainer(containers.DeclarativeContainer):
         database_host=config.database.host,
         database_port=config.database.port,
         database_name=config.database.name,
-    )
\ No newline at end of file
+        driver=config.database.driver,
+        echo=config.database.engine.echo,
+        query_cache_size=config.database.engine.query_cache_size,
+        statement_cache_size=config.database.engine.statement_cache_size,
+        slow_query_ms=config.database.instrumentation.slow_query_ms,
+        null_pool=config.database.pool.null_pool,
+        pool_size=config.database.pool.size,
+        max_overflow=config.database.pool.max_overflow,
+        pool_timeout=config.database.pool.timeout,
+        pool_recycle=config.database.pool.recycle,
+        pool_pre_ping=config.database.pool.pre_ping,
+        replica_hosts=config.database.replicas.hosts,
+        replica_balancing=config.database.replicas.balancing,
+        read_your_writes_window=config.database.replicas.read_your_writes_window,
+    )
+    cache_backend = providers.Selector(
+        config.cache.backend,
+        none=providers.Object(None),
+        memory=providers.Singleton(
+            InMemoryCacheBackend, maxsize=config.cache.maxsize
+        ),
+        redis=providers.Singleton(
+            RedisCacheBackend.from_url, config.cache.redis_url
+        ),
+    )
+    hook_runner = providers.Singleton(
+        HookRunner,
+        workers=config.hooks.workers,
+        queue_size=config.hooks.queue_size,
+        batch_size=config.hooks.batch_size,
+        batch_window_ms=config.hooks.batch_window_ms,
+        max_attempts=config.hooks.max_attempts,
+        retry_backoff_ms=config.hooks.retry_backoff_ms,
+    )
+    outbox_sink = providers.Selector(
+        config.outbox.sink,
+        log=providers.Singleton(LoggingSink),
+        memory=providers.Singleton(InMemorySink),
+        file=providers.Singleton(FileSink, path=config.outbox.file_path),
+    )
+    outbox_relay = providers.Singleton(
+        OutboxRelay,
+        session_maker=database.provided.session_maker,
+        sink=outbox_sink,
+        batch_size=config.outbox.relay.batch_size,
+        poll_interval_ms=config.outbox.relay.poll_interval_ms,
+        max_attempts=config.outbox.relay.max_attempts,
+    )
+    read_coalescer = providers.Selector(
+        config.service.read_coalescing,
+        on=providers.Singleton(SingleFlight),
+        off=providers.Object(None),
+    )
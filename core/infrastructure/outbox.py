@@ -0,0 +1,188 @@
+"""Transactional outbox relay: publish committed domain events to a sink.
+
+Services write ``DomainEvent`` rows to the ``outbox`` table in the same
+transaction as the change they describe (``BaseService`` with
+``outbox=True``), so an event exists if and only if its change committed.
+``OutboxRelay`` then moves them out:
+
+    claim a batch (DELETE ... SKIP LOCKED ... RETURNING)  →  sink.publish  →  COMMIT
+
+Any number of relays — one per worker process is fine — can run against
+the same table: ``SKIP LOCKED`` hands each row to exactly one of them.  If
+the sink fails the transaction rolls back, the rows reappear, and their
+``attempts`` go up; after ``max_attempts`` a row is parked (left in the
+table, never claimed) for manual inspection.  A crash between publish and
+COMMIT re-publishes that batch, so delivery is at-least-once: consumers
+dedupe on the message ``id``.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Callable, Optional, Protocol, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.infrastructure.metrics import registry
+from core.infrastructure.repositories.outbox_repository import (
+    OutboxMessage,
+    OutboxRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+BATCH_BUCKETS = (0, 1, 10, 50, 100, 250, 500, 1_000)
+
+published = registry.counter(
+    "outbox_published_total", "Outbox messages published by event type", ("event_type",)
+)
+publish_failures = registry.counter(
+    "outbox_publish_failures_total", "Batches the sink failed to publish"
+)
+batch_seconds = registry.histogram(
+    "outbox_relay_batch_seconds", "Claim + publish + commit time per relay batch"
+)
+batch_size = registry.histogram(
+    "outbox_relay_batch_size", "Messages per relay batch", buckets=BATCH_BUCKETS
+)
+
+
+# ---- sinks ----
+
+
+class OutboxSink(Protocol):
+    """Destination for relayed messages (message broker, webhook, ...).
+
+    ``publish`` must raise unless every message was accepted.
+    """
+
+    async def publish(self, messages: Sequence[OutboxMessage]) -> None: ...
+
+
+class InMemorySink:
+    """Keeps published messages in a list (tests, local development)."""
+
+    def __init__(self) -> None:
+        self.messages: list[OutboxMessage] = []
+
+    async def publish(self, messages: Sequence[OutboxMessage]) -> None:
+        self.messages.extend(messages)
+
+
+class FileSink:
+    """Appends one JSON line per message to ``path``."""
+
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+
+    def _write(self, lines: str) -> None:
+        with self.path.open("a", encoding="utf-8") as fh:
+            fh.write(lines)
+
+    async def publish(self, messages: Sequence[OutboxMessage]) -> None:
+        lines = "".join(json.dumps(m.to_dict()) + "\n" for m in messages)
+        await asyncio.to_thread(self._write, lines)
+
+
+class LoggingSink:
+    """Logs each message at INFO; the default until a real sink is configured."""
+
+    async def publish(self, messages: Sequence[OutboxMessage]) -> None:
+        for m in messages:
+            logger.info("outbox %s %s/%s", m.event_type, m.topic, m.aggregate_id)
+
+
+# ---- relay ----
+
+
+class OutboxRelay:
+    """Polls the outbox and publishes batches until stopped.
+
+    A full batch is followed immediately by the next one; a short batch
+    means the table is drained, so the relay sleeps ``poll_interval_ms``.
+    """
+
+    def __init__(
+        self,
+        session_maker: Callable[[], AsyncSession],
+        sink: OutboxSink,
+        *,
+        batch_size: int = 100,
+        poll_interval_ms: float = 1000.0,
+        max_attempts: int = 10,
+    ) -> None:
+        self._session_maker = session_maker
+        self.sink = sink
+        self.batch_size = max(batch_size, 1)
+        self.poll_interval = max(poll_interval_ms, 0.0) / 1000
+        self.max_attempts = max(max_attempts, 1)
+        self._task: Optional[asyncio.Task[None]] = None
+        self._stopping = asyncio.Event()
+
+    async def relay_once(self) -> int:
+        """Publish one batch; returns how many messages went out."""
+        started = time.perf_counter()
+        async with self._session_maker() as session:
+            messages = await OutboxRepository(session).claim(
+                self.batch_size, max_attempts=self.max_attempts
+            )
+            if not messages:
+                await session.rollback()
+                return 0
+            try:
+                await self.sink.publish(messages)
+            except Exception:
+                await session.rollback()
+                publish_failures.inc()
+                await self._record_failure([m.id for m in messages])
+                raise
+            await session.commit()
+
+        batch_seconds.observe(time.perf_counter() - started)
+        batch_size.observe(len(messages))
+        for m in messages:
+            published.inc(event_type=m.event_type)
+        return len(messages)
+
+    async def _record_failure(self, ids: list[int]) -> None:
+        async with self._session_maker() as session:
+            await OutboxRepository(session).record_failure(ids)
+            await session.commit()
+
+    async def drain(self) -> int:
+        """Publish until the outbox is empty (or only parked rows remain)."""
+        total = 0
+        while True:
+            n = await self.relay_once()
+            total += n
+            if n < self.batch_size:
+                return total
+
+    async def run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                n = await self.relay_once()
+            except Exception:
+                logger.exception("outbox relay batch failed")
+                n = 0
+            if n < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._stopping = asyncio.Event()
+            self._task = asyncio.create_task(self.run(), name="outbox-relay")
+
+    async def stop(self) -> None:
+        """Finish the current batch, then stop."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        self._stopping.set()
+        await task
@@ -1,19 +1,73 @@
 from __future__ import annotations
 
-from typing import Any, Generic, Optional, Type, TypeVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Generic,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
 
 from pydantic import BaseModel
-from sqlalchemy import Select, delete, func, select, update
+from sqlalchemy import (
+    BigInteger,
+    Select,
+    any_,
+    bindparam,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    inspect as sa_inspect,
+    literal,
+    select,
+    table,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, REGCLASS
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
-from core.domain.repositories.base import AbstractRepository
+from core.application.dtos.base import CursorPage
+from core.domain.repositories.base import AbstractRepository, ConflictError
+from core.infrastructure.database.instrumentation import instrument_repository
 from core.specs.base import QuerySpec, SpecChain
+from core.specs.common import KeysetPaginate
 
 ModelT = TypeVar("ModelT")
+T = TypeVar("T")
+
+_pg_class = table("pg_class", column("oid"), column("reltuples"))
 CreateEntityT = TypeVar("CreateEntityT", bound=BaseModel)
 ReadEntityT = TypeVar("ReadEntityT", bound=BaseModel)
 UpdateEntityT = TypeVar("UpdateEntityT", bound=BaseModel)
 
+LOAD_STRATEGIES = {"selectin": selectinload, "joined": joinedload, "raise": raiseload}
+
+# repository class -> (read options, RETURNING options, loads relationships)
+_loader_plans: dict[type, tuple[tuple[Any, ...], tuple[Any, ...], bool]] = {}
+
+
+def _chunks(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    size = max(size, 1)
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _is_unique_violation(exc: IntegrityError) -> bool:
+    # PostgreSQL drivers expose the SQLSTATE; SQLite only has the message
+    code = getattr(exc.orig, "sqlstate", None) or getattr(exc.orig, "pgcode", None)
+    if code is not None:
+        return code == "23505"
+    return "UNIQUE constraint failed" in str(exc.orig)
+
 
 class SQLAlchemyRepository(
     AbstractRepository[CreateEntityT, ReadEntityT, UpdateEntityT],
@@ -27,13 +81,27 @@ class SQLAlchemyRepository(
 
     Optionally override:
         pk_column       — primary key column name (default: "id")
-        _to_read()      — ORM → Pydantic mapping
+        bulk_chunk_size — rows per statement in ``*_many`` methods (default: 1000)
+        stream_chunk_size — rows fetched per round trip by ``stream`` (default: 1000)
+        version_column  — column that changes on every write (default: "updated_at")
+        fast_mapping    — read plain columns into ``model_construct`` (default: False)
+        eager_loads     — relationship → "selectin" / "joined" / "raise"
+                          (default: "selectin" for relationships in read_schema)
+        soft_delete_column — timestamp column set by ``delete_*`` instead of
+                          removing the row (default: None, hard delete)
+        _to_read()      — ORM → Pydantic mapping (not used by fast-mapped reads)
         _create_values() — CreateEntity → dict mapping
         _update_values() — UpdateEntity → dict mapping
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # time public methods and label their statements (see instrumentation)
+        instrument_repository(cls)
+
+    def __init__(self, session: AsyncSession, *, include_deleted: bool = False) -> None:
         self.session = session
+        self.include_deleted = include_deleted
 
     # ---- abstract properties (subclass MUST define) ----
 
@@ -52,11 +120,138 @@ class SQLAlchemyRepository(
         """Override to change the primary key column name. Default: ``"id"``."""
         return "id"
 
+    @property
+    def bulk_chunk_size(self) -> int:
+        """Override to change how many rows one bulk statement carries. Default: ``1000``."""
+        return 1000
+
+    @property
+    def version_column(self) -> str:
+        """Override to change the column ``get_version`` reads. Default: ``"updated_at"``."""
+        return "updated_at"
+
+    @property
+    def stream_chunk_size(self) -> int:
+        """Override to change how many rows ``stream`` fetches at a time. Default: ``1000``."""
+        return 1000
+
+    @property
+    def soft_delete_column(self) -> Optional[str]:
+        """Soft-delete marker column.  Default: ``None`` (hard delete).
+
+        When set, ``delete_by_id`` / ``delete_many`` become a single
+        ``UPDATE ... SET <column> = now()`` on rows not yet deleted, and every
+        read and update skips rows where the column is set — unless the
+        repository comes from ``including_deleted()``.
+        """
+        return None
+
+    @property
+    def fast_mapping(self) -> bool:
+        """Read queries select plain columns and build ``read_schema`` with
+        ``model_construct`` — no ORM identity map, no validation.
+
+        Only safe when ``read_schema`` fields map 1:1 onto table columns whose
+        driver values already have the declared types, and when no spec needs
+        ORM entities (e.g. ``SelectInLoad``).  Ignored while ``eager_loads``
+        loads any relationship.  Default: ``False``.
+        """
+        return False
+
+    @property
+    def eager_loads(self) -> Mapping[str, str]:
+        """How each relationship is loaded on every read and write.
+
+        ``"selectin"`` (one extra query per statement, best for collections),
+        ``"joined"`` (same query; many-to-one only) or ``"raise"``.
+        Relationships not listed get ``raiseload``: touching them raises
+        instead of issuing one lazy query per row, which in an async session
+        would fail anyway.  Default: ``"selectin"`` for every relationship
+        that is also a ``read_schema`` field.
+        """
+        fields = self.read_schema.model_fields
+        relationships = sa_inspect(self.model).relationships
+        return {name: "selectin" for name in relationships.keys() if name in fields}
+
     # ---- mapping hooks (override if needed) ----
 
     def _to_read(self, orm_obj: Any) -> ReadEntityT:
         return self.read_schema.model_validate(orm_obj, from_attributes=True)
 
+    def _loader_plan(self) -> tuple[tuple[Any, ...], tuple[Any, ...], bool]:
+        """``eager_loads`` as loader options, built once per repository class."""
+        plan = _loader_plans.get(type(self))
+        if plan is None:
+            plan = _loader_plans[type(self)] = self._build_loader_plan()
+        return plan
+
+    def _build_loader_plan(self) -> tuple[tuple[Any, ...], tuple[Any, ...], bool]:
+        relationships = sa_inspect(self.model).relationships
+        if not relationships:
+            return (), (), False
+        read: list[Any] = []
+        returning: list[Any] = []
+        for name, strategy in self.eager_loads.items():
+            if name not in relationships:
+                raise ValueError(f"{self.model.__name__} has no relationship {name!r}")
+            if strategy not in LOAD_STRATEGIES:
+                raise ValueError(
+                    f"eager_loads[{name!r}] must be one of {tuple(LOAD_STRATEGIES)}, "
+                    f"got {strategy!r}"
+                )
+            if strategy == "joined" and relationships[name].uselist:
+                raise ValueError(
+                    f"eager_loads[{name!r}]: use 'selectin' for collections"
+                )
+            attr = getattr(self.model, name)
+            read.append(LOAD_STRATEGIES[strategy](attr))
+            # INSERT/UPDATE ... RETURNING cannot join
+            returning.append(
+                selectinload(attr) if strategy == "joined" else read[-1]
+            )
+        loads = any(s != "raise" for s in self.eager_loads.values())
+        read.append(raiseload("*"))
+        returning.append(raiseload("*"))
+        return tuple(read), tuple(returning), loads
+
+    def _uses_fast_mapping(self) -> bool:
+        return self.fast_mapping and not self._loader_plan()[2]
+
+    def _returning(self, stmt: Any, **kw: Any) -> Any:
+        """``stmt.returning(model)`` with the ``eager_loads`` options applied."""
+        return stmt.returning(self.model, **kw).options(*self._loader_plan()[1])
+
+    def including_deleted(
+        self,
+    ) -> SQLAlchemyRepository[ModelT, CreateEntityT, ReadEntityT, UpdateEntityT]:
+        """A repository on the same session that also sees soft-deleted rows."""
+        return type(self)(self.session, include_deleted=True)
+
+    def _live(self) -> list[Any]:
+        """Criteria matching rows that are not soft-deleted."""
+        column = self.soft_delete_column
+        if column is None:
+            return []
+        return [getattr(self.model, column).is_(None)]
+
+    def _visible(self) -> list[Any]:
+        """``_live()`` unless this repository includes deleted rows."""
+        return [] if self.include_deleted else self._live()
+
+    def _read_columns(self) -> list[Any]:
+        """Table columns backing ``read_schema`` fields, in table order."""
+        fields = self.read_schema.model_fields
+        table = self.model.__table__  # type: ignore[attr-defined]
+        return [c for c in table.c if c.key in fields]
+
+    def _map_rows(self, rows: Sequence[Any]) -> list[ReadEntityT]:
+        """Map rows of ``_base_select()`` (plus trailing extras) to ``read_schema``."""
+        if not self._uses_fast_mapping():
+            return [self._to_read(row[0]) for row in rows]
+        construct = self.read_schema.model_construct
+        names = [c.key for c in self._read_columns()]
+        return [construct(**dict(zip(names, row))) for row in rows]
+
     def _create_values(self, dto: CreateEntityT) -> dict[str, Any]:
         return dto.model_dump(exclude_none=True)
 
@@ -65,13 +260,67 @@ class SQLAlchemyRepository(
 
     # ---- query building ----
 
-    def _base_select(self) -> Select[tuple[ModelT]]:
-        return select(self.model)
+    def _base_select(self) -> Select[Any]:
+        if self._uses_fast_mapping():
+            stmt = select(*self._read_columns())
+        else:
+            stmt = select(self.model).options(*self._loader_plan()[0])
+        return stmt.where(*self._visible())
 
     def _pk_filter(self, obj_id: int) -> Any:
         """Build a primary-key equality filter."""
         return getattr(self.model, self.pk_column) == obj_id
 
+    def _pk_in(self, obj_ids: Sequence[Any]) -> Any:
+        """``pk = ANY(:ids)`` on PostgreSQL, else ``pk IN (...)``.
+
+        ``ANY`` binds one array parameter, so the SQL text — and the
+        server-side prepared statement — is the same for any number of ids;
+        ``IN`` renders one placeholder per id.
+        """
+        pk = getattr(self.model, self.pk_column)
+        if self.session.get_bind().dialect.name == "postgresql":
+            return pk == any_(bindparam("pk_ids", list(obj_ids), type_=ARRAY(pk.type)))
+        return pk.in_(obj_ids)
+
+    def _supports_update_from_values(self) -> bool:
+        """``UPDATE ... FROM (VALUES ...) AS v(...)`` is PostgreSQL syntax."""
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    def _supports_reltuples(self) -> bool:
+        """Planner row estimates in ``pg_class`` are PostgreSQL-only."""
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    def _total_column(self, total: str) -> Any:
+        if total == "estimate":
+            # whole-table estimate; -1 until the table is first ANALYZEd
+            preparer = self.session.get_bind().dialect.identifier_preparer
+            table_name = preparer.format_table(self.model.__table__)  # type: ignore[attr-defined]
+            return (
+                select(cast(_pg_class.c.reltuples, BigInteger))
+                .where(_pg_class.c.oid == cast(literal(table_name), REGCLASS))
+                .scalar_subquery()
+                .label("total")
+            )
+        return func.count().over().label("total")
+
+    def _list_select(
+        self, spec: Any, *, total: Optional[str] = None
+    ) -> Select[Any]:
+        """``_base_select()`` with ``spec`` applied, plus a ``total`` column
+        (``"exact"`` or ``"estimate"``) if requested; built once per
+        repository class when the spec is a cacheable ``SpecChain``."""
+
+        def build() -> Select[Any]:
+            stmt = self._apply_spec(self._base_select(), spec)
+            if total is None:
+                return stmt
+            return stmt.add_columns(self._total_column(total))
+
+        if isinstance(spec, SpecChain) and spec.cacheable:
+            return spec.cached((type(self), total, self.include_deleted), build)
+        return build()
+
     def _apply_spec(
         self,
         stmt: Select[tuple[ModelT]],
@@ -82,13 +331,25 @@ class SQLAlchemyRepository(
         return spec.apply(stmt)
 
     # ---- CRUD ----
+    #
+    # Every single-row write is one statement: INSERT / UPDATE / DELETE with
+    # RETURNING, mapped straight to ``read_schema``.
+
+    async def _write(self, stmt: Any, params: Any = None) -> Any:
+        """Execute an INSERT / UPDATE; a unique violation raises ``ConflictError``."""
+        try:
+            return await self.session.execute(stmt, params)
+        except IntegrityError as e:
+            if not _is_unique_violation(e):
+                raise
+            raise ConflictError(
+                f"{self.model.__name__} conflicts with an existing row"
+            ) from e
 
     async def create(self, dto: CreateEntityT) -> ReadEntityT:
-        obj = self.model(**self._create_values(dto))  # type: ignore[call-arg]
-        self.session.add(obj)
-        await self.session.flush()
-        await self.session.refresh(obj)
-        return self._to_read(obj)
+        stmt = self._returning(insert(self.model).values(**self._create_values(dto)))
+        res = await self._write(stmt)
+        return self._to_read(res.scalars().one())
 
     async def get_by_id(
         self, obj_id: int, *, spec: Any = None
@@ -96,16 +357,155 @@ class SQLAlchemyRepository(
         stmt = self._base_select().where(self._pk_filter(obj_id))
         stmt = self._apply_spec(stmt, spec)
         res = await self.session.execute(stmt)
-        obj = res.scalars().first()
-        return self._to_read(obj) if obj else None
+        row = res.first()
+        return self._map_rows([row])[0] if row else None
+
+    async def get_by_ids(
+        self,
+        obj_ids: Sequence[int],
+        *,
+        spec: Any = None,
+        chunk_size: Optional[int] = None,
+    ) -> list[Optional[ReadEntityT]]:
+        """One row per id, in input order, ``None`` where there is none.
+
+        One query per ``chunk_size`` distinct ids (default
+        ``bulk_chunk_size``); repeated ids share a row.
+        """
+        pk = getattr(self.model, self.pk_column)
+        distinct = list(dict.fromkeys(obj_ids))
+        found: dict[Any, ReadEntityT] = {}
+        for chunk in _chunks(distinct, chunk_size or self.bulk_chunk_size):
+            # the pk rides along as a trailing extra: read_schema may omit it
+            stmt = self._base_select().add_columns(pk).where(self._pk_in(chunk))
+            stmt = self._apply_spec(stmt, spec)
+            rows = (await self.session.execute(stmt)).all()
+            found.update(zip((row[-1] for row in rows), self._map_rows(rows)))
+        return [found.get(obj_id) for obj_id in obj_ids]
+
+    async def get_by_field(
+        self, field: Any, value: Any, *, spec: Any = None
+    ) -> Optional[ReadEntityT]:
+        """First row where ``field == value`` (None if there is none).
+
+        ``field`` is a column name or a SQL expression — pass the exact
+        expression an index is built on (e.g. ``func.lower(Model.email)``)
+        so the lookup can use it.  Meant for unique or near-unique columns;
+        give a ``spec`` with an ``OrderBy`` to choose among several matches.
+        """
+        stmt = self._base_select().where(self._field(field) == value).limit(1)
+        stmt = self._apply_spec(stmt, spec)
+        res = await self.session.execute(stmt)
+        row = res.first()
+        return self._map_rows([row])[0] if row else None
+
+    def _field(self, field: Any) -> Any:
+        if not isinstance(field, str):
+            return field
+        if field not in self.model.__mapper__.column_attrs:
+            raise ValueError(f"{self.model.__name__} has no column {field!r}")
+        return getattr(self.model, field)
+
+    async def warm_up(self) -> int:
+        """Run the common reads once with harmless arguments; returns how many.
+
+        Used by the startup warm-up (``core.infrastructure.database.warmup``)
+        to compile — and, per connection, prepare — statements before the
+        first request needs them.  Keep it read-only and cheap: it runs on
+        every pooled connection.  Subclasses add their own queries and
+        ``super()``'s count.
+        """
+        await self.get_by_id(0)
+        await self.get_version(0)
+        return 2
+
+    async def get_version(self, obj_id: int) -> Optional[Any]:
+        """Read only ``version_column`` of one row (None if it does not exist).
+
+        A cheap pre-check for conditional requests: no DTO is built.
+        """
+        col = getattr(self.model, self.version_column)
+        stmt = select(col).where(self._pk_filter(obj_id), *self._visible())
+        res = await self.session.execute(stmt)
+        row = res.first()
+        return row[0] if row else None
+
+    async def get_list(
+        self, *, spec: Any = None, params: Optional[Mapping[str, Any]] = None
+    ) -> list[ReadEntityT]:
+        """``params`` supplies the bind parameters of a cacheable spec."""
+        stmt = self._list_select(spec)
+        res = await self.session.execute(stmt, params)
+        return self._map_rows(res.all())
+
+    async def stream(
+        self,
+        *,
+        spec: Any = None,
+        params: Optional[Mapping[str, Any]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[ReadEntityT]:
+        """Yield ``get_list`` results one by one from a server-side cursor.
+
+        Rows are fetched ``chunk_size`` at a time, so memory stays flat however
+        large the result.  The session's connection is held until the
+        iterator is exhausted or closed.
+        """
+        size = max(chunk_size or self.stream_chunk_size, 1)
+        res = await self.session.stream(
+            self._list_select(spec), params, execution_options={"yield_per": size}
+        )
+        async for rows in res.partitions():
+            for dto in self._map_rows(rows):
+                yield dto
+
+    async def get_page_with_total(
+        self,
+        *,
+        spec: Any = None,
+        params: Optional[Mapping[str, Any]] = None,
+        approximate: bool = False,
+    ) -> tuple[list[ReadEntityT], int]:
+        """One page of ``get_list`` plus the unpaginated total, in one query.
+
+        The total rides along every row as ``count(*) OVER ()``.  With
+        ``approximate=True`` on PostgreSQL it is the planner's whole-table
+        estimate from ``pg_class.reltuples`` instead — far cheaper on huge
+        tables, but it ignores the spec's filters.  An empty page (past the
+        end) falls back to a separate exact count.
+        """
+        kind = "estimate" if approximate and self._supports_reltuples() else "exact"
+        res = await self.session.execute(self._list_select(spec, total=kind), params)
+        rows = res.all()
+        if rows and rows[0].total >= 0:
+            total = int(rows[0].total)
+        else:
+            total = await self._count_unpaginated(spec, params)
+        return self._map_rows(rows), total
+
+    async def _count_unpaginated(
+        self, spec: Any, params: Optional[Mapping[str, Any]]
+    ) -> int:
+        inner = self._apply_spec(self._base_select(), spec)
+        inner = inner.order_by(None).limit(None).offset(None)
+        stmt = select(func.count()).select_from(inner.subquery())
+        res = await self.session.execute(stmt, params)
+        return int(res.scalar_one())
 
-    async def get_list(self, *, spec: Any = None) -> list[ReadEntityT]:
-        stmt = self._apply_spec(self._base_select(), spec)
+    async def get_page(
+        self, paginate: KeysetPaginate[ModelT], *, spec: Any = None
+    ) -> CursorPage[ReadEntityT]:
+        """Fetch one keyset page; ``spec`` must not order or paginate."""
+        stmt = paginate.apply(self._apply_spec(self._base_select(), spec))
         res = await self.session.execute(stmt)
-        return [self._to_read(x) for x in res.scalars().all()]
+        rows = self._map_rows(res.all())
+        items, next_cursor, prev_cursor = paginate.paginate(rows)
+        return CursorPage[self.read_schema](  # type: ignore[name-defined]
+            items=items, next_cursor=next_cursor, prev_cursor=prev_cursor
+        )
 
     async def count(self, *, spec: Any = None) -> int:
-        stmt: Any = select(func.count()).select_from(self.model)
+        stmt: Any = select(func.count()).select_from(self.model).where(*self._visible())
         if spec is not None:
             stmt = spec.apply(stmt)
         res = await self.session.execute(stmt)
@@ -118,17 +518,134 @@ class SQLAlchemyRepository(
         if not values:
             return await self.get_by_id(obj_id)
 
-        stmt = update(self.model).where(self._pk_filter(obj_id)).values(**values)
-        await self.session.execute(stmt)
-        await self.session.flush()
-        return await self.get_by_id(obj_id)
+        stmt = self._returning(
+            update(self.model)
+            .where(self._pk_filter(obj_id), *self._visible())
+            .values(**values)
+        ).execution_options(populate_existing=True)
+        res = await self._write(stmt)
+        obj = res.scalars().first()
+        return self._to_read(obj) if obj else None
 
     async def delete_by_id(self, obj_id: int) -> bool:
-        existing = await self.get_by_id(obj_id)
-        if existing is None:
-            return False
-
-        stmt = delete(self.model).where(self._pk_filter(obj_id))
-        await self.session.execute(stmt)
-        await self.session.flush()
-        return True
+        pk = getattr(self.model, self.pk_column)
+        stmt = self._delete_stmt(self._pk_filter(obj_id)).returning(pk)
+        res = await self.session.execute(stmt)
+        return res.first() is not None
+
+    def _delete_stmt(self, criterion: Any) -> Any:
+        """DELETE rows matching ``criterion``, or soft-delete the live ones."""
+        column = self.soft_delete_column
+        if column is None:
+            return delete(self.model).where(criterion)
+        return (
+            update(self.model)
+            .where(criterion, *self._live())
+            .values({column: func.now()})
+            .execution_options(synchronize_session=False)
+        )
+
+    # ---- bulk ----
+
+    async def create_many(
+        self, dtos: Sequence[CreateEntityT], *, chunk_size: Optional[int] = None
+    ) -> list[ReadEntityT]:
+        """Insert many rows with multi-row ``INSERT ... RETURNING``, in input order."""
+        rows = [self._create_values(dto) for dto in dtos]
+        created: list[ReadEntityT] = []
+        for chunk in _chunks(rows, chunk_size or self.bulk_chunk_size):
+            stmt = self._returning(insert(self.model), sort_by_parameter_order=True)
+            res = await self._write(stmt, list(chunk))
+            created.extend(self._to_read(x) for x in res.scalars().all())
+        return created
+
+    async def update_many(
+        self,
+        updates: Mapping[int, UpdateEntityT],
+        *,
+        chunk_size: Optional[int] = None,
+    ) -> list[ReadEntityT]:
+        """Apply partial updates keyed by primary key.
+
+        Rows are grouped by the set of columns they change and each group is
+        sent as ``UPDATE ... FROM (VALUES ...) RETURNING``.  Dialects without
+        that syntax fall back to an executemany UPDATE plus one SELECT.
+        Returns the updated rows in input order; unknown ids are skipped.
+        """
+        groups: dict[tuple[str, ...], list[tuple[int, dict[str, Any]]]] = {}
+        unchanged: list[int] = []
+        for obj_id, dto in updates.items():
+            vals = self._update_values(dto)
+            if vals:
+                groups.setdefault(tuple(sorted(vals)), []).append((obj_id, vals))
+            else:
+                unchanged.append(obj_id)
+
+        by_id: dict[Any, ReadEntityT] = {}
+        size = chunk_size or self.bulk_chunk_size
+        for keys, rows in groups.items():
+            for chunk in _chunks(rows, size):
+                by_id.update(await self._update_chunk(keys, chunk))
+
+        if unchanged:
+            by_id.update(await self._get_many(unchanged))
+        return [by_id[i] for i in updates if i in by_id]
+
+    async def _update_chunk(
+        self, keys: tuple[str, ...], chunk: Sequence[tuple[int, dict[str, Any]]]
+    ) -> list[tuple[Any, ReadEntityT]]:
+        """``(pk, row)`` for each updated row."""
+        pk = self.pk_column
+        table = self.model.__table__  # type: ignore[attr-defined]
+        if not self._supports_update_from_values():
+            # Core executemany: unlike ORM bulk-by-pk it tolerates unknown ids.
+            stmt = (
+                update(table)
+                .where(table.c[pk] == bindparam("_pk"), *self._visible())
+                .values({k: bindparam(k) for k in keys})
+            )
+            params = [{"_pk": obj_id, **vals} for obj_id, vals in chunk]
+            await self._write(stmt, params)
+            return await self._get_many([obj_id for obj_id, _ in chunk])
+
+        v = values(
+            *(column(name, table.c[name].type) for name in (pk, *keys)),
+            name="v",
+        ).data([(obj_id, *(vals[k] for k in keys)) for obj_id, vals in chunk])
+        stmt = (
+            self._returning(
+                update(self.model)
+                .where(getattr(self.model, pk) == v.c[pk], *self._visible())
+                .values({k: v.c[k] for k in keys})
+            )
+            .returning(getattr(self.model, pk))  # read_schema may omit the pk
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        res = await self._write(stmt)
+        return [(obj_id, self._to_read(obj)) for obj, obj_id in res.all()]
+
+    async def _get_many(self, obj_ids: Sequence[int]) -> list[tuple[Any, ReadEntityT]]:
+        """``(pk, row)`` for each of ``obj_ids`` that exists."""
+        pk = getattr(self.model, self.pk_column)
+        stmt = self._base_select().add_columns(pk).where(pk.in_(obj_ids))
+        res = await self.session.execute(
+            stmt.execution_options(populate_existing=True)
+        )
+        rows = res.all()
+        return list(zip((row[-1] for row in rows), self._map_rows(rows)))
+
+    async def delete_many(
+        self, obj_ids: Sequence[int], *, chunk_size: Optional[int] = None
+    ) -> list[int]:
+        """Delete rows by primary key; returns the ids that actually existed
+        (and, when soft-deleting, were not deleted already)."""
+        pk = getattr(self.model, self.pk_column)
+        deleted: list[int] = []
+        for chunk in _chunks(list(obj_ids), chunk_size or self.bulk_chunk_size):
+            stmt = self._delete_stmt(pk.in_(chunk)).returning(pk)
+            res = await self.session.execute(stmt)
+            deleted.extend(res.scalars().all())
+        return deleted
+
+
+instrument_repository(SQLAlchemyRepository)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Sequence
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.domain.events import DomainEvent
+from core.infrastructure.database.instrumentation import instrument_repository
+from core.infrastructure.database.models.outbox import OutboxModel
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    """One claimed outbox row, as handed to a sink."""
+
+    id: int
+    topic: str
+    event_type: str
+    aggregate_id: str
+    payload: dict[str, Any]
+    created_at: datetime
+    attempts: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "topic": self.topic,
+            "event_type": self.event_type,
+            "aggregate_id": self.aggregate_id,
+            "payload": self.payload,
+            "created_at": self.created_at.isoformat(),
+        }
+
+
+_table = OutboxModel.__table__
+_columns = tuple(_table.c[name] for name in OutboxMessage.__dataclass_fields__)
+
+
+def claim_statement(limit: int, max_attempts: int) -> Any:
+    """The single claim statement used by :meth:`OutboxRepository.claim`."""
+    ids = (
+        select(OutboxModel.id)
+        .where(OutboxModel.attempts < max_attempts)
+        .order_by(OutboxModel.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return (
+        delete(OutboxModel)
+        .where(OutboxModel.id.in_(ids.scalar_subquery()))
+        .returning(*_columns)
+    )
+
+
+class OutboxRepository:
+    """Writes events inside the caller's transaction; claims them for the relay."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def add(self, events: Sequence[DomainEvent]) -> None:
+        """Insert ``events`` in one statement (executemany for several)."""
+        if not events:
+            return
+        rows = [
+            {
+                "topic": e.topic,
+                "event_type": e.event_type,
+                "aggregate_id": e.aggregate_id,
+                "payload": e.payload,
+            }
+            for e in events
+        ]
+        await self.session.execute(insert(OutboxModel), rows)
+
+    async def claim(self, limit: int, *, max_attempts: int) -> list[OutboxMessage]:
+        """Take up to ``limit`` of the oldest publishable rows, oldest first.
+
+        One statement: ``DELETE ... WHERE id IN (SELECT id ... ORDER BY id
+        LIMIT n FOR UPDATE SKIP LOCKED) RETURNING ...``.  Rows locked by
+        another relay's open transaction are skipped, so concurrent relays
+        (other workers, other hosts) never claim the same row.  The delete
+        only sticks if the caller commits — roll back after a failed
+        publish and the rows are back.  Dialects without ``SKIP LOCKED``
+        (SQLite) drop the clause and rely on their own write lock.
+        """
+        res = await self.session.execute(claim_statement(limit, max_attempts))
+        messages = [OutboxMessage(*row) for row in res.all()]
+        messages.sort(key=lambda m: m.id)  # RETURNING order is unspecified
+        return messages
+
+    async def record_failure(self, ids: Sequence[int]) -> None:
+        """Count one failed publish attempt for each row."""
+        if not ids:
+            return
+        stmt = (
+            update(OutboxModel)
+            .where(OutboxModel.id.in_(ids))
+            .values(attempts=OutboxModel.attempts + 1)
+        )
+        await self.session.execute(stmt)
+
+
+instrument_repository(OutboxRepository)
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Generic, Protocol, Sequence, TypeVar
-from sqlalchemy import Select
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Optional,
+    Protocol,
+    Sequence,
+    TypeVar,
+)
+from sqlalchemy import Select, select
 
 ModelT = TypeVar("ModelT")
 
@@ -14,11 +23,91 @@ class QuerySpec(Protocol[ModelT]):
     def apply(self, stmt: Select[tuple[ModelT]]) -> Select[tuple[ModelT]]: ...
 
 
+def _priority(spec: Any) -> int:
+    return getattr(spec, "priority", 100)
+
+
 @dataclass(frozen=True)
 class SpecChain(Generic[ModelT]):
+    """Ordered composition of specs (sorted once, by ``priority``).
+
+    A ``cacheable`` chain holds no per-request values — anything that varies
+    is a ``bindparam`` — so it can be built once at import time and the
+    statement it produces reused for every call via :meth:`cached`.  Reusing
+    the same ``Select`` object lets SQLAlchemy skip rebuilding the statement
+    and its cache key; only the parameters change per execution.
+
+    Usage::
+
+        USERS = SpecChain(
+            [Where.of(UserModel.role == bindparam("role")), Paginate.bound()],
+            cacheable=True,
+        )
+        await repo.get_list(
+            spec=USERS, params={"role": "admin", **Paginate.params(2, 20)}
+        )
+    """
+
     specs: Sequence[QuerySpec[ModelT]]
+    cacheable: bool = False
+    name: Optional[str] = None  # label for metrics and the slow-query log
+    _statements: dict[Hashable, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "specs", tuple(sorted(self.specs, key=_priority)))
 
     def apply(self, stmt: Select[tuple[ModelT]]) -> Select[tuple[ModelT]]:
-        for s in sorted(self.specs, key=lambda x: getattr(x, "priority", 100)):
+        for s in self.specs:
             stmt = s.apply(stmt)
         return stmt
+
+    def cached(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Return the statement built for ``key``, building it on first use.
+
+        ``key`` identifies the base statement the chain is applied to (e.g.
+        the repository class).  Only meaningful for ``cacheable`` chains.
+        """
+        stmt = self._statements.get(key)
+        if stmt is None:
+            stmt = self._statements[key] = build()
+        return stmt
+
+
+def _hashable(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_hashable(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+_SPEC_CACHE_KEY = ("spec_cache_key",)  # slot in a cacheable chain's ``cached``
+
+
+def spec_cache_key(spec: Optional[QuerySpec[Any]]) -> Hashable:
+    """Hashable identity of ``spec``: its compiled SQL shape plus bound values.
+
+    Two specs yield equal keys exactly when they would render the same
+    statement with the same parameters, whichever objects built them.
+    """
+    if spec is None:
+        return None
+    if isinstance(spec, SpecChain) and spec.cacheable:
+        # holds no per-call values: the key is the same on every call
+        return spec.cached(_SPEC_CACHE_KEY, lambda: _spec_cache_key(spec))
+    return _spec_cache_key(spec)
+
+
+def _spec_cache_key(spec: QuerySpec[Any]) -> Hashable:
+    cache_key = spec.apply(select())._generate_cache_key()
+    if cache_key is None:  # an element opted out of caching; never share
+        return object()
+    return cache_key.key, tuple(
+        _hashable(bind.effective_value) for bind in cache_key.bindparams
+    )
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Generic, TypeVar
-from sqlalchemy import Select
-from sqlalchemy.orm import selectinload
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, Optional, Sequence, TypeVar
+from sqlalchemy import Select, and_, bindparam, or_, tuple_
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.sql import operators
 
 from .base import QuerySpec
+from .cursor import (
+    CursorPosition,
+    InvalidCursorError,
+    check_types,
+    decode_cursor,
+    encode_cursor,
+)
 
 ModelT = TypeVar("ModelT")
 
+PAGE_OFFSET_PARAM = "page_offset"
+PAGE_LIMIT_PARAM = "page_limit"
+
 @dataclass(frozen=True)
 class Where(Generic[ModelT]):
     priority: int = 10
@@ -35,14 +46,164 @@ class OrderBy(Generic[ModelT]):
 
 @dataclass(frozen=True)
 class Paginate(Generic[ModelT]):
+    """OFFSET/LIMIT pagination.
+
+    ``Paginate.bound()`` renders both as bind parameters instead of values,
+    for use in cacheable chains; supply them per call with
+    ``Paginate.params(page, page_size)``.
+    """
+
     priority: int = 40
     page: int = 1
     page_size: int = 20
+    bind: bool = False
+
+    @classmethod
+    def bound(cls) -> "Paginate[ModelT]":
+        return cls(bind=True)
+
+    @staticmethod
+    def params(page: int, page_size: int) -> dict[str, int]:
+        page = max(page, 1)
+        size = max(page_size, 1)
+        return {PAGE_OFFSET_PARAM: (page - 1) * size, PAGE_LIMIT_PARAM: size}
 
     def apply(self, stmt: Select[tuple[ModelT]]) -> Select[tuple[ModelT]]:
-        page = max(self.page, 1)
-        size = max(self.page_size, 1)
-        return stmt.offset((page - 1) * size).limit(size)
+        if self.bind:
+            return stmt.offset(bindparam(PAGE_OFFSET_PARAM)).limit(
+                bindparam(PAGE_LIMIT_PARAM)
+            )
+        params = self.params(self.page, self.page_size)
+        return stmt.offset(params[PAGE_OFFSET_PARAM]).limit(params[PAGE_LIMIT_PARAM])
+
+def _python_type(column: Any) -> Optional[type]:
+    try:
+        return column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return None
+
+@dataclass(frozen=True)
+class KeysetPaginate(Generic[ModelT]):
+    """Seek-based pagination on the ordering columns.
+
+    Replaces both ``OrderBy`` and ``Paginate``: the statement is ordered by
+    ``orders`` and filtered with ``WHERE (keys) < (cursor keys)`` instead of
+    ``OFFSET``, so every page costs the same.  One extra row is fetched to
+    detect whether a further page exists.
+
+    The sort keys must be non-null, unique in combination (end with the
+    primary key), and exposed under the same name on the read schema.
+    """
+
+    priority: int = 40
+    orders: tuple[Any, ...] = ()
+    cursor: Optional[str] = None
+    page_size: int = 20
+    _position: Optional[CursorPosition] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if not self.orders:
+            raise ValueError("KeysetPaginate requires at least one order column")
+        if self.cursor:
+            position = decode_cursor(self.cursor)
+            if len(position.values) != len(self.orders):
+                raise InvalidCursorError("cursor does not match the sort keys")
+            check_types(position, [_python_type(col) for col, _ in self._keys()])
+            object.__setattr__(self, "_position", position)
+
+    @classmethod
+    def of(
+        cls, *orders: Any, cursor: Optional[str] = None, page_size: int = 20
+    ) -> "KeysetPaginate[ModelT]":
+        return cls(orders=tuple(orders), cursor=cursor, page_size=page_size)
+
+    @property
+    def size(self) -> int:
+        return max(self.page_size, 1)
+
+    @property
+    def backwards(self) -> bool:
+        return self._position is not None and self._position.backwards
+
+    @property
+    def key_names(self) -> tuple[str, ...]:
+        return tuple(col.key for col, _ in self._keys())
+
+    def _keys(self) -> list[tuple[Any, bool]]:
+        keys = []
+        for order in self.orders:
+            modifier = getattr(order, "modifier", None)
+            if modifier is operators.desc_op:
+                keys.append((order.element, True))
+            elif modifier is operators.asc_op:
+                keys.append((order.element, False))
+            else:
+                keys.append((order, False))
+        return keys
+
+    def _seek(self, values: tuple[Any, ...]) -> Any:
+        # Walking backwards flips every comparison and every sort direction.
+        keys = [(col, desc != self.backwards) for col, desc in self._keys()]
+        if len({desc for _, desc in keys}) == 1:
+            cols = [col for col, _ in keys]
+            if len(cols) == 1:
+                lhs, rhs = cols[0], values[0]
+            else:
+                lhs, rhs = tuple_(*cols), tuple_(*values)
+            return lhs < rhs if keys[0][1] else lhs > rhs
+
+        # Mixed directions: (a < x) OR (a = x AND b > y) OR ...
+        clauses = []
+        for i, (col, desc) in enumerate(keys):
+            prefix = [c == v for (c, _), v in zip(keys[:i], values)]
+            clauses.append(and_(*prefix, col < values[i] if desc else col > values[i]))
+        return or_(*clauses)
+
+    def apply(self, stmt: Select[tuple[ModelT]]) -> Select[tuple[ModelT]]:
+        if self._position is not None:
+            stmt = stmt.where(self._seek(self._position.values))
+        order = [
+            col.desc() if desc != self.backwards else col.asc()
+            for col, desc in self._keys()
+        ]
+        return stmt.order_by(*order).limit(self.size + 1)
+
+    def paginate(
+        self,
+        rows: Sequence[Any],
+        key: Optional[Callable[[Any], tuple[Any, ...]]] = None,
+    ) -> tuple[list[Any], Optional[str], Optional[str]]:
+        """Trim the look-ahead row and build ``(items, next_cursor, prev_cursor)``.
+
+        ``rows`` must be the result of a statement built by :meth:`apply`.
+        ``key`` extracts the sort-key values from a row; by default they are
+        read as attributes named after the order columns.
+        """
+        if key is None:
+            names = self.key_names
+            key = lambda row: tuple(getattr(row, n) for n in names)  # noqa: E731
+
+        has_more = len(rows) > self.size
+        items = list(rows[: self.size])
+        if self.backwards:
+            items.reverse()
+        if not items:
+            return items, None, None
+
+        first, last = key(items[0]), key(items[-1])
+        if self.backwards:
+            next_cursor: Optional[str] = encode_cursor(last)
+            prev_cursor = encode_cursor(first, backwards=True) if has_more else None
+        else:
+            next_cursor = encode_cursor(last) if has_more else None
+            prev_cursor = (
+                encode_cursor(first, backwards=True)
+                if self._position is not None
+                else None
+            )
+        return items, next_cursor, prev_cursor
 
 @dataclass(frozen=True)
 class SelectInLoad(Generic[ModelT]):
@@ -54,4 +215,38 @@ class SelectInLoad(Generic[ModelT]):
         return cls(relationships=tuple(relationships))
 
     def apply(self, stmt: Select[tuple[ModelT]]) -> Select[tuple[ModelT]]:
-        return stmt.options(*(selectinload(r) for r in self.relationships))
\ No newline at end of file
+        return stmt.options(*(selectinload(r) for r in self.relationships))
+
+@dataclass(frozen=True)
+class JoinedLoad(Generic[ModelT]):
+    """Eager-load many-to-one relationships in the same query (LEFT OUTER JOIN).
+
+    Use ``SelectInLoad`` for collections: a joined collection multiplies rows.
+    """
+
+    priority: int = 20
+    relationships: tuple[Any, ...] = ()
+
+    @classmethod
+    def of(cls, *relationships: Any) -> "JoinedLoad[ModelT]":
+        return cls(relationships=tuple(relationships))
+
+    def apply(self, stmt: Select[tuple[ModelT]]) -> Select[tuple[ModelT]]:
+        return stmt.options(*(joinedload(r) for r in self.relationships))
+
+@dataclass(frozen=True)
+class RaiseLoad(Generic[ModelT]):
+    """Make the given relationships — all of them by default — raise on
+    access instead of lazy-loading one row at a time."""
+
+    priority: int = 20
+    relationships: tuple[Any, ...] = ()
+
+    @classmethod
+    def of(cls, *relationships: Any) -> "RaiseLoad[ModelT]":
+        return cls(relationships=tuple(relationships))
+
+    def apply(self, stmt: Select[tuple[ModelT]]) -> Select[tuple[ModelT]]:
+        if not self.relationships:
+            return stmt.options(raiseload("*"))
+        return stmt.options(*(raiseload(r) for r in self.relationships))
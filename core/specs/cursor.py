@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Sequence
+from uuid import UUID
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class CursorPosition:
+    """Decoded keyset position: the sort-key values of a boundary row."""
+
+    values: tuple[Any, ...]
+    backwards: bool = False
+
+
+# ---- value (de)serialization ----
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _load_value(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    if "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    if "d" in value:
+        return date.fromisoformat(value["d"])
+    if "dec" in value:
+        return Decimal(value["dec"])
+    if "uuid" in value:
+        return UUID(value["uuid"])
+    raise InvalidCursorError("unsupported cursor value")
+
+
+def _matches(value: Any, python_type: type) -> bool:
+    if isinstance(value, bool) and python_type is not bool:
+        return False  # bool is an int subclass; never a valid int key
+    if python_type is float:
+        return isinstance(value, (int, float))
+    if python_type is date:
+        return isinstance(value, date) and not isinstance(value, datetime)
+    return isinstance(value, python_type)
+
+
+# ---- public API ----
+
+
+def encode_cursor(values: Sequence[Any], *, backwards: bool = False) -> str:
+    """Encode sort-key values into an opaque, URL-safe cursor string."""
+    payload = {"k": [_dump_value(v) for v in values]}
+    if backwards:
+        payload["b"] = 1
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> CursorPosition:
+    """Decode a cursor produced by :func:`encode_cursor`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        keys = payload["k"]
+        if not isinstance(keys, list) or not keys:
+            raise InvalidCursorError("cursor has no key values")
+        return CursorPosition(
+            values=tuple(_load_value(v) for v in keys),
+            backwards=bool(payload.get("b", 0)),
+        )
+    except InvalidCursorError:
+        raise
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("malformed cursor") from e
+
+
+def check_types(position: CursorPosition, python_types: Sequence[Any]) -> None:
+    """Reject values that are not of their sort key's type.
+
+    ``python_types`` holds one type per key, ``None`` where it is unknown.
+    A cursor is client input: a wrong type would otherwise reach the
+    driver and fail there (a 500) instead of as a bad cursor.
+    """
+    for value, python_type in zip(position.values, python_types):
+        if python_type is not None and not _matches(value, python_type):
+            raise InvalidCursorError("cursor value does not match its sort key")
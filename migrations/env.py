@@ -11,6 +11,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.engine import URL
 
 from core.infrastructure.database.database import Base
+from core.infrastructure.database.models.outbox import OutboxModel
 from core.infrastructure.database.models.user import UserModel
 
 load_dotenv(dotenv_path=f"_env/dev.env", override=True)
@@ -0,0 +1,42 @@
+"""user live id partial index
+
+Revision ID: 3f8d2c61a7e4
+Revises: 7c1e4a2b9d30
+Create Date: 2026-10-17 14:05:22.640117+09:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3f8d2c61a7e4"
+down_revision: Union[str, Sequence[str], None] = "7c1e4a2b9d30"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE = sa.text("deleted_at IS NULL")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps the user table writable while the index builds; it
+    # cannot run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_live_id",
+            "user",
+            [sa.text("id DESC")],
+            postgresql_where=LIVE,
+            postgresql_concurrently=True,
+            sqlite_where=LIVE,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_live_id", table_name="user", postgresql_concurrently=True
+        )
@@ -0,0 +1,55 @@
+"""user email and created_at indexes
+
+Revision ID: 9a4e7f03c2b5
+Revises: 3f8d2c61a7e4
+Create Date: 2026-10-17 16:41:09.508362+09:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4e7f03c2b5"
+down_revision: Union[str, Sequence[str], None] = "3f8d2c61a7e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE = sa.text("deleted_at IS NULL")
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    The unique index fails if two live users share an email up to case;
+    resolve those first.  A failed CONCURRENTLY build leaves an INVALID
+    index behind: drop it before retrying.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ux_user_email_lower",
+            "user",
+            [sa.text("lower(email)")],
+            unique=True,
+            postgresql_where=LIVE,
+            postgresql_concurrently=True,
+            sqlite_where=LIVE,
+        )
+        op.create_index(
+            "ix_user_created_at",
+            "user",
+            ["created_at"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_created_at", table_name="user", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ux_user_email_lower", table_name="user", postgresql_concurrently=True
+        )
@@ -0,0 +1,141 @@
+"""Production entry point: one event loop per CPU core.
+
+``gunicorn`` mode (the default when gunicorn is installed) imports
+``server.app`` once in the master (``preload_app``), so the container and
+model metadata are built once and shared copy-on-write, then forks
+``--workers`` uvicorn workers.  Engines created before the fork hand each
+worker a fresh pool (see ``build_engine``), so no connection is ever
+shared between processes.  gunicorn also restarts crashed workers.
+
+``uvicorn`` mode uses uvicorn's own supervisor.  It spawns rather than
+forks, so every worker imports the app itself — no preload.
+
+Both use uvloop and httptools when they are installed, else asyncio / h11.
+"""
+import argparse
+import importlib.util
+import logging
+import os
+
+from dotenv import load_dotenv
+
+logger = logging.getLogger("run_server")
+
+APP = "server.app:app"
+
+
+def default_workers() -> int:
+    """``WEB_CONCURRENCY`` or one worker per available core."""
+    if "WEB_CONCURRENCY" in os.environ:
+        return max(int(os.environ["WEB_CONCURRENCY"]), 1)
+    try:
+        cores = len(os.sched_getaffinity(0))  # honours CPU pinning / cgroups cpusets
+    except AttributeError:
+        cores = os.cpu_count() or 1
+    return max(cores, 1)
+
+
+def event_loop() -> str:
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def http_parser() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+def run_uvicorn(args: argparse.Namespace) -> None:
+    import uvicorn
+
+    uvicorn.run(
+        APP,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop=event_loop(),
+        http=http_parser(),
+        backlog=args.backlog,
+        timeout_keep_alive=args.keep_alive,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        proxy_headers=True,
+        forwarded_allow_ips=args.forwarded_allow_ips,
+        access_log=args.access_log,
+    )
+
+
+def run_gunicorn(args: argparse.Namespace) -> None:
+    from gunicorn.app.base import BaseApplication
+    from uvicorn.workers import UvicornWorker
+
+    class Worker(UvicornWorker):
+        CONFIG_KWARGS = {
+            "loop": event_loop(),
+            "http": http_parser(),
+            "proxy_headers": True,
+            "forwarded_allow_ips": args.forwarded_allow_ips,
+        }
+
+    class Application(BaseApplication):
+        def load_config(self) -> None:
+            options = {
+                "bind": f"{args.host}:{args.port}",
+                "workers": args.workers,
+                "worker_class": Worker,
+                "preload_app": True,
+                "backlog": args.backlog,
+                "keepalive": args.keep_alive,
+                "graceful_timeout": args.graceful_timeout,
+                "timeout": args.worker_timeout,
+                # recycle workers to bound slow leaks; jitter avoids a thundering herd
+                "max_requests": args.max_requests,
+                "max_requests_jitter": args.max_requests // 10,
+                "accesslog": "-" if args.access_log else None,
+            }
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            from server.app import app
+
+            return app
+
+    Application().run()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--env", required=False, default="prod")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument(
+        "--mode",
+        choices=("gunicorn", "uvicorn"),
+        default="gunicorn" if importlib.util.find_spec("gunicorn") else "uvicorn",
+    )
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--keep-alive", type=int, default=5, help="seconds")
+    parser.add_argument("--graceful-timeout", type=int, default=30, help="seconds")
+    parser.add_argument("--worker-timeout", type=int, default=60, help="seconds")
+    parser.add_argument("--max-requests", type=int, default=0, help="0: never recycle")
+    parser.add_argument("--forwarded-allow-ips", default="127.0.0.1")
+    parser.add_argument("--access-log", action="store_true")
+    args = parser.parse_args()
+
+    load_dotenv(dotenv_path=f"_env/{args.env}.env", override=True)
+    logging.basicConfig(level=logging.INFO)
+    logger.info(
+        "starting %d %s workers (loop=%s, http=%s)",
+        args.workers,
+        args.mode,
+        event_loop(),
+        http_parser(),
+    )
+
+    if args.mode == "gunicorn":
+        run_gunicorn(args)
+    else:
+        run_uvicorn(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,35 @@
 # -*- coding: utf-8 -*-
+import logging
+import time
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from core.infrastructure.database.instrumentation import QueryTimingMiddleware
+from core.infrastructure.database.query_audit import QueryAuditMiddleware, auditor
+from core.infrastructure.database.unit_of_work import SESSION_SCOPES, UnitOfWorkMiddleware
+from core.infrastructure.metrics import registry
 from server.infrastructure.di.container import ServerContainer
-from server.application.controllers.user_controller import router as user_router
+from server.application.controllers import user_controller
+from server.application.controllers.responses import DtoJSONResponse
+from server.application.controllers.metrics_controller import router as metrics_router
+
+logger = logging.getLogger(__name__)
+
+startup_seconds = registry.gauge(
+    "app_startup_seconds", "Time spent per startup phase in this process", ("phase",)
+)
+
+# Only modules with ``Provide[...]`` markers; wiring a whole package imports
+# and scans every module in it.
+WIRED_MODULES = [user_controller]
 
 container = None
 
 
 def create_container():
     container = ServerContainer()
-    container.wire(packages=["server.application.controllers"])
+    container.wire(modules=WIRED_MODULES)
 
     container.config.from_yaml("./config.yml")
 
@@ -18,12 +38,73 @@ def create_container():
 
 def create_app():
     global container
+    started = time.perf_counter()
     container = create_container()
+    database = container.database
+    warmup = container.warmup if container.config.database.warmup.enabled() else None
+    hook_runner = container.hook_runner
+    outbox_relay = (
+        container.outbox_relay if container.config.outbox.relay.enabled() else None
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        lifespan_started = time.perf_counter()
+        # Engines are built here, not at import or on the first request, and
+        # connect on first checkout unless the warm-up opens the pool now.
+        database()
+        if warmup is not None:
+            report = await warmup()
+            startup_seconds.set(report.seconds, phase="warmup")
+        if outbox_relay is not None:
+            outbox_relay().start()
+        startup_seconds.set(time.perf_counter() - lifespan_started, phase="lifespan")
+        logger.info(
+            "startup: create_app %.0f ms, lifespan %.0f ms",
+            startup_seconds.value(phase="create_app") * 1e3,
+            startup_seconds.value(phase="lifespan") * 1e3,
+        )
+        yield
+        if outbox_relay is not None:
+            await outbox_relay().stop()
+        # let @deferred hooks queued by the last requests finish
+        await hook_runner().stop()
+        await database().dispose()
+        database.reset()
+
+    # DTO-returning routes use DtoRoute (see controllers/responses.py); this
+    # makes every other JSON response render with pydantic-core as well.
+    app = FastAPI(
+        docs_url="/docs", default_response_class=DtoJSONResponse, lifespan=lifespan
+    )
+    session_scope = container.config.database.session_scope()
+    if session_scope not in SESSION_SCOPES:
+        raise ValueError(
+            f"database.session_scope must be one of {SESSION_SCOPES}, got {session_scope!r}"
+        )
+    if session_scope == "request":
+        app.add_middleware(UnitOfWorkMiddleware)
+    instrumentation = container.config.database.instrumentation
+    auditor.configure(
+        instrumentation.n_plus_one(), int(instrumentation.n_plus_one_threshold())
+    )
+    if auditor.enabled:
+        app.add_middleware(QueryAuditMiddleware)
+    # added last = outermost, so the timing covers the unit-of-work commit
+    if instrumentation.server_timing():
+        app.add_middleware(QueryTimingMiddleware)
 
-    app = FastAPI(docs_url="/docs")
-    app.include_router(user_router)
+    app.include_router(user_controller.router)
+    app.include_router(metrics_router)
 
+    startup_seconds.set(time.perf_counter() - started, phase="create_app")
     return app
 
 
-app = create_app()
+def __getattr__(name: str):
+    # ``server.app:app`` is built on first access rather than at import, so
+    # importing this module for create_app() (tests, tools) builds nothing.
+    if name == "app":
+        app = globals()["app"] = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""HTTP conditional requests (RFC 9110 §13): ETag / Last-Modified validators.
+
+Single entities get a weak ETag and Last-Modified from ``(id, updated_at)``.
+A revalidation (``has_preconditions``) checks them with a one-column
+pre-check query before the DTO is built; a plain GET reads the entity
+once and takes them from it.  Lists get a strong ETag hashed from the serialized page, so any
+change in membership, order, content or total changes it.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response
+from pydantic_core import to_json
+
+# Clients and CDNs may store responses but must revalidate before reuse.
+CACHE_CONTROL = "no-cache"
+
+
+def _utc(value: datetime) -> datetime:
+    # naive timestamps from the database are UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def entity_validators(obj_id: Any, updated_at: datetime) -> dict[str, str]:
+    """``ETag`` / ``Last-Modified`` / ``Cache-Control`` headers for one entity."""
+    stamp = _utc(updated_at)
+    micros = int(stamp.timestamp() * 1_000_000)
+    return {
+        "ETag": f'W/"{obj_id}-{micros:x}"',
+        "Last-Modified": format_datetime(stamp.replace(microsecond=0), usegmt=True),
+        "Cache-Control": CACHE_CONTROL,
+    }
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def has_preconditions(request: Request) -> bool:
+    """True when the request carries a validator worth pre-checking."""
+    headers = request.headers
+    return "if-none-match" in headers or "if-modified-since" in headers
+
+
+def is_not_modified(request: Request, validators: dict[str, str]) -> bool:
+    """True when the request's preconditions say the client copy is current.
+
+    ``If-None-Match`` (weak comparison) takes precedence; ``If-Modified-Since``
+    is only consulted without it and when ``Last-Modified`` is known.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        etag = _opaque(validators["ETag"])
+        return any(_opaque(tag) == etag for tag in if_none_match.split(","))
+
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = validators.get("Last-Modified")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return parsedate_to_datetime(last_modified) <= since
+
+
+def not_modified(validators: dict[str, str]) -> Response:
+    return Response(status_code=304, headers=validators)
+
+
+def conditional_json(request: Request, content: Any) -> Response:
+    """Serialize ``content`` once, tag it with its hash, and honour ``If-None-Match``."""
+    body = to_json(content)
+    validators = {
+        "ETag": f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+        "Cache-Control": CACHE_CONTROL,
+    }
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+    return Response(body, media_type="application/json", headers=validators)
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+import csv
+import functools
+import inspect
+import io
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Callable, get_args, get_origin
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from core.application.dtos.base import BaseResponse
+
+
+class DtoJSONResponse(JSONResponse):
+    """JSON response for DTOs the service layer has already validated.
+
+    Returning one from an endpoint bypasses FastAPI's ``response_model``
+    re-validation and ``jsonable_encoder`` pass; pydantic-core serializes
+    the models (or lists of them) straight to bytes.  Keep ``response_model``
+    on the route so the OpenAPI schema stays accurate.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+class DtoRoute(APIRoute):
+    """Route that sends trusted DTOs straight to ``DtoJSONResponse``.
+
+    When an async endpoint returns exactly its ``response_model`` — a
+    ``BaseResponse`` of that class (generics parametrized alike:
+    ``Page[UserDto]``, not a bare ``Page``), or a list whose items are all
+    of the declared item class — FastAPI's second validation pass and
+    ``jsonable_encoder`` are skipped.  Anything else (dicts, ``None``, a
+    different model that ``response_model`` is meant to filter, routes
+    using ``response_model_include``/``exclude``…) takes the normal path.
+
+    Usage::
+
+        router = APIRouter(prefix="/users", route_class=DtoRoute)
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        if inspect.iscoroutinefunction(endpoint):
+            endpoint = self._wrap(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+        self._fast_path = (
+            self.response_model_include is None
+            and self.response_model_exclude is None
+            and self.response_model_by_alias
+            and not self.response_model_exclude_unset
+            and not self.response_model_exclude_defaults
+            and not self.response_model_exclude_none
+        )
+
+    def _wrap(self, endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(endpoint)
+        async def run(*args: Any, **kwargs: Any) -> Any:
+            result = await endpoint(*args, **kwargs)
+            if self._fast_path and self._is_trusted(result):
+                return DtoJSONResponse(result, status_code=self.status_code or 200)
+            return result
+
+        return run
+
+    def _is_trusted(self, result: Any) -> bool:
+        model = self.response_model
+        if isinstance(result, BaseResponse):
+            return type(result) is model
+        if isinstance(result, list) and get_origin(model) is list:
+            (item,) = get_args(model) or (None,)
+            return isinstance(item, type) and all(type(x) is item for x in result)
+        return False
+
+
+# ---- streaming encoders (for StreamingResponse) ----
+#
+# Rows are buffered into ``batch_size`` chunks so each write to the socket
+# carries many rows.  The source iterator is always closed, which releases
+# its database session even when the client disconnects mid-stream.
+
+
+async def ndjson_stream(
+    items: AsyncIterator[BaseModel], *, batch_size: int = 500
+) -> AsyncIterator[bytes]:
+    """Encode ``items`` as newline-delimited JSON."""
+    buffer: list[bytes] = []
+    async with aclosing(items):
+        async for item in items:
+            buffer.append(to_json(item))
+            if len(buffer) >= batch_size:
+                yield b"\n".join(buffer) + b"\n"
+                buffer.clear()
+    if buffer:
+        yield b"\n".join(buffer) + b"\n"
+
+
+async def csv_stream(
+    items: AsyncIterator[BaseModel],
+    schema: type[BaseModel],
+    *,
+    batch_size: int = 500,
+) -> AsyncIterator[bytes]:
+    """Encode ``items`` as CSV with a header row of ``schema``'s fields."""
+    fields = list(schema.model_fields)
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(fields)
+    rows = 0
+    async with aclosing(items):
+        async for item in items:
+            values = item.model_dump(mode="json")
+            writer.writerow(
+                ["" if values[f] is None else values[f] for f in fields]
+            )
+            rows += 1
+            if rows % batch_size == 0:
+                yield out.getvalue().encode()
+                out.seek(0)
+                out.truncate()
+    yield out.getvalue().encode()
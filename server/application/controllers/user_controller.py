@@ -1,16 +1,57 @@
 from dependency_injector.wiring import Provide, inject
-from typing import List
-from fastapi import APIRouter, Depends, Query
+from typing import Dict, List, Literal, Optional
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
 
+from core.application.dtos.base import CursorPage, Page
 from core.application.dtos.user_dto import (
     CreateUserRequestDto,
     UpdateUserRequestDto,
     UserResponseDto,
 )
+from core.domain.repositories.base import ConflictError
+from core.specs.cursor import InvalidCursorError
+from server.application.controllers.conditional import (
+    conditional_json,
+    entity_validators,
+    has_preconditions,
+    is_not_modified,
+    not_modified,
+)
+from server.application.controllers.responses import (
+    DtoJSONResponse,
+    DtoRoute,
+    csv_stream,
+    ndjson_stream,
+)
 from server.application.services.user_service import UserService
 from server.infrastructure.di.container import ServerContainer
 
-router = APIRouter(prefix="/users", tags=["users"])
+router = APIRouter(prefix="/users", tags=["users"], route_class=DtoRoute)
+
+EMAIL_TAKEN = "A user with this email already exists"
+
+
+@inject
+async def page_size_param(
+    page_size: int = Query(10, ge=1),
+    max_page_size: int = Depends(Provide[ServerContainer.config.api.max_page_size]),
+) -> int:
+    """``page_size`` query parameter, capped at ``api.max_page_size``."""
+    if page_size > max_page_size:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "less_than_equal",
+                    "loc": ("query", "page_size"),
+                    "msg": f"Input should be less than or equal to {max_page_size}",
+                    "input": page_size,
+                    "ctx": {"le": max_page_size},
+                }
+            ]
+        )
+    return page_size
 
 
 @router.post("/", response_model=UserResponseDto)
@@ -19,36 +60,178 @@ async def create_user(
     dto: CreateUserRequestDto,
     user_service: UserService = Depends(Provide[ServerContainer.user_service]),
 ):
-    return await user_service.create(dto=dto)
+    try:
+        return await user_service.create(dto=dto)
+    except ConflictError:
+        raise HTTPException(status_code=409, detail=EMAIL_TAKEN)
+
+
+@router.post("/bulk", response_model=List[UserResponseDto])
+@inject
+async def create_users(
+    dtos: List[CreateUserRequestDto],
+    user_service: UserService = Depends(Provide[ServerContainer.user_service]),
+):
+    try:
+        return await user_service.create_many(dtos=dtos)
+    except ConflictError:
+        raise HTTPException(status_code=409, detail=EMAIL_TAKEN)
+
+
+@router.put("/bulk", response_model=List[UserResponseDto])
+@inject
+async def update_users(
+    updates: Dict[int, UpdateUserRequestDto] = Body(...),
+    user_service: UserService = Depends(Provide[ServerContainer.user_service]),
+):
+    try:
+        return await user_service.update_many(updates=updates)
+    except ConflictError:
+        raise HTTPException(status_code=409, detail=EMAIL_TAKEN)
+
+
+@router.delete("/bulk", response_model=List[int])
+@inject
+async def delete_users(
+    ids: List[int] = Query(...),
+    user_service: UserService = Depends(Provide[ServerContainer.user_service]),
+):
+    return await user_service.delete_many(obj_ids=ids)
 
 
 @router.get("/", response_model=List[UserResponseDto])
 @inject
 async def get_users(
+    request: Request,
     page: int = Query(1, ge=1),
-    page_size: int = Query(10, ge=1),
+    page_size: int = Depends(page_size_param),
+    include_deleted: bool = Query(False),
+    user_service: UserService = Depends(Provide[ServerContainer.user_service]),
+):
+    users = await user_service.get_users(
+        page=page, page_size=page_size, include_deleted=include_deleted
+    )
+    return conditional_json(request, users)
+
+
+@router.get("/export", response_class=StreamingResponse)
+@inject
+async def export_users(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    active_only: bool = Query(False),
+    include_deleted: bool = Query(False),
+    user_service: UserService = Depends(Provide[ServerContainer.user_service]),
+):
+    users = user_service.export_users(
+        active_only=active_only, include_deleted=include_deleted
+    )
+    if format == "csv":
+        return StreamingResponse(
+            csv_stream(users, UserResponseDto),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="users.csv"'},
+        )
+    return StreamingResponse(ndjson_stream(users), media_type="application/x-ndjson")
+
+
+@router.get("/paged", response_model=Page[UserResponseDto])
+@inject
+async def get_users_paged(
+    request: Request,
+    page: int = Query(1, ge=1),
+    page_size: int = Depends(page_size_param),
+    approximate_total: bool = Query(False),
+    include_deleted: bool = Query(False),
+    user_service: UserService = Depends(Provide[ServerContainer.user_service]),
+):
+    users = await user_service.get_users_paged(
+        page=page,
+        page_size=page_size,
+        approximate=approximate_total,
+        include_deleted=include_deleted,
+    )
+    return conditional_json(request, users)
+
+
+@router.get("/cursor", response_model=CursorPage[UserResponseDto])
+@inject
+async def get_users_by_cursor(
+    request: Request,
+    cursor: Optional[str] = Query(None),
+    page_size: int = Depends(page_size_param),
+    include_deleted: bool = Query(False),
     user_service: UserService = Depends(Provide[ServerContainer.user_service]),
 ):
-    return await user_service.get_users(page=page, page_size=page_size)
+    try:
+        users = await user_service.get_users_page(
+            cursor=cursor, page_size=page_size, include_deleted=include_deleted
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return conditional_json(request, users)
 
 
 @router.get("/activate-user", response_model=List[UserResponseDto])
 @inject
 async def get_active_users(
+    request: Request,
     page: int = Query(1, ge=1),
-    page_size: int = Query(10, ge=1),
+    page_size: int = Depends(page_size_param),
+    user_service: UserService = Depends(Provide[ServerContainer.user_service]),
+):
+    users = await user_service.get_active_users(page=page, page_size=page_size)
+    return conditional_json(request, users)
+
+
+@router.get("/activate-user/paged", response_model=Page[UserResponseDto])
+@inject
+async def get_active_users_paged(
+    request: Request,
+    page: int = Query(1, ge=1),
+    page_size: int = Depends(page_size_param),
     user_service: UserService = Depends(Provide[ServerContainer.user_service]),
 ):
-    return await user_service.get_active_users(page=page, page_size=page_size)
+    users = await user_service.get_active_users_paged(page=page, page_size=page_size)
+    return conditional_json(request, users)
+
+
+@router.get("/activate-user/cursor", response_model=CursorPage[UserResponseDto])
+@inject
+async def get_active_users_by_cursor(
+    request: Request,
+    cursor: Optional[str] = Query(None),
+    page_size: int = Depends(page_size_param),
+    user_service: UserService = Depends(Provide[ServerContainer.user_service]),
+):
+    try:
+        users = await user_service.get_active_users_page(
+            cursor=cursor, page_size=page_size
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return conditional_json(request, users)
 
 
 @router.get("/{user_id}", response_model=UserResponseDto)
 @inject
 async def get_user(
+    request: Request,
     user_id: int,
     user_service: UserService = Depends(Provide[ServerContainer.user_service]),
 ):
-    return await user_service.get_by_id(obj_id=user_id)
+    if has_preconditions(request):
+        # Pre-check reads only updated_at, so a revalidation hit builds no DTO.
+        version = await user_service.get_version(obj_id=user_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        validators = entity_validators(user_id, version)
+        if is_not_modified(request, validators):
+            return not_modified(validators)
+
+    user = await user_service.get_by_id(obj_id=user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return DtoJSONResponse(user, headers=entity_validators(user.id, user.updated_at))
 
 
 @router.put("/{user_id}", response_model=UserResponseDto)
@@ -58,7 +241,10 @@ async def update_user(
     dto: UpdateUserRequestDto,
     user_service: UserService = Depends(Provide[ServerContainer.user_service]),
 ):
-    return await user_service.update_by_id(obj_id=user_id, dto=dto)
+    try:
+        return await user_service.update_by_id(obj_id=user_id, dto=dto)
+    except ConflictError:
+        raise HTTPException(status_code=409, detail=EMAIL_TAKEN)
 
 
 @router.delete("/{user_id}")
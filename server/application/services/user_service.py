@@ -1,42 +1,157 @@
-from typing import Callable, List, cast
+from typing import Any, AsyncIterator, Callable, List, Optional, cast
 
 from dependency_injector.providers import Configuration
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.application.dtos.base import CursorPage, Page
 from core.application.dtos.user_dto import (
     CreateUserRequestDto,
     UpdateUserRequestDto,
     UserResponseDto,
 )
 from core.application.services.base_service import BaseService
-from server.infrastructure.repositories.user_repository import UserRepository
+from core.infrastructure.background import HookRunner
+from core.infrastructure.cache.entity_cache import EntityCache
+from core.infrastructure.concurrency import SingleFlight
+from server.infrastructure.repositories.user_repository import (
+    ACTIVE_EXPORT_SPEC,
+    EXPORT_SPEC,
+    UserRepository,
+)
 
 
 class UserService(
     BaseService[CreateUserRequestDto, UserResponseDto, UpdateUserRequestDto]
 ):
+    event_topic = "User"
+
     def __init__(
         self,
         session_factory,
         repo_class: Callable[[AsyncSession], UserRepository],
         config: Configuration,
+        cache: Optional[EntityCache[UserResponseDto]] = None,
+        coalescer: Optional[SingleFlight] = None,
+        hooks: Optional[HookRunner] = None,
+        outbox: bool = False,
     ) -> None:
-        super().__init__(session_factory=session_factory, repo_class=repo_class)
+        super().__init__(
+            session_factory=session_factory,
+            repo_class=repo_class,
+            cache=cache,
+            coalescer=coalescer,
+            hooks=hooks,
+            outbox=outbox,
+        )
         self._config = config
 
     def _create_repo(self, session: AsyncSession) -> UserRepository:
         return cast(UserRepository, self._repo_class(session))
 
+    def event_payload(self, dto: UserResponseDto) -> dict[str, Any]:
+        # events leave the service boundary: never publish credentials
+        return dto.model_dump(mode="json", exclude={"password_hash"})
+
     # ---- domain-specific operations ----
 
+    async def get_by_email(self, email: str) -> Optional[UserResponseDto]:
+        return await self._read(
+            "get_by_email", (email.lower(),), lambda repo: repo.get_by_email(email)
+        )
+
     async def get_active_users(
         self, page: int, page_size: int
     ) -> List[UserResponseDto]:
-        async with self._session_factory() as session:
-            repo = self._create_repo(session)
-            return await repo.get_active_users(page=page, page_size=page_size)
-
-    async def get_users(self, page: int, page_size: int) -> List[UserResponseDto]:
-        async with self._session_factory() as session:
-            repo = self._create_repo(session)
-            return await repo.get_users(page=page, page_size=page_size)
+        return await self._read(
+            "get_active_users",
+            (page, page_size),
+            lambda repo: repo.get_active_users(page=page, page_size=page_size),
+        )
+
+    async def get_users(
+        self, page: int, page_size: int, *, include_deleted: bool = False
+    ) -> List[UserResponseDto]:
+        return await self._read(
+            "get_users",
+            (page, page_size, include_deleted),
+            lambda repo: repo.get_users(
+                page=page, page_size=page_size, include_deleted=include_deleted
+            ),
+        )
+
+    def export_users(
+        self,
+        *,
+        active_only: bool = False,
+        include_deleted: bool = False,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[UserResponseDto]:
+        """Every user in id order, streamed from the database.
+
+        Soft-deleted users only with ``include_deleted``; ``active_only``
+        leaves them out regardless.
+        """
+        include_deleted = include_deleted and not active_only
+        return self.stream_list(
+            spec=EXPORT_SPEC if include_deleted else ACTIVE_EXPORT_SPEC,
+            chunk_size=chunk_size,
+            include_deleted=include_deleted,
+        )
+
+    async def get_users_paged(
+        self,
+        page: int,
+        page_size: int,
+        *,
+        approximate: bool = False,
+        include_deleted: bool = False,
+    ) -> Page[UserResponseDto]:
+        items, total = await self._read(
+            "get_users_paged",
+            (page, page_size, approximate, include_deleted),
+            lambda repo: repo.get_users_with_total(
+                page=page,
+                page_size=page_size,
+                approximate=approximate,
+                include_deleted=include_deleted,
+            ),
+        )
+        return Page[UserResponseDto](
+            items=items, total=total, page=page, page_size=page_size
+        )
+
+    async def get_active_users_paged(
+        self, page: int, page_size: int
+    ) -> Page[UserResponseDto]:
+        items, total = await self._read(
+            "get_active_users_paged",
+            (page, page_size),
+            lambda repo: repo.get_active_users_with_total(
+                page=page, page_size=page_size
+            ),
+        )
+        return Page[UserResponseDto](
+            items=items, total=total, page=page, page_size=page_size
+        )
+
+    async def get_active_users_page(
+        self, cursor: Optional[str], page_size: int
+    ) -> CursorPage[UserResponseDto]:
+        return await self._read(
+            "get_active_users_page",
+            (cursor, page_size),
+            lambda repo: repo.get_active_users_page(
+                cursor=cursor, page_size=page_size
+            ),
+        )
+
+    async def get_users_page(
+        self, cursor: Optional[str], page_size: int, *, include_deleted: bool = False
+    ) -> CursorPage[UserResponseDto]:
+        return await self._read(
+            "get_users_page",
+            (cursor, page_size, include_deleted),
+            lambda repo: repo.get_users_page(
+                cursor=cursor, page_size=page_size, include_deleted=include_deleted
+            ),
+        )
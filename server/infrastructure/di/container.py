@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 from dependency_injector import providers
 
+from core.application.dtos.user_dto import UserResponseDto
+from core.infrastructure.cache.entity_cache import build_entity_cache
 from core.infrastructure.database.session import ManagedSession
+from core.infrastructure.database.warmup import warm_up
 from core.infrastructure.di.container import CoreContainer
 from server.application.services.user_service import UserService
 from server.infrastructure.repositories.user_repository import UserRepository
@@ -11,6 +14,26 @@ class ServerContainer(CoreContainer):
     session_factory = providers.Factory(
         ManagedSession,
         session_maker=CoreContainer.database.provided.session_maker,
+        read_session_maker=CoreContainer.database.provided.read_session_maker,
+        read_your_writes_window=CoreContainer.database.provided.read_your_writes_window,
+    )
+
+    user_cache = providers.Singleton(
+        build_entity_cache,
+        backend=CoreContainer.cache_backend,
+        schema=UserResponseDto,
+        namespace="user",
+        ttl=CoreContainer.config.cache.ttl,
+    )
+
+    # repositories whose warm_up() runs on every pooled connection at startup
+    warmup = providers.Callable(
+        warm_up,
+        database=CoreContainer.database,
+        repositories=[UserRepository],
+        connections=CoreContainer.config.database.warmup.connections,
+        prepare=CoreContainer.config.database.warmup.prepare,
+        timeout=CoreContainer.config.database.warmup.timeout,
     )
 
     user_service = providers.Factory(
@@ -18,4 +41,8 @@ class ServerContainer(CoreContainer):
         session_factory=session_factory.provider,
         repo_class=UserRepository,
         config=CoreContainer.config,
+        cache=user_cache,
+        coalescer=CoreContainer.read_coalescer,
+        hooks=CoreContainer.hook_runner,
+        outbox=CoreContainer.config.outbox.enabled,
     )
@@ -1,5 +1,8 @@
-from typing import Type
+from typing import Optional, Type
 
+from sqlalchemy import func
+
+from core.application.dtos.base import CursorPage
 from core.application.dtos.user_dto import (
     CreateUserRequestDto,
     UpdateUserRequestDto,
@@ -8,7 +11,29 @@ from core.application.dtos.user_dto import (
 from core.infrastructure.database.models.user import UserModel
 from core.infrastructure.repositories.base_repository import SQLAlchemyRepository
 from core.specs.base import SpecChain
-from core.specs.common import OrderBy, Paginate, Where
+from core.specs.common import KeysetPaginate, OrderBy, Paginate
+
+# Built once: page and size are bind parameters (see ``Paginate.params``).
+USERS_SPEC: SpecChain[UserModel] = SpecChain(
+    [OrderBy.of(UserModel.id.desc()), Paginate.bound()],
+    cacheable=True,
+    name="users",
+)
+# Soft-deleted rows are filtered by the repository itself (``soft_delete_column``),
+# so "active" lists need no WHERE of their own; the "all users" lists only read
+# deleted rows through ``including_deleted()`` when asked to.  Both keep
+# ``id DESC`` so the live listing can walk the partial index ``ix_user_live_id``.
+ACTIVE_USERS_SPEC: SpecChain[UserModel] = SpecChain(
+    [OrderBy.of(UserModel.id.desc()), Paginate.bound()],
+    cacheable=True,
+    name="active_users",
+)
+EXPORT_SPEC: SpecChain[UserModel] = SpecChain(
+    [OrderBy.of(UserModel.id)], cacheable=True, name="export"
+)
+ACTIVE_EXPORT_SPEC: SpecChain[UserModel] = SpecChain(
+    [OrderBy.of(UserModel.id)], cacheable=True, name="active_export"
+)
 
 
 class UserRepository(
@@ -24,29 +49,85 @@ class UserRepository(
     def read_schema(self) -> Type[UserResponseDto]:
         return UserResponseDto
 
+    @property
+    def fast_mapping(self) -> bool:
+        return True
+
+    @property
+    def soft_delete_column(self) -> Optional[str]:
+        return "deleted_at"
+
+    async def warm_up(self) -> int:
+        # one-row pages: the statements are the same for any page size
+        await self.get_active_users(page=1, page_size=1)
+        await self.get_users(page=1, page_size=1, include_deleted=True)
+        await self.get_active_users_page(cursor=None, page_size=1)
+        await self.get_by_email("")
+        return await super().warm_up() + 4
+
     # ---- domain-specific queries ----
 
-    def _users_spec(self, page: int, page_size: int) -> SpecChain[UserModel]:
-        return SpecChain(
-            [
-                OrderBy.of(self.model.id.desc()),
-                Paginate(page=page, page_size=page_size),
-            ]
+    def _users_keyset(
+        self, cursor: Optional[str], page_size: int
+    ) -> KeysetPaginate[UserModel]:
+        return KeysetPaginate.of(
+            self.model.id.desc(), cursor=cursor, page_size=page_size
         )
 
-    def _active_users_spec(self, page: int, page_size: int) -> SpecChain[UserModel]:
-        return SpecChain(
-            [
-                Where.of(self.model.deleted_at.is_(None)),
-                OrderBy.of(self.model.id.desc()),
-                Paginate(page=page, page_size=page_size),
-            ]
-        )
+    def _listing(
+        self, include_deleted: bool
+    ) -> SQLAlchemyRepository[
+        UserModel, CreateUserRequestDto, UserResponseDto, UpdateUserRequestDto
+    ]:
+        return self.including_deleted() if include_deleted else self
+
+    async def get_by_email(self, email: str) -> Optional[UserResponseDto]:
+        """Case-insensitive lookup on the live row (``ux_user_email_lower``)."""
+        return await self.get_by_field(func.lower(self.model.email), func.lower(email))
 
     async def get_active_users(
         self, page: int, page_size: int
     ) -> list[UserResponseDto]:
-        return await self.get_list(spec=self._active_users_spec(page, page_size))
+        return await self.get_list(
+            spec=ACTIVE_USERS_SPEC, params=Paginate.params(page, page_size)
+        )
+
+    async def get_users(
+        self, page: int, page_size: int, *, include_deleted: bool = False
+    ) -> list[UserResponseDto]:
+        return await self._listing(include_deleted).get_list(
+            spec=USERS_SPEC, params=Paginate.params(page, page_size)
+        )
+
+    async def get_users_with_total(
+        self,
+        page: int,
+        page_size: int,
+        *,
+        approximate: bool = False,
+        include_deleted: bool = False,
+    ) -> tuple[list[UserResponseDto], int]:
+        return await self._listing(include_deleted).get_page_with_total(
+            spec=USERS_SPEC,
+            params=Paginate.params(page, page_size),
+            approximate=approximate,
+        )
+
+    async def get_active_users_with_total(
+        self, page: int, page_size: int
+    ) -> tuple[list[UserResponseDto], int]:
+        return await self.get_page_with_total(
+            spec=ACTIVE_USERS_SPEC, params=Paginate.params(page, page_size)
+        )
+
+    async def get_active_users_page(
+        self, cursor: Optional[str], page_size: int
+    ) -> CursorPage[UserResponseDto]:
+        return await self.get_page(self._users_keyset(cursor, page_size))
 
-    async def get_users(self, page: int, page_size: int) -> list[UserResponseDto]:
-        return await self.get_list(spec=self._users_spec(page, page_size))
+    async def get_users_page(
+        self, cursor: Optional[str], page_size: int, *, include_deleted: bool = False
+    ) -> CursorPage[UserResponseDto]:
+        return await self._listing(include_deleted).get_page(
+            self._users_keyset(cursor, page_size)
+        )
@@ -0,0 +1,128 @@
+"""Read query plans: which indexes a statement uses, which tables it scans.
+
+For tests that pin a query to its index::
+
+    plan = await explain(conn, stmt)
+    assert "ux_user_email_lower" in plan.indexes, plan
+
+or ``await assert_uses_index(conn, stmt, "ux_user_email_lower")``.
+
+Works on PostgreSQL (``EXPLAIN (FORMAT JSON)``) and on SQLite
+(``EXPLAIN QUERY PLAN``), the local stand-in the test suite runs on.  On a
+handful of test rows PostgreSQL rightly prefers a sequential scan, so
+``explain`` turns ``enable_seqscan`` off for the statement's transaction by
+default: the question a test asks is whether the index *can* serve the
+query, not whether it wins on an empty table.  Not for production code.
+"""
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Optional, Sequence, Union
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.sql import ClauseElement
+
+_PG_INDEX_NODES = ("Index Scan", "Index Only Scan", "Bitmap Index Scan")
+_SQLITE_INDEX = re.compile(r"USING (?:COVERING )?INDEX (\w+)")
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)")
+
+
+@dataclass
+class QueryPlan:
+    """Indexes used and tables read in full by one statement."""
+
+    lines: list[str]
+    indexes: set[str] = field(default_factory=set)
+    seq_scans: set[str] = field(default_factory=set)
+
+    def __str__(self) -> str:
+        return "\n".join(self.lines)
+
+
+async def explain(
+    conn: Union[AsyncConnection, AsyncSession],
+    statement: Union[str, ClauseElement],
+    params: Union[Sequence[Any], Mapping[str, Any], None] = None,
+    *,
+    seqscan: bool = False,
+) -> QueryPlan:
+    """Plan ``statement`` without running it.
+
+    ``statement`` is a SQLAlchemy statement, or driver-level SQL with its
+    ``params`` (what a ``before_cursor_execute`` listener sees).  Raises
+    ``ValueError`` on a dialect other than PostgreSQL or SQLite.
+    """
+    if isinstance(conn, AsyncSession):
+        conn = await conn.connection()
+    dialect = conn.dialect
+    if isinstance(statement, ClauseElement):
+        compiled = statement.compile(dialect=dialect)
+        sql = str(compiled)
+        if compiled.positional:
+            params = tuple(compiled.params[name] for name in compiled.positiontup or ())
+        else:
+            params = compiled.params
+    else:
+        sql = statement
+
+    if dialect.name == "postgresql":
+        if not seqscan:
+            await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        res = await conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + sql, params)
+        raw = res.scalar_one()
+        return _pg_plan(json.loads(raw) if isinstance(raw, str) else raw)
+    if dialect.name == "sqlite":
+        res = await conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql, params)
+        return _sqlite_plan([row[-1] for row in res])
+    raise ValueError(f"explain() does not support {dialect.name}")
+
+
+async def assert_uses_index(
+    conn: Union[AsyncConnection, AsyncSession],
+    statement: Union[str, ClauseElement],
+    index: str,
+    params: Union[Sequence[Any], Mapping[str, Any], None] = None,
+) -> QueryPlan:
+    """Raise ``AssertionError`` (with the plan) unless ``statement`` uses ``index``."""
+    plan = await explain(conn, statement, params)
+    if index not in plan.indexes:
+        raise AssertionError(f"query does not use index {index!r}; plan:\n{plan}")
+    return plan
+
+
+# ---- dialect parsers ----
+
+
+def _pg_plan(doc: Any) -> QueryPlan:
+    plan = QueryPlan(lines=[])
+
+    def walk(node: dict[str, Any], depth: int) -> None:
+        kind = node.get("Node Type", "")
+        index: Optional[str] = node.get("Index Name")
+        relation: Optional[str] = node.get("Relation Name")
+        plan.lines.append(
+            "  " * depth + " ".join(p for p in (kind, index, relation) if p)
+        )
+        if kind in _PG_INDEX_NODES and index:
+            plan.indexes.add(index)
+        if kind == "Seq Scan" and relation:
+            plan.seq_scans.add(relation)
+        for child in node.get("Plans", ()):
+            walk(child, depth + 1)
+
+    walk(doc[0]["Plan"], 0)
+    return plan
+
+
+def _sqlite_plan(details: list[str]) -> QueryPlan:
+    plan = QueryPlan(lines=details)
+    for detail in details:
+        index = _SQLITE_INDEX.search(detail)
+        if index:
+            plan.indexes.add(index.group(1))
+        scan = _SQLITE_SCAN.match(detail)
+        if scan and "USING" not in detail:
+            plan.seq_scans.add(scan.group(1))
+    return plan
@@ -2,6 +2,8 @@ import importlib
 import os
 import unittest
 
+from fastapi.testclient import TestClient
+
 
 def _set_test_env() -> None:
     os.environ.setdefault("DATABASE_USER", "test_user")
@@ -32,3 +34,25 @@ class AppStartupAndDiSmokeTest(unittest.TestCase):
         paths = {route.path for route in app.routes}
         self.assertIn("/users/", paths)
         self.assertIn("/users/activate-user", paths)
+
+    def test_import_builds_nothing_until_app_is_accessed(self) -> None:
+        server_app = _load_server_app_module()
+
+        self.assertNotIn("app", vars(server_app))
+        self.assertIsNone(server_app.container)
+
+        app = server_app.app
+        self.assertIs(server_app.app, app)
+        self.assertIsNotNone(server_app.container)
+
+    def test_lifespan_creates_and_disposes_the_database(self) -> None:
+        server_app = _load_server_app_module()
+        app = server_app.create_app()
+
+        with TestClient(app):
+            database = server_app.container.database()
+            self.assertIs(server_app.container.database(), database)
+            self.assertGreater(server_app.startup_seconds.value(phase="lifespan"), 0)
+
+        # disposed and released: the next lifespan builds a fresh one
+        self.assertIsNot(server_app.container.database(), database)
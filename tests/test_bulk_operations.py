@@ -0,0 +1,107 @@
+from pydantic import BaseModel
+
+from core.application.dtos.user_dto import UpdateUserRequestDto
+from server.application.services.user_service import UserService
+from server.infrastructure.repositories.user_repository import UserRepository
+from tests._support import SQLiteTestCase, record_statements, user_dto
+
+
+class _RecordingUserService(UserService):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.batches: list[tuple[str, int]] = []
+
+    async def after_create_many(self, created) -> None:
+        self.batches.append(("create", len(created)))
+
+    async def after_delete_many(self, obj_ids) -> None:
+        self.batches.append(("delete", len(obj_ids)))
+
+
+class _UserName(BaseModel):
+    name: str
+
+
+class _NameRepository(UserRepository):
+    """Reads a schema without the primary key."""
+
+    @property
+    def read_schema(self) -> type[_UserName]:
+        return _UserName
+
+
+class BulkOperationsTest(SQLiteTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.statements = record_statements(self.engine)
+
+    async def test_create_many_returns_rows_in_input_order(self) -> None:
+        async with self.session_maker() as session:
+            created = await UserRepository(session).create_many(
+                [user_dto(i) for i in range(5)], chunk_size=2
+            )
+            await session.commit()
+
+        self.assertEqual([u.name for u in created], [f"user{i}" for i in range(5)])
+        self.assertEqual(len({u.id for u in created}), 5)
+
+    async def test_update_many_applies_partial_updates(self) -> None:
+        async with self.session_maker() as session:
+            repo = UserRepository(session)
+            a, b, c = await repo.create_many([user_dto(i) for i in range(3)])
+            updated = await repo.update_many(
+                {
+                    c.id: UpdateUserRequestDto(role="admin"),
+                    a.id: UpdateUserRequestDto(name="renamed", role="admin"),
+                    999: UpdateUserRequestDto(name="missing"),
+                    b.id: UpdateUserRequestDto(),
+                }
+            )
+            await session.commit()
+
+        self.assertEqual([u.id for u in updated], [c.id, a.id, b.id])
+        self.assertEqual(updated[0].role, "admin")
+        self.assertEqual(updated[0].name, c.name)
+        self.assertEqual((updated[1].name, updated[1].role), ("renamed", "admin"))
+        self.assertEqual(updated[2], b)
+
+    async def test_update_many_does_not_need_the_pk_in_the_read_schema(self) -> None:
+        async with self.session_maker() as session:
+            repo = _NameRepository(session)
+            a, b = await UserRepository(session).create_many(
+                [user_dto(i) for i in range(2)]
+            )
+            updated = await repo.update_many(
+                {
+                    b.id: UpdateUserRequestDto(name="renamed"),
+                    a.id: UpdateUserRequestDto(),
+                }
+            )
+
+        self.assertEqual([u.name for u in updated], ["renamed", "user0"])
+
+    async def test_delete_many_reports_only_existing_ids(self) -> None:
+        async with self.session_maker() as session:
+            repo = UserRepository(session)
+            created = await repo.create_many([user_dto(i) for i in range(4)])
+            ids = [u.id for u in created]
+
+            self.statements.clear()
+            deleted = await repo.delete_many([ids[0], ids[2], 999], chunk_size=10)
+            await session.commit()
+
+            self.assertEqual(sorted(deleted), [ids[0], ids[2]])
+            self.assertEqual(await repo.count(), 2)
+
+        # users are soft-deleted: one UPDATE for the whole chunk
+        self.assertEqual(
+            sum(s.lstrip().upper().startswith("UPDATE") for s in self.statements), 1
+        )
+
+    async def test_service_runs_batch_hooks_once_per_call(self) -> None:
+        service = self.user_service(_RecordingUserService)
+
+        created = await service.create_many([user_dto(i) for i in range(3)])
+        await service.delete_many([u.id for u in created])
+
+        self.assertEqual(service.batches, [("create", 3), ("delete", 3)])
@@ -0,0 +1,126 @@
+import asyncio
+import importlib
+import os
+import unittest
+from datetime import datetime
+
+from dependency_injector import providers
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from core.application.dtos.user_dto import CreateUserRequestDto
+from core.infrastructure.database.database import Base
+from core.infrastructure.database.models.user import UserModel
+from core.infrastructure.database.session import ManagedSession
+from server.application.services.user_service import UserService
+from server.infrastructure.repositories.user_repository import UserRepository
+from tests._support import record_statements, temp_sqlite_url
+
+
+def _set_test_env() -> None:
+    os.environ.setdefault("DATABASE_USER", "test_user")
+    os.environ.setdefault("DATABASE_PASSWORD", "test_password")
+    os.environ.setdefault("DATABASE_HOST", "127.0.0.1")
+    os.environ.setdefault("DATABASE_PORT", "5432")
+    os.environ.setdefault("DATABASE_NAME", "test_db")
+
+
+class ConditionalRequestsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # TestClient runs the app on its own event loop, so no pooled
+        # aiosqlite connection may outlive the loop that opened it.
+        self.engine = create_async_engine(temp_sqlite_url(self), poolclass=NullPool)
+        self.session_maker = async_sessionmaker(self.engine, expire_on_commit=False)
+        self.user_id = asyncio.run(self._seed())
+
+        self.selects = record_statements(self.engine, selects_only=True)
+
+        _set_test_env()
+        server_app = importlib.reload(importlib.import_module("server.app"))
+        app = server_app.create_app()
+        service = UserService(
+            session_factory=lambda **kw: ManagedSession(self.session_maker, **kw),
+            repo_class=UserRepository,
+            config=None,
+        )
+        override = server_app.container.user_service.override(providers.Object(service))
+        override.__enter__()
+        self.addCleanup(override.__exit__, None, None, None)
+        self.client = TestClient(app)
+
+    async def _seed(self) -> int:
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with self.session_maker() as session:
+            user = await UserRepository(session).create(
+                CreateUserRequestDto(
+                    name="demo", email="demo@example.com", password_hash="x", role="user"
+                )
+            )
+            await session.execute(
+                update(UserModel)
+                .where(UserModel.id == user.id)
+                .values(updated_at=datetime(2020, 1, 1, 12, 0, 0))
+            )
+            await session.commit()
+        return user.id
+
+    def tearDown(self) -> None:
+        self.client.close()
+
+    def test_entity_etag_and_not_modified(self) -> None:
+        self.selects.clear()
+        first = self.client.get(f"/users/{self.user_id}")
+        self.assertEqual(first.status_code, 200)
+        # no validator to check: the row is read once, with no version pre-check
+        self.assertEqual(len(self.selects), 1)
+        self.assertIn("email", self.selects[0])
+        etag = first.headers["etag"]
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertEqual(first.headers["last-modified"], "Wed, 01 Jan 2020 12:00:00 GMT")
+
+        self.selects.clear()
+        cached = self.client.get(
+            f"/users/{self.user_id}", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.content, b"")
+        self.assertEqual(len(self.selects), 1)
+        self.assertIn("updated_at", self.selects[0])
+        self.assertNotIn("email", self.selects[0])
+
+        since = self.client.get(
+            f"/users/{self.user_id}",
+            headers={"If-Modified-Since": "Wed, 01 Jan 2020 12:00:00 GMT"},
+        )
+        self.assertEqual(since.status_code, 304)
+
+    def test_update_changes_validators(self) -> None:
+        etag = self.client.get(f"/users/{self.user_id}").headers["etag"]
+
+        self.client.put(f"/users/{self.user_id}", json={"role": "admin"})
+        after = self.client.get(
+            f"/users/{self.user_id}", headers={"If-None-Match": etag}
+        )
+
+        self.assertEqual(after.status_code, 200)
+        self.assertEqual(after.json()["role"], "admin")
+        self.assertNotEqual(after.headers["etag"], etag)
+
+    def test_missing_user_is_404(self) -> None:
+        self.assertEqual(self.client.get("/users/999").status_code, 404)
+
+    def test_list_etag_tracks_page_content(self) -> None:
+        first = self.client.get("/users/")
+        etag = first.headers["etag"]
+        self.assertEqual(len(first.json()), 1)
+
+        cached = self.client.get("/users/", headers={"If-None-Match": etag})
+        self.assertEqual(cached.status_code, 304)
+
+        self.client.put(f"/users/{self.user_id}", json={"name": "renamed"})
+        changed = self.client.get("/users/", headers={"If-None-Match": etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.json()[0]["name"], "renamed")
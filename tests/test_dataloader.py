@@ -0,0 +1,136 @@
+import asyncio
+import unittest
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from core.infrastructure.concurrency import DataLoader
+from server.infrastructure.repositories.user_repository import UserRepository
+from tests._support import SQLiteTestCase, record_statements, user_dto
+
+
+class UserCard(BaseModel):
+    name: str
+    email: str
+
+
+class UserCardRepository(UserRepository):
+    """Reads a schema without the primary key."""
+
+    @property
+    def read_schema(self) -> type[UserCard]:
+        return UserCard
+
+
+class CountingUserRepository(UserRepository):
+    calls: list[int] = []
+
+    async def get_by_id(self, obj_id, *, spec=None):
+        self.calls.append(obj_id)
+        return await super().get_by_id(obj_id, spec=spec)
+
+
+class DataLoaderTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.batches: list[list[int]] = []
+
+    async def _double(self, keys: list[int]) -> list[int]:
+        self.batches.append(keys)
+        return [k * 2 for k in keys]
+
+    async def test_loads_in_one_tick_share_a_batch(self) -> None:
+        loader = DataLoader(self._double)
+
+        values = await asyncio.gather(*(loader.load(k) for k in (3, 1, 3, 2)))
+        later = await loader.load(5)
+
+        self.assertEqual(values, [6, 2, 6, 4])
+        self.assertEqual(later, 10)
+        self.assertEqual(self.batches, [[3, 1, 2], [5]])
+
+    async def test_batches_are_capped(self) -> None:
+        loader = DataLoader(self._double, max_batch_size=2)
+
+        self.assertEqual(await loader.load_many([1, 2, 3]), [2, 4, 6])
+        self.assertEqual(self.batches, [[1, 2], [3]])
+
+    async def test_a_failed_batch_fails_every_load(self) -> None:
+        async def broken(keys: list[int]) -> list[int]:
+            raise ConnectionError("database down")
+
+        loader = DataLoader(broken)
+        results = await asyncio.gather(
+            loader.load(1), loader.load(2), return_exceptions=True
+        )
+
+        self.assertTrue(all(isinstance(r, ConnectionError) for r in results))
+
+
+class GetByIdsTest(SQLiteTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        async with self.session_maker() as session:
+            repo = UserRepository(session)
+            created = await repo.create_many([user_dto(i) for i in range(5)])
+            await session.commit()
+        self.ids = [u.id for u in created]
+
+        self.selects = record_statements(self.engine, selects_only=True)
+        self.service = self.user_service()
+
+    async def test_repository_keeps_input_order(self) -> None:
+        a, b, c = self.ids[:3]
+        async with self.session_maker() as session:
+            repo = UserRepository(session)
+            await repo.delete_by_id(c)  # soft-deleted: reads as missing
+            users = await repo.get_by_ids([b, 999, a, b, c], chunk_size=2)
+
+        self.assertEqual([u.id if u else None for u in users], [b, None, a, b, None])
+        self.assertEqual(len(self.selects), 2)  # 3 distinct ids, chunks of 2
+
+    async def test_postgres_binds_one_array_parameter(self) -> None:
+        engine = create_async_engine("postgresql+asyncpg://u:p@127.0.0.1/db")
+        self.addAsyncCleanup(engine.dispose)
+        repo = UserRepository(AsyncSession(bind=engine))
+
+        compiled = repo._pk_in([1, 2, 3]).compile(dialect=engine.dialect)
+
+        self.assertIn("= ANY (", str(compiled))
+        self.assertEqual(compiled.params, {"pk_ids": [1, 2, 3]})
+
+    async def test_rows_are_matched_by_primary_key_not_schema(self) -> None:
+        a, b = self.ids[:2]
+        for fast in (True, False):
+            class Cards(UserCardRepository):
+                fast_mapping = fast
+
+            with self.subTest(fast_mapping=fast):
+                async with self.session_maker() as session:
+                    cards = await Cards(session).get_by_ids([b, 999, a])
+
+                self.assertEqual(
+                    [c.email if c else None for c in cards],
+                    ["user1@example.com", None, "user0@example.com"],
+                )
+
+    async def test_concurrent_load_by_id_calls_run_one_query(self) -> None:
+        wanted = [self.ids[3], self.ids[0], 999, self.ids[3]]
+
+        users = await asyncio.gather(*(self.service.load_by_id(i) for i in wanted))
+
+        expected = wanted[:2] + [None, wanted[3]]
+        self.assertEqual([u.id if u else None for u in users], expected)
+        self.assertEqual(len(self.selects), 1)
+
+        await self.service.load_by_id(self.ids[1])  # a later call is a new batch
+        self.assertEqual(len(self.selects), 2)
+
+    async def test_get_by_id_reads_through_the_repository_get_by_id(self) -> None:
+        service = self.user_service(repo_class=CountingUserRepository)
+        CountingUserRepository.calls = []
+        wanted = self.ids[:3]
+
+        users = await asyncio.gather(*(service.get_by_id(i) for i in wanted))
+
+        self.assertEqual([u.id for u in users], wanted)
+        self.assertEqual(sorted(CountingUserRepository.calls), sorted(wanted))
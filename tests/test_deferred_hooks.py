@@ -0,0 +1,137 @@
+import asyncio
+
+from core.application.dtos.user_dto import UpdateUserRequestDto
+from core.infrastructure.background import (
+    HookRunner,
+    deferred,
+    hook_items,
+    queue_full,
+)
+from server.application.services.user_service import UserService
+from tests._support import SQLiteTestCase, user_dto
+
+
+class IndexingUserService(UserService):
+    """Records deferred hook calls and whether the rows were committed."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls: list[list[str]] = []
+        self.visible: list[bool] = []
+        self.deleted: list[int] = []
+        self.failures = 0
+
+    @deferred
+    async def after_create(self, created) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("search index unavailable")
+        self.calls.append([created.name])
+        # runs after commit: a fresh session sees the row
+        self.visible.append(await self.count() > 0)
+
+    async def after_create_many(self, created) -> None:
+        if len(created) > 1:
+            self.calls.append(sorted(c.name for c in created))
+        else:
+            await super().after_create_many(created)
+
+    async def after_update(self, updated) -> None:
+        self.calls.append(["inline update"])
+
+    @deferred
+    async def after_delete_many(self, obj_ids) -> None:
+        self.deleted.extend(obj_ids)
+
+
+class DeferredHooksTest(SQLiteTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.runner = HookRunner(workers=1, batch_window_ms=100, retry_backoff_ms=1)
+        self.service = self._service(self.runner)
+
+    async def asyncTearDown(self) -> None:
+        await self.runner.stop()
+
+    def _service(self, runner) -> IndexingUserService:
+        return self.user_service(IndexingUserService, hooks=runner)
+
+    async def test_deferred_hooks_run_after_commit_in_batches(self) -> None:
+        await asyncio.gather(*(self.service.create(user_dto(i)) for i in range(3)))
+        self.assertEqual(self.service.calls, [])
+
+        await self.runner.join()
+        self.assertEqual(self.service.calls, [["user0", "user1", "user2"]])
+
+        user = await self.service.create(user_dto(3))
+        await self.service.update_by_id(user.id, UpdateUserRequestDto(name="x"))
+        await self.service.delete_by_id(user.id)
+        await self.service.delete_by_id(user.id)  # no-op delete is not delivered
+        await self.runner.join()
+
+        # the inline hook runs in the transaction, before the queued one
+        self.assertEqual(self.service.calls[1:], [["inline update"], ["user3"]])
+        self.assertEqual(self.service.visible, [True])
+        self.assertEqual(self.service.deleted, [user.id])
+
+    async def test_hooks_from_separate_service_instances_share_a_batch(self) -> None:
+        # the app builds one service per request
+        other = self._service(self.runner)
+
+        await asyncio.gather(
+            self.service.create(user_dto(0)), other.create(user_dto(1))
+        )
+        await self.runner.join()
+
+        self.assertEqual(self.service.calls + other.calls, [["user0", "user1"]])
+
+    async def test_rolled_back_work_is_not_delivered(self) -> None:
+        with self.assertRaises(RuntimeError):
+            async with self.service._session_factory() as session:
+                await self.service._create(session, user_dto(0))
+                raise RuntimeError("abort")
+        await self.runner.join()
+
+        self.assertEqual(self.service.calls, [])
+
+    async def test_failed_batches_are_retried(self) -> None:
+        hook = "IndexingUserService.after_create_many"
+        retried = hook_items.value(hook=hook, outcome="retried")
+        self.service.failures = 2
+
+        await self.service.create(user_dto(0))
+        await self.runner.join()
+
+        self.assertEqual(self.service.calls, [["user0"]])
+        self.assertEqual(hook_items.value(hook=hook, outcome="retried"), retried + 2)
+
+    async def test_full_queue_applies_backpressure(self) -> None:
+        runner = HookRunner(workers=1, queue_size=1, batch_size=1, batch_window_ms=0)
+        release = asyncio.Event()
+        seen: list[int] = []
+
+        async def slow(items) -> None:
+            await release.wait()
+            seen.extend(items)
+
+        waits = queue_full.value()
+        await runner.submit(slow, [1])
+        await asyncio.sleep(0)  # the worker takes job 1 and blocks
+        await runner.submit(slow, [2])
+        blocked = asyncio.create_task(runner.submit(slow, [3]))
+        await asyncio.sleep(0.01)
+        self.assertFalse(blocked.done())
+
+        release.set()
+        await blocked
+        await runner.stop()
+        self.assertEqual(seen, [1, 2, 3])
+        self.assertEqual(queue_full.value(), waits + 1)
+
+    async def test_without_runner_hooks_still_wait_for_commit(self) -> None:
+        service = self._service(None)
+
+        await service.create(user_dto(0))
+
+        self.assertEqual(service.calls, [["user0"]])
+        self.assertEqual(service.visible, [True])
@@ -0,0 +1,105 @@
+import unittest
+from datetime import datetime, timezone
+from typing import List
+from unittest import mock
+
+import fastapi.routing
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from core.application.dtos.base import BaseResponse, Page
+from core.application.dtos.user_dto import UserResponseDto
+from server.application.controllers.responses import DtoJSONResponse, DtoRoute
+
+
+class _PublicUser(BaseResponse):
+    id: int
+    name: str
+
+
+def _dto(i: int) -> UserResponseDto:
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return UserResponseDto(
+        id=i,
+        name=f"user{i}",
+        email=f"user{i}@example.com",
+        password_hash="x",
+        role="user",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _app() -> FastAPI:
+    router = APIRouter(route_class=DtoRoute)
+
+    @router.get("/one", response_model=UserResponseDto, status_code=201)
+    async def one():
+        return _dto(1)
+
+    @router.get("/many", response_model=List[UserResponseDto])
+    async def many():
+        return [_dto(1), _dto(2)]
+
+    @router.get("/page", response_model=Page[UserResponseDto])
+    async def page():
+        return Page[UserResponseDto](items=[_dto(1)], total=1, page=1, page_size=10)
+
+    @router.get("/dict", response_model=UserResponseDto)
+    async def as_dict():
+        return _dto(3).model_dump()
+
+    @router.get("/filtered", response_model=_PublicUser)
+    async def filtered():
+        return _dto(4)
+
+    @router.get("/filtered-page", response_model=Page[_PublicUser])
+    async def filtered_page():
+        return Page[UserResponseDto](items=[_dto(5)], total=1, page=1, page_size=10)
+
+    @router.get("/bare-page", response_model=Page[_PublicUser])
+    async def bare_page():
+        return Page(items=[_dto(6)], total=1, page=1, page_size=10)
+
+    app = FastAPI(default_response_class=DtoJSONResponse)
+    app.include_router(router)
+    return app
+
+
+class DtoRouteTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = TestClient(_app())
+        patcher = mock.patch.object(
+            fastapi.routing,
+            "serialize_response",
+            wraps=fastapi.routing.serialize_response,
+        )
+        self.serialize = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_trusted_dtos_skip_response_validation(self) -> None:
+        one = self.client.get("/one")
+        many = self.client.get("/many")
+        page = self.client.get("/page")
+
+        self.assertEqual(self.serialize.call_count, 0)
+        self.assertEqual(one.status_code, 201)
+        self.assertEqual(one.json()["created_at"], "2024-01-01T00:00:00Z")
+        self.assertEqual([u["id"] for u in many.json()], [1, 2])
+        self.assertEqual(page.json()["total"], 1)
+
+    def test_other_results_keep_the_validated_path(self) -> None:
+        as_dict = self.client.get("/dict")
+        filtered = self.client.get("/filtered")
+
+        self.assertEqual(self.serialize.call_count, 2)
+        self.assertEqual(as_dict.json()["id"], 3)
+        self.assertEqual(filtered.json(), {"id": 4, "name": "user4"})
+
+    def test_a_generic_with_other_type_arguments_is_filtered(self) -> None:
+        filtered = self.client.get("/filtered-page")
+        bare = self.client.get("/bare-page")
+
+        self.assertEqual(self.serialize.call_count, 2)
+        self.assertEqual(filtered.json()["items"], [{"id": 5, "name": "user5"}])
+        self.assertEqual(bare.json()["items"], [{"id": 6, "name": "user6"}])
@@ -0,0 +1,215 @@
+from typing import Optional
+
+import httpx
+from fastapi import FastAPI
+from pydantic import BaseModel, ConfigDict, ValidationError
+from sqlalchemy import ForeignKey, String
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+from core.infrastructure.database.engine import EngineOptions, build_engine
+from core.infrastructure.database.query_audit import (
+    NPlusOneError,
+    QueryAuditMiddleware,
+    auditor,
+)
+from core.infrastructure.repositories.base_repository import SQLAlchemyRepository
+from core.specs.common import JoinedLoad, RaiseLoad, SelectInLoad
+from tests._support import SQLiteTestCase, record_statements
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class AuthorModel(_Base):
+    __tablename__ = "author"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+    books: Mapped[list["BookModel"]] = relationship(back_populates="author")
+
+
+class BookModel(_Base):
+    __tablename__ = "book"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String(50))
+    author_id: Mapped[int] = mapped_column(ForeignKey("author.id"))
+    author: Mapped[AuthorModel] = relationship(back_populates="books")
+
+
+class BookDto(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+
+
+class AuthorDto(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    books: list[BookDto] = []
+
+
+class AuthorCreate(BaseModel):
+    name: str
+
+
+class AuthorRepository(SQLAlchemyRepository):
+    model = AuthorModel
+    read_schema = AuthorDto
+    fast_mapping = True  # ignored: books must be loaded
+
+
+class LazyAuthorRepository(SQLAlchemyRepository):
+    model = AuthorModel
+    read_schema = AuthorDto
+    eager_loads = {}
+
+
+class AuthorNameDto(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+
+
+class AuthorNameRepository(SQLAlchemyRepository):
+    model = AuthorModel
+    read_schema = AuthorNameDto
+    fast_mapping = True
+
+
+class BookWithAuthorDto(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    author: Optional[AuthorNameDto] = None
+
+
+class BookRepository(SQLAlchemyRepository):
+    model = BookModel
+    read_schema = BookWithAuthorDto
+    eager_loads = {"author": "joined"}
+
+
+class EagerLoadingTest(SQLiteTestCase):
+    metadata = _Base.metadata
+
+    def create_engine(self, url: str) -> AsyncEngine:
+        # build_engine installs the statement hooks the N+1 audit relies on
+        return build_engine(url, EngineOptions(), name="eager-test")
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        async with self.session_maker() as session:
+            for i in range(6):
+                author = AuthorModel(name=f"author{i}")
+                author.books = [BookModel(title=f"book{i}-{j}") for j in range(2)]
+                session.add(author)
+            await session.commit()
+
+        self.statements = record_statements(self.engine)
+
+    async def asyncTearDown(self) -> None:
+        auditor.configure("off")
+
+    async def test_relationships_in_read_schema_are_selectin_loaded(self) -> None:
+        async with self.session_maker() as session:
+            authors = await AuthorRepository(session).get_list()
+
+        self.assertEqual(len(authors), 6)
+        self.assertEqual([b.title for b in authors[0].books], ["book0-0", "book0-1"])
+        # one query for authors, one for all their books — whatever the count
+        self.assertEqual(len(self.statements), 2)
+
+    async def test_unlisted_relationships_raise_instead_of_lazy_loading(self) -> None:
+        async with self.session_maker() as session:
+            with self.assertRaisesRegex(ValidationError, "lazy='raise'"):
+                await LazyAuthorRepository(session).get_list()
+
+    async def test_fast_mapping_still_applies_without_relationship_fields(self) -> None:
+        async with self.session_maker() as session:
+            authors = await AuthorNameRepository(session).get_list()
+
+        self.assertEqual(len(authors), 6)
+        self.assertNotIn("book", self.statements[0])
+
+    async def test_joined_many_to_one_and_writes(self) -> None:
+        async with self.session_maker() as session:
+            books = await BookRepository(session).get_list()
+            created = await AuthorRepository(session).create(AuthorCreate(name="new"))
+
+        self.assertEqual(len(books), 12)
+        self.assertEqual(books[0].author.name, "author0")
+        self.assertIn("JOIN author", self.statements[0])
+        self.assertEqual(created.books, [])
+
+    async def test_joined_collections_are_rejected(self) -> None:
+        class JoinedAuthorRepository(AuthorRepository):
+            eager_loads = {"books": "joined"}
+
+        async with self.session_maker() as session:
+            with self.assertRaisesRegex(ValueError, "selectin"):
+                await JoinedAuthorRepository(session).get_list()
+
+    async def test_load_specs(self) -> None:
+        async with self.session_maker() as session:
+            repo = LazyAuthorRepository(session)
+            authors = await repo.get_list(spec=SelectInLoad.of(AuthorModel.books))
+            self.assertEqual(len(authors[0].books), 2)
+
+            books = await repo.session.execute(
+                JoinedLoad.of(BookModel.author).apply(
+                    RaiseLoad.of().apply(BookRepository(session)._base_select())
+                )
+            )
+            self.assertEqual(books.scalars().first().author.name, "author0")
+
+    async def test_n_plus_one_detector(self) -> None:
+        auditor.configure("raise", threshold=3)
+
+        async with self.session_maker() as session:
+            repo = AuthorNameRepository(session)
+            with self.assertRaisesRegex(NPlusOneError, r"request: 6 statements"):
+                with auditor.scope("request"):
+                    for i in range(1, 7):
+                        await repo.get_by_id(i)
+
+            # a fixed number of statements per call is fine
+            with auditor.scope("request"):
+                await AuthorRepository(session).get_list()
+
+        auditor.configure("warn", threshold=3)
+        async with self.session_maker() as session:
+            with self.assertLogs("core.db.n_plus_one", "WARNING") as logs:
+                with auditor.scope("loop"):
+                    for i in range(1, 4):
+                        await AuthorNameRepository(session).get_by_id(i)
+        self.assertIn("3x SELECT", logs.output[0])
+
+    async def test_request_audit_middleware(self) -> None:
+        auditor.configure("warn", threshold=3)
+        app = FastAPI()
+        session_maker = self.session_maker
+
+        @app.get("/authors/{count}")
+        async def authors(count: int):
+            async with session_maker() as session:
+                repo = AuthorNameRepository(session)
+                return [(await repo.get_by_id(i)).name for i in range(1, count + 1)]
+
+        app.add_middleware(QueryAuditMiddleware)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+            with self.assertLogs("core.db.n_plus_one", "WARNING") as logs:
+                response = await client.get("/authors/4")
+                await client.get("/authors/2")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("GET /authors/{count}: 4 statements", logs.output[0])
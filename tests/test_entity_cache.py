@@ -0,0 +1,124 @@
+import asyncio
+import unittest
+
+
+from core.application.dtos.user_dto import (
+    CreateUserRequestDto,
+    UpdateUserRequestDto,
+    UserResponseDto,
+)
+from core.infrastructure.cache.backends import InMemoryCacheBackend, RedisCacheBackend
+from core.infrastructure.cache.entity_cache import EntityCache, cache_requests
+from core.infrastructure.database.session import ManagedSession, on_commit
+from server.infrastructure.repositories.user_repository import UserRepository
+from tests._support import SQLiteTestCase, record_statements
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, px=None):
+        self.data[key] = value
+        self.ttls[key] = px
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class CacheBackendTest(unittest.IsolatedAsyncioTestCase):
+    async def test_in_memory_backend_evicts_lru_and_expires(self) -> None:
+        backend = InMemoryCacheBackend(maxsize=2)
+        await backend.set("a", b"1", ttl=60)
+        await backend.set("b", b"2", ttl=60)
+        await backend.get("a")
+        await backend.set("c", b"3", ttl=60)
+
+        self.assertEqual(await backend.get("a"), b"1")
+        self.assertIsNone(await backend.get("b"))
+
+        await backend.set("short", b"x", ttl=0.01)
+        await asyncio.sleep(0.02)
+        self.assertIsNone(await backend.get("short"))
+
+    async def test_redis_backend_prefixes_keys_and_sets_ttl(self) -> None:
+        client = _FakeRedis()
+        backend = RedisCacheBackend(client, key_prefix="app:")
+
+        await backend.set("user:1", b"{}", ttl=1.5)
+        self.assertEqual(await backend.get("user:1"), b"{}")
+        self.assertEqual(client.ttls["app:user:1"], 1500)
+
+        await backend.delete("user:1")
+        self.assertIsNone(await backend.get("user:1"))
+
+
+class CachedUserServiceTest(SQLiteTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+
+        self.selects = record_statements(self.engine, selects_only=True)
+
+        self.cache = EntityCache(
+            InMemoryCacheBackend(), UserResponseDto, namespace="test-user"
+        )
+        self.service = self.user_service(cache=self.cache)
+        self.user = await self.service.create(
+            CreateUserRequestDto(
+                name="demo", email="demo@example.com", password_hash="x", role="user"
+            )
+        )
+
+    async def test_second_read_is_served_from_cache(self) -> None:
+        hits = cache_requests.value(namespace="test-user", result="hit")
+
+        first = await self.service.get_by_id(self.user.id)
+        second = await self.service.get_by_id(self.user.id)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.selects), 1)
+        self.assertEqual(cache_requests.value(namespace="test-user", result="hit"), hits + 1)
+
+    async def test_update_and_delete_invalidate_entry(self) -> None:
+        await self.service.get_by_id(self.user.id)
+
+        await self.service.update_by_id(self.user.id, UpdateUserRequestDto(role="admin"))
+        self.assertEqual((await self.service.get_by_id(self.user.id)).role, "admin")
+
+        await self.service.delete_by_id(self.user.id)
+        self.assertIsNone(await self.service.get_by_id(self.user.id))
+
+    async def test_concurrent_misses_share_one_query(self) -> None:
+        results = await asyncio.gather(
+            *(self.service.get_by_id(self.user.id) for _ in range(5))
+        )
+
+        self.assertEqual(len({r.id for r in results}), 1)
+        self.assertEqual(len(self.selects), 1)
+
+
+class OnCommitTest(SQLiteTestCase):
+    async def test_callbacks_run_after_commit_and_are_dropped_on_rollback(self) -> None:
+        calls: list[str] = []
+
+        async def record(name: str) -> None:
+            calls.append(name)
+
+        async with ManagedSession(self.session_maker) as session:
+            on_commit(session, lambda: record("committed"))
+            await UserRepository(session).count()
+            await session.commit()
+            self.assertEqual(calls, [])
+
+        with self.assertRaises(RuntimeError):
+            async with ManagedSession(self.session_maker) as session:
+                on_commit(session, lambda: record("rolled back"))
+                await UserRepository(session).count()
+                raise RuntimeError("boom")
+
+        self.assertEqual(calls, ["committed"])
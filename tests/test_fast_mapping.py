@@ -0,0 +1,48 @@
+from core.application.dtos.user_dto import CreateUserRequestDto, UserResponseDto
+from server.infrastructure.repositories.user_repository import UserRepository
+from tests._support import SQLiteTestCase, record_statements
+
+
+class _OrmUserRepository(UserRepository):
+    @property
+    def fast_mapping(self) -> bool:
+        return False
+
+
+class FastMappingTest(SQLiteTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+
+        async with self.session_maker() as session:
+            await UserRepository(session).create_many(
+                [
+                    CreateUserRequestDto(
+                        name=f"user{i}",
+                        email=f"user{i}@example.com",
+                        password_hash="x",
+                        role="user",
+                    )
+                    for i in range(3)
+                ]
+            )
+            await session.commit()
+
+    async def test_matches_orm_mapping(self) -> None:
+        async with self.session_maker() as session:
+            fast = await UserRepository(session).get_list()
+            fast_one = await UserRepository(session).get_by_id(fast[0].id)
+        async with self.session_maker() as session:
+            orm = await _OrmUserRepository(session).get_list()
+
+        self.assertEqual(fast, orm)
+        self.assertEqual(fast_one, orm[0])
+        self.assertIsInstance(fast[0], UserResponseDto)
+
+    async def test_selects_columns_without_orm_identities(self) -> None:
+        statements = record_statements(self.engine)
+
+        async with self.session_maker() as session:
+            await UserRepository(session).get_list()
+            self.assertEqual(len(session.identity_map), 0)
+
+        self.assertEqual(len(statements), 1)
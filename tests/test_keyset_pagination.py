@@ -0,0 +1,88 @@
+import unittest
+
+from core.application.dtos.user_dto import CreateUserRequestDto
+from core.specs.common import KeysetPaginate
+from core.specs.cursor import InvalidCursorError, decode_cursor, encode_cursor
+from core.infrastructure.database.models.user import UserModel
+from server.infrastructure.repositories.user_repository import UserRepository
+from tests._support import SQLiteTestCase
+
+
+class CursorCodecTest(unittest.TestCase):
+    def test_round_trip_preserves_values_and_direction(self) -> None:
+        cursor = encode_cursor([42, "x"], backwards=True)
+        position = decode_cursor(cursor)
+
+        self.assertEqual(position.values, (42, "x"))
+        self.assertTrue(position.backwards)
+
+    def test_garbage_cursor_is_rejected(self) -> None:
+        with self.assertRaises(InvalidCursorError):
+            decode_cursor("not-a-cursor")
+
+    def test_cursor_must_match_sort_keys(self) -> None:
+        with self.assertRaises(InvalidCursorError):
+            KeysetPaginate.of(UserModel.id.desc(), cursor=encode_cursor([1, 2]))
+
+    def test_cursor_values_must_match_the_key_types(self) -> None:
+        for values in ([[1]], ["abc"], [True], [None], [{"dt": "2024-01-01"}]):
+            with self.subTest(values=values):
+                with self.assertRaises(InvalidCursorError):
+                    KeysetPaginate.of(
+                        UserModel.id.desc(), cursor=encode_cursor(values)
+                    )
+
+        created = encode_cursor([{"dt": "2024-01-01T00:00:00"}, 7])
+        KeysetPaginate.of(UserModel.created_at, UserModel.id, cursor=created)
+
+
+class KeysetPaginationTest(SQLiteTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+
+        async with self.session_maker() as session:
+            repo = UserRepository(session)
+            for i in range(1, 26):
+                await repo.create(
+                    CreateUserRequestDto(
+                        name=f"user{i}",
+                        email=f"user{i}@example.com",
+                        password_hash="hashed",
+                        role="user",
+                    )
+                )
+            await session.commit()
+
+    async def test_walks_forward_and_back_by_cursor(self) -> None:
+        async with self.session_maker() as session:
+            repo = UserRepository(session)
+
+            first = await repo.get_users_page(cursor=None, page_size=10)
+            self.assertEqual([u.id for u in first.items], list(range(25, 15, -1)))
+            self.assertIsNone(first.prev_cursor)
+
+            second = await repo.get_users_page(cursor=first.next_cursor, page_size=10)
+            self.assertEqual([u.id for u in second.items], list(range(15, 5, -1)))
+
+            last = await repo.get_users_page(cursor=second.next_cursor, page_size=10)
+            self.assertEqual([u.id for u in last.items], [5, 4, 3, 2, 1])
+            self.assertIsNone(last.next_cursor)
+
+            back = await repo.get_users_page(cursor=last.prev_cursor, page_size=10)
+            self.assertEqual([u.id for u in back.items], list(range(15, 5, -1)))
+            self.assertIsNotNone(back.prev_cursor)
+            self.assertIsNotNone(back.next_cursor)
+
+            start = await repo.get_users_page(cursor=back.prev_cursor, page_size=10)
+            self.assertEqual([u.id for u in start.items], list(range(25, 15, -1)))
+            self.assertIsNone(start.prev_cursor)
+
+    async def test_crafted_cursor_is_a_400(self) -> None:
+        client = await self.api_client(self.user_service())
+
+        for values in ([[1]], ["abc"]):
+            with self.subTest(values=values):
+                response = await client.get(
+                    "/users/cursor", params={"cursor": encode_cursor(values)}
+                )
+                self.assertEqual(response.status_code, 400)
@@ -0,0 +1,145 @@
+import asyncio
+import json
+import os
+import tempfile
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+
+from core.application.dtos.user_dto import UpdateUserRequestDto
+from core.domain.events import DomainEvent
+from core.infrastructure.database.models.outbox import OutboxModel
+from core.infrastructure.outbox import FileSink, InMemorySink, OutboxRelay
+from core.infrastructure.repositories.outbox_repository import (
+    OutboxRepository,
+    claim_statement,
+)
+from server.infrastructure.repositories.user_repository import UserRepository
+from tests._support import SQLiteTestCase, user_dto
+
+
+
+class FlakySink(InMemorySink):
+    def __init__(self, failures: int) -> None:
+        super().__init__()
+        self.failures = failures
+
+    async def publish(self, messages) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("broker down")
+        await super().publish(messages)
+
+
+class OutboxTest(SQLiteTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.service = self.user_service(outbox=True)
+
+    async def _pending(self) -> int:
+        async with self.session_maker() as session:
+            return await session.scalar(select(func.count()).select_from(OutboxModel))
+
+    async def _seed_events(self, n: int) -> None:
+        async with self.session_maker() as session:
+            await OutboxRepository(session).add(
+                [DomainEvent("User", "UserCreated", str(i), {"i": i}) for i in range(n)]
+            )
+            await session.commit()
+
+    async def test_writes_record_events_in_the_same_transaction(self) -> None:
+        user = await self.service.create(user_dto(0))
+        await self.service.update_by_id(user.id, UpdateUserRequestDto(name="renamed"))
+        await self.service.update_by_id(999, UpdateUserRequestDto(name="missing"))
+        await self.service.delete_by_id(user.id)
+        await self.service.create_many([user_dto(1), user_dto(2)])
+        with self.assertRaises(RuntimeError):
+            async with self.service._session_factory() as session:
+                await self.service._create(session, user_dto(3))
+                raise RuntimeError("abort")
+
+        sink = InMemorySink()
+        await OutboxRelay(self.session_maker, sink).drain()
+
+        self.assertEqual(
+            [m.event_type for m in sink.messages],
+            ["UserCreated", "UserUpdated", "UserDeleted", "UserCreated", "UserCreated"],
+        )
+        created = sink.messages[0]
+        self.assertEqual(created.aggregate_id, str(user.id))
+        self.assertEqual(created.payload["email"], "user0@example.com")
+        self.assertNotIn("password_hash", created.payload)
+        self.assertEqual(sink.messages[2].payload, {"id": user.id})
+
+    async def test_events_are_keyed_by_the_repository_primary_key(self) -> None:
+        class EmailKeyedUserRepository(UserRepository):
+            pk_column = "email"
+
+        service = self.user_service(repo_class=EmailKeyedUserRepository, outbox=True)
+        await service.create(user_dto(0))
+        await service.delete_by_id("user0@example.com")
+
+        sink = InMemorySink()
+        await OutboxRelay(self.session_maker, sink).drain()
+
+        self.assertEqual(
+            [m.aggregate_id for m in sink.messages], ["user0@example.com"] * 2
+        )
+        self.assertEqual(sink.messages[1].payload, {"email": "user0@example.com"})
+
+    async def test_relay_publishes_in_order_and_removes_rows(self) -> None:
+        await self._seed_events(5)
+        sink = InMemorySink()
+        relay = OutboxRelay(self.session_maker, sink, batch_size=2)
+
+        self.assertEqual(await relay.relay_once(), 2)
+        self.assertEqual(await relay.drain(), 3)
+
+        self.assertEqual([m.payload["i"] for m in sink.messages], [0, 1, 2, 3, 4])
+        self.assertEqual(await self._pending(), 0)
+
+    async def test_failed_publish_keeps_rows_and_parks_them(self) -> None:
+        await self._seed_events(2)
+        sink = FlakySink(failures=2)
+        relay = OutboxRelay(self.session_maker, sink, max_attempts=2)
+
+        with self.assertRaises(ConnectionError):
+            await relay.relay_once()
+        self.assertEqual(await self._pending(), 2)
+
+        with self.assertRaises(ConnectionError):
+            await relay.relay_once()
+        # parked after max_attempts: kept for inspection, never claimed again
+        self.assertEqual(await relay.relay_once(), 0)
+        self.assertEqual(await self._pending(), 2)
+
+    async def test_concurrent_relays_deliver_each_message_once(self) -> None:
+        await self._seed_events(50)
+        sink = InMemorySink()
+        relays = [OutboxRelay(self.session_maker, sink, batch_size=7) for _ in range(4)]
+
+        await asyncio.gather(*(relay.drain() for relay in relays))
+
+        ids = [m.id for m in sink.messages]
+        self.assertEqual(len(ids), 50)
+        self.assertEqual(len(set(ids)), 50)
+
+    def test_claim_skips_rows_locked_by_other_relays(self) -> None:
+        sql = str(claim_statement(10, 3).compile(dialect=postgresql.dialect()))
+
+        self.assertIn("FOR UPDATE SKIP LOCKED", sql)
+        self.assertRegex(sql, r"^DELETE FROM outbox WHERE outbox.id IN \(SELECT")
+        self.assertIn("RETURNING", sql)
+
+    async def test_file_sink_writes_json_lines(self) -> None:
+        await self._seed_events(3)
+        fd, path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+
+        await OutboxRelay(self.session_maker, FileSink(path)).drain()
+
+        with open(path, encoding="utf-8") as fh:
+            lines = [json.loads(line) for line in fh]
+        self.assertEqual([line["payload"]["i"] for line in lines], [0, 1, 2])
+        self.assertEqual(lines[0]["event_type"], "UserCreated")
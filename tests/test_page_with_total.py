@@ -0,0 +1,115 @@
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from core.application.dtos.user_dto import CreateUserRequestDto
+from core.infrastructure.database.models.user import UserModel
+from server.infrastructure.repositories.user_repository import (
+    USERS_SPEC,
+    UserRepository,
+)
+from tests._support import SQLiteTestCase, record_statements
+
+
+class PageWithTotalTest(SQLiteTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+
+        async with self.session_maker() as session:
+            users = await UserRepository(session).create_many(
+                [
+                    CreateUserRequestDto(
+                        name=f"user{i}",
+                        email=f"user{i}@example.com",
+                        password_hash="x",
+                        role="user",
+                    )
+                    for i in range(7)
+                ]
+            )
+            await session.execute(
+                update(UserModel)
+                .where(UserModel.id.in_([users[0].id, users[1].id]))
+                .values(deleted_at=datetime.now(timezone.utc))
+            )
+            await session.commit()
+
+        self.selects = record_statements(self.engine, selects_only=True)
+
+    async def test_items_and_total_come_from_one_query(self) -> None:
+        async with self.session_maker() as session:
+            repo = UserRepository(session)
+            items, total = await repo.get_users_with_total(
+                page=2, page_size=3, include_deleted=True
+            )
+            active, active_total = await repo.get_active_users_with_total(
+                page=1, page_size=10
+            )
+
+        self.assertEqual(len(self.selects), 2)
+        self.assertEqual([u.name for u in items], ["user3", "user2", "user1"])
+        self.assertEqual(total, 7)
+        self.assertEqual((len(active), active_total), (5, 5))
+
+    async def test_page_past_the_end_still_reports_total(self) -> None:
+        async with self.session_maker() as session:
+            items, total = await UserRepository(session).get_users_with_total(
+                page=5, page_size=3, include_deleted=True
+            )
+
+        self.assertEqual((items, total), ([], 7))
+
+    async def test_approximate_falls_back_to_exact_off_postgresql(self) -> None:
+        async with self.session_maker() as session:
+            _, total = await UserRepository(session).get_users_with_total(
+                page=1, page_size=2, approximate=True, include_deleted=True
+            )
+
+        self.assertEqual(total, 7)
+
+    async def test_service_returns_envelope(self) -> None:
+        service = self.user_service()
+
+        page = await service.get_active_users_paged(page=2, page_size=2)
+
+        self.assertEqual((page.total, page.page, page.page_size), (5, 2, 2))
+        self.assertEqual([u.name for u in page.items], ["user4", "user3"])
+
+    async def test_listing_endpoints_cap_the_page_size(self) -> None:
+        client = await self.api_client(self.user_service())
+
+        for path in (
+            "/users/",
+            "/users/paged",
+            "/users/cursor",
+            "/users/activate-user",
+            "/users/activate-user/paged",
+            "/users/activate-user/cursor",
+        ):
+            with self.subTest(path=path):
+                too_big = await client.get(path, params={"page_size": 101})
+                largest = await client.get(path, params={"page_size": 100})
+
+                self.assertEqual(too_big.status_code, 422)
+                self.assertEqual(too_big.json()["detail"][0]["ctx"], {"le": 100})
+                self.assertEqual(largest.status_code, 200)
+
+
+class EstimatedTotalSqlTest(unittest.TestCase):
+    def test_estimate_reads_pg_class(self) -> None:
+        engine = create_async_engine("postgresql+asyncpg://u:p@localhost/db")
+        repo = UserRepository(SimpleNamespace(get_bind=lambda: engine.sync_engine))
+
+        sql = str(
+            repo._list_select(USERS_SPEC, total="estimate").compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        self.assertIn("pg_class.reltuples", sql)
+        self.assertIn("AS REGCLASS", sql)
+        self.assertNotIn("OVER", sql)
@@ -0,0 +1,84 @@
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.infrastructure.database.engine import EngineOptions, build_engine
+from core.infrastructure.database.instrumentation import (
+    QueryTimingMiddleware,
+    operation_rows,
+    query_duration,
+    slow_queries,
+)
+from core.infrastructure.database.models.user import UserModel
+from core.specs.common import Where
+from server.infrastructure.repositories.user_repository import (
+    USERS_SPEC,
+    UserRepository,
+)
+from tests._support import SQLiteTestCase, user_dto
+
+
+
+class QueryInstrumentationTest(SQLiteTestCase):
+    def create_engine(self, url: str) -> AsyncEngine:
+        return build_engine(
+            url, EngineOptions(slow_query_ms=0), name="instrumentation-test"
+        )
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.service = self.user_service()
+        for i in range(3):
+            await self.service.create(user_dto(i))
+
+    async def test_statements_are_labelled_with_repository_operation(self) -> None:
+        label = "UserRepository.get_users"
+        before = query_duration.count(operation=label)
+
+        users = await self.service.get_users(1, 10)
+
+        self.assertEqual(len(users), 3)
+        self.assertEqual(query_duration.count(operation=label), before + 1)
+        self.assertGreaterEqual(operation_rows.sum(operation=label), 3)
+
+    async def test_generic_calls_are_labelled_with_spec_name(self) -> None:
+        label = "UserRepository.get_list[users]"
+        before = query_duration.count(operation=label)
+        async with self.session_maker() as session:
+            await UserRepository(session).get_list(
+                spec=USERS_SPEC, params={"page_offset": 0, "page_limit": 10}
+            )
+        self.assertEqual(query_duration.count(operation=label), before + 1)
+
+    async def test_slow_queries_are_logged_without_parameters(self) -> None:
+        label = "UserRepository.get_list[Where]"
+        before = slow_queries.value(operation=label)
+
+        with self.assertLogs("core.db.slow_query", "WARNING") as logs:
+            await self.service.get_list(
+                spec=Where.of(UserModel.email == "user1@example.com")
+            )
+
+        self.assertEqual(slow_queries.value(operation=label), before + 1)
+        self.assertIn(label, logs.output[0])
+        self.assertIn("FROM user WHERE user.deleted_at IS NULL AND user.email = ?", logs.output[0])
+        self.assertNotIn("user1@example.com", logs.output[0])
+
+    async def test_server_timing_header(self) -> None:
+        app = FastAPI()
+        service = self.service
+
+        @app.get("/users")
+        async def users():
+            await service.get_users(1, 10)
+            await service.count()
+            return {}
+
+        app.add_middleware(QueryTimingMiddleware)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+            response = await client.get("/users")
+
+        timing = response.headers["server-timing"]
+        self.assertRegex(timing, r'^db;dur=[\d.]+;desc="2 queries", db-pool;dur=[\d.]+$')
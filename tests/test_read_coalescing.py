@@ -0,0 +1,98 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from core.application.dtos.user_dto import CreateUserRequestDto
+from core.application.services import base_service
+from core.application.services.base_service import coalesced_calls
+from core.infrastructure.concurrency import SingleFlight
+from core.infrastructure.database.models.user import UserModel
+from core.specs.base import SpecChain, spec_cache_key
+from core.specs.common import OrderBy, Paginate, Where
+from tests._support import SQLiteTestCase, record_statements
+
+
+class SpecCacheKeyTest(unittest.TestCase):
+    def test_equal_specs_share_a_key_and_values_matter(self) -> None:
+        def spec(user_id: int) -> SpecChain:
+            return SpecChain(
+                [Where.of(UserModel.id == user_id), OrderBy.of(UserModel.id)]
+            )
+
+        self.assertEqual(spec_cache_key(spec(1)), spec_cache_key(spec(1)))
+        self.assertNotEqual(spec_cache_key(spec(1)), spec_cache_key(spec(2)))
+        self.assertNotEqual(
+            spec_cache_key(Paginate(page=1, page_size=10)),
+            spec_cache_key(Paginate(page=2, page_size=10)),
+        )
+        self.assertIsNone(spec_cache_key(None))
+
+    def test_a_cacheable_chain_builds_its_key_once(self) -> None:
+        chain = SpecChain([OrderBy.of(UserModel.id), Paginate.bound()], cacheable=True)
+
+        with mock.patch.object(SpecChain, "apply", wraps=chain.apply) as apply:
+            first = spec_cache_key(chain)
+            second = spec_cache_key(chain)
+
+        self.assertEqual(first, second)
+        self.assertEqual(apply.call_count, 1)
+
+
+class ReadCoalescingTest(SQLiteTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+
+        self.selects = record_statements(self.engine, selects_only=True)
+
+        self.service = self.user_service(coalescer=SingleFlight())
+        self.user = await self.service.create(
+            CreateUserRequestDto(
+                name="demo", email="demo@example.com", password_hash="x", role="user"
+            )
+        )
+        self.selects.clear()
+
+    async def test_identical_concurrent_reads_run_one_query(self) -> None:
+        saved = coalesced_calls.value(service="UserService", method="get_users")
+
+        results = await asyncio.gather(
+            *(self.service.get_users(page=1, page_size=10) for _ in range(5))
+        )
+
+        self.assertEqual(len(self.selects), 1)
+        self.assertTrue(all(r == results[0] for r in results))
+        self.assertIsNot(results[0], results[1])
+        self.assertEqual(
+            coalesced_calls.value(service="UserService", method="get_users"),
+            saved + 4,
+        )
+
+    async def test_different_arguments_are_not_shared(self) -> None:
+        await asyncio.gather(
+            self.service.get_by_id(self.user.id),
+            self.service.get_by_id(self.user.id + 1),
+            self.service.count(spec=Where.of(UserModel.role == "user")),
+            self.service.count(spec=Where.of(UserModel.role == "admin")),
+        )
+
+        self.assertEqual(len(self.selects), 4)
+
+    async def test_spec_keys_are_only_built_when_reads_can_be_shared(self) -> None:
+        service = self.user_service()  # no coalescer
+        spec = Where.of(UserModel.role == "user")
+
+        with mock.patch.object(
+            base_service, "spec_cache_key", wraps=spec_cache_key
+        ) as key:
+            await service.count(spec=spec)
+            await service.get_list(spec=spec)
+            self.assertEqual(key.call_count, 0)
+
+            await self.service.count(spec=spec)
+            self.assertEqual(key.call_count, 1)
+
+    async def test_finished_reads_are_not_reused(self) -> None:
+        await self.service.get_by_id(self.user.id)
+        await self.service.get_by_id(self.user.id)
+
+        self.assertEqual(len(self.selects), 2)
@@ -0,0 +1,83 @@
+import asyncio
+import unittest
+
+from sqlalchemy import insert
+
+from core.infrastructure.database.database import Base, Database
+from core.infrastructure.database.engine import EngineOptions
+from core.infrastructure.database.models.user import UserModel
+from core.infrastructure.database.session import ManagedSession
+from core.application.dtos.user_dto import CreateUserRequestDto
+from server.application.services.user_service import UserService
+from server.infrastructure.repositories.user_repository import UserRepository
+from tests._support import temp_sqlite_url
+
+
+class ReadReplicaRoutingTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        primary, *replicas = [temp_sqlite_url(self) for _ in range(3)]
+
+        self.db = Database.from_url(
+            primary,
+            replica_urls=replicas,
+            options=EngineOptions(pool_size=2),
+            read_your_writes_window=60,
+        )
+        # Each stand-in holds one row named after itself, so a read shows
+        # which database served it.
+        engines = [self.db.engine, *self.db.replica_engines]
+        for name, engine in zip(["primary", "replica-0", "replica-1"], engines):
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                await conn.execute(
+                    insert(UserModel).values(
+                        id=1, name=name, email="", password_hash="", role="user"
+                    )
+                )
+
+        self.service = UserService(
+            session_factory=lambda **kw: ManagedSession(
+                self.db.session_maker,
+                read_session_maker=self.db.read_session_maker,
+                read_your_writes_window=self.db.read_your_writes_window,
+                **kw,
+            ),
+            repo_class=UserRepository,
+            config=None,
+        )
+
+    async def asyncTearDown(self) -> None:
+        for engine in [self.db.engine, *self.db.replica_engines]:
+            await engine.dispose()
+
+    async def _read_name(self) -> str:
+        return (await self.service.get_by_id(1)).name
+
+    async def test_reads_round_robin_across_replicas(self) -> None:
+        names = [await self._read_name() for _ in range(4)]
+
+        self.assertEqual(names, ["replica-0", "replica-1", "replica-0", "replica-1"])
+
+    async def test_request_reads_its_own_writes_from_primary(self) -> None:
+        async def request_that_writes() -> str:
+            await self.service.create(
+                CreateUserRequestDto(
+                    name="new", email="new@example.com", password_hash="x", role="user"
+                )
+            )
+            return await self._read_name()
+
+        # Separate tasks stand in for separate HTTP requests.
+        self.assertEqual(await asyncio.create_task(request_that_writes()), "primary")
+        self.assertTrue(
+            (await asyncio.create_task(self._read_name())).startswith("replica")
+        )
+
+    async def test_least_connections_prefers_idle_replica(self) -> None:
+        router = self.db.replica_router
+        router.strategy = "least_connections"
+
+        async with self.db.replica_engines[0].connect():
+            names = [await self._read_name() for _ in range(3)]
+
+        self.assertEqual(names, ["replica-1"] * 3)
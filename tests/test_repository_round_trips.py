@@ -0,0 +1,42 @@
+from core.application.dtos.user_dto import CreateUserRequestDto, UpdateUserRequestDto
+from server.infrastructure.repositories.user_repository import UserRepository
+from tests._support import SQLiteTestCase, record_statements
+
+
+class SingleStatementWriteTest(SQLiteTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+
+        self.statements = record_statements(self.engine)
+
+    async def test_each_write_is_one_statement(self) -> None:
+        async with self.session_maker() as session:
+            repo = UserRepository(session)
+
+            self.statements.clear()
+            created = await repo.create(
+                CreateUserRequestDto(
+                    name="demo",
+                    email="demo@example.com",
+                    password_hash="hashed",
+                    role="user",
+                )
+            )
+            self.assertEqual(len(self.statements), 1)
+            self.assertIsNotNone(created.created_at)
+
+            self.statements.clear()
+            updated = await repo.update_by_id(
+                created.id, UpdateUserRequestDto(role="admin")
+            )
+            self.assertEqual(len(self.statements), 1)
+            self.assertEqual(updated.role, "admin")
+
+            self.statements.clear()
+            self.assertTrue(await repo.delete_by_id(created.id))
+            self.assertEqual(len(self.statements), 1)
+
+            self.assertFalse(await repo.delete_by_id(created.id))
+            self.assertIsNone(
+                await repo.update_by_id(created.id, UpdateUserRequestDto(role="user"))
+            )
@@ -0,0 +1,111 @@
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from core.application.dtos.user_dto import UpdateUserRequestDto
+from core.infrastructure.database.models.user import UserModel
+from server.infrastructure.repositories.user_repository import UserRepository
+from tests._support import SQLiteTestCase, user_dto
+
+
+class SoftDeleteTest(SQLiteTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        async with self.session_maker() as session:
+            created = await UserRepository(session).create_many(
+                [user_dto(i) for i in range(4)]
+            )
+            self.ids = [u.id for u in created]
+            await session.commit()
+
+    async def test_delete_marks_the_row_and_reads_skip_it(self) -> None:
+        async with self.session_maker() as session:
+            repo = UserRepository(session)
+            self.assertTrue(await repo.delete_by_id(self.ids[0]))
+            self.assertFalse(await repo.delete_by_id(self.ids[0]))
+            await session.commit()
+
+            self.assertIsNone(await repo.get_by_id(self.ids[0]))
+            self.assertIsNone(await repo.get_version(self.ids[0]))
+            self.assertIsNone(
+                await repo.update_by_id(self.ids[0], UpdateUserRequestDto(name="x"))
+            )
+            self.assertEqual(await repo.count(), 3)
+            self.assertNotIn(self.ids[0], [u.id for u in await repo.get_list()])
+
+            everyone = repo.including_deleted()
+            deleted = await everyone.get_by_id(self.ids[0])
+            self.assertIsNotNone(deleted.deleted_at)
+            self.assertEqual(await everyone.count(), 4)
+
+            # the row is still there
+            rows = await session.scalars(select(UserModel.id))
+            self.assertEqual(sorted(rows), self.ids)
+
+    async def test_delete_many_skips_already_deleted_rows(self) -> None:
+        async with self.session_maker() as session:
+            repo = UserRepository(session)
+            await repo.delete_by_id(self.ids[1])
+
+            deleted = await repo.delete_many([self.ids[1], self.ids[2], 999])
+            await session.commit()
+
+        self.assertEqual(deleted, [self.ids[2]])
+
+    async def test_service_lists_split_active_and_all_users(self) -> None:
+        service = self.user_service()
+        await service.delete_by_id(self.ids[3])
+
+        active = await service.get_active_users(page=1, page_size=10)
+        listed = await service.get_users(page=1, page_size=10)
+        everyone = await service.get_users(page=1, page_size=10, include_deleted=True)
+        page = await service.get_active_users_paged(page=1, page_size=10)
+
+        self.assertEqual([u.id for u in active], self.ids[2::-1])
+        self.assertEqual(listed, active)
+        self.assertEqual([u.id for u in everyone], self.ids[::-1])
+        self.assertEqual(page.total, 3)
+        self.assertEqual(
+            [u.id async for u in service.export_users(active_only=True)], self.ids[:3]
+        )
+        self.assertEqual([u.id async for u in service.export_users()], self.ids[:3])
+        self.assertEqual(
+            [u.id async for u in service.export_users(include_deleted=True)], self.ids
+        )
+
+    async def test_collection_and_item_endpoints_agree(self) -> None:
+        client = await self.api_client(self.user_service())
+        await client.delete(f"/users/{self.ids[3]}")
+
+        self.assertEqual((await client.get(f"/users/{self.ids[3]}")).status_code, 404)
+        for path in ("/users/", "/users/paged", "/users/cursor"):
+            response = await client.get(path)
+            body = response.json()
+            items = body if isinstance(body, list) else body["items"]
+            self.assertNotIn(self.ids[3], [u["id"] for u in items], path)
+
+            everyone = await client.get(path, params={"include_deleted": "true"})
+            body = everyone.json()
+            items = body if isinstance(body, list) else body["items"]
+            self.assertIn(self.ids[3], [u["id"] for u in items], path)
+
+    async def test_active_listing_uses_the_partial_index(self) -> None:
+        async with self.engine.connect() as conn:
+            plan = await conn.execute(
+                text(
+                    'EXPLAIN QUERY PLAN SELECT id FROM "user" '
+                    "WHERE deleted_at IS NULL ORDER BY id DESC LIMIT 10"
+                )
+            )
+            details = " ".join(row[-1] for row in plan)
+
+        self.assertIn("ix_user_live_id", details)
+
+    def test_partial_index_ddl(self) -> None:
+        (index,) = [i for i in UserModel.__table__.indexes if i.name == "ix_user_live_id"]
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+        self.assertEqual(
+            ddl,
+            'CREATE INDEX ix_user_live_id ON "user" (id DESC) WHERE deleted_at IS NULL',
+        )
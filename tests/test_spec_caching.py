@@ -0,0 +1,89 @@
+import unittest
+
+from sqlalchemy import bindparam
+
+from core.application.dtos.user_dto import CreateUserRequestDto
+from core.infrastructure.database.models.user import UserModel
+from core.specs.base import SpecChain
+from core.specs.common import OrderBy, Paginate, Where
+from server.infrastructure.repositories.user_repository import (
+    USERS_SPEC,
+    UserRepository,
+)
+from tests._support import SQLiteTestCase
+
+
+class SpecChainTest(unittest.TestCase):
+    def test_specs_are_sorted_once_by_priority(self) -> None:
+        paginate, order = Paginate.bound(), OrderBy.of(UserModel.id)
+        where = Where.of(UserModel.role == bindparam("role"))
+
+        chain = SpecChain([paginate, order, where], cacheable=True)
+
+        self.assertEqual(chain.specs, (where, order, paginate))
+
+    def test_bound_paginate_renders_parameters(self) -> None:
+        sql = str(Paginate.bound().apply(UserRepository(None)._base_select()))
+
+        self.assertIn(":page_limit", sql)
+        self.assertIn(":page_offset", sql)
+        self.assertEqual(
+            Paginate.params(3, 10), {"page_offset": 20, "page_limit": 10}
+        )
+        self.assertEqual(Paginate.params(0, 0), {"page_offset": 0, "page_limit": 1})
+
+    def test_cached_builds_once_per_key(self) -> None:
+        chain = SpecChain([OrderBy.of(UserModel.id)], cacheable=True)
+        built: list[str] = []
+
+        def build(name: str):
+            built.append(name)
+            return object()
+
+        first = chain.cached("a", lambda: build("a"))
+        self.assertIs(chain.cached("a", lambda: build("a")), first)
+        chain.cached("b", lambda: build("b"))
+
+        self.assertEqual(built, ["a", "b"])
+
+
+class CachedListQueryTest(SQLiteTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+
+    async def test_pages_share_one_statement(self) -> None:
+        async with self.session_maker() as session:
+            repo = UserRepository(session)
+            await repo.create_many(
+                [
+                    CreateUserRequestDto(
+                        name=f"user{i}",
+                        email=f"user{i}@example.com",
+                        password_hash="x",
+                        role="admin" if i % 2 else "user",
+                    )
+                    for i in range(5)
+                ]
+            )
+
+            first = await repo.get_users(page=1, page_size=2)
+            stmt = repo._list_select(USERS_SPEC)
+            second = await repo.get_users(page=2, page_size=2)
+            last = await repo.get_users(page=3, page_size=2)
+
+            self.assertIs(repo._list_select(USERS_SPEC), stmt)
+
+            by_role = SpecChain(
+                [Where.of(UserModel.role == bindparam("role")), Paginate.bound()],
+                cacheable=True,
+            )
+            admins = await repo.get_list(
+                spec=by_role, params={"role": "admin", **Paginate.params(1, 10)}
+            )
+
+        self.assertEqual(
+            [u.name for u in first + second + last],
+            [f"user{i}" for i in reversed(range(5))],
+        )
+        self.assertEqual({u.role for u in admins}, {"admin"})
+        self.assertEqual(len(admins), 2)
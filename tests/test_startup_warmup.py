@@ -0,0 +1,89 @@
+import asyncio
+import unittest
+
+from sqlalchemy import event
+
+from core.infrastructure.database.database import Base, Database
+from core.infrastructure.database.engine import EngineOptions
+from core.infrastructure.database.warmup import warm_up
+from server.infrastructure.repositories.user_repository import UserRepository
+from tests._support import temp_sqlite_url
+
+
+class BrokenRepository(UserRepository):
+    async def warm_up(self) -> int:
+        raise RuntimeError("relation does not exist")
+
+
+class SlowRepository(UserRepository):
+    async def warm_up(self) -> int:
+        await asyncio.sleep(60)
+        return 0
+
+
+class StartupWarmupTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.database = Database.from_url(
+            temp_sqlite_url(self),
+            options=EngineOptions(pool_size=3, max_overflow=0),
+        )
+        self.addAsyncCleanup(self.database.dispose)
+        async with self.database.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def test_opens_the_pool_and_compiles_repository_queries(self) -> None:
+        report = await warm_up(self.database, [UserRepository])
+
+        self.assertEqual(report.connections, 3)
+        self.assertEqual(report.statements, 3 * 6)
+        self.assertEqual(self.database.engine.pool.checkedin(), 3)
+
+        hits: list[bool] = []
+
+        def record(conn, cursor, statement, params, context, executemany) -> None:
+            hits.append(context.cache_hit == context.dialect.CACHE_HIT)
+
+        event.listen(self.database.engine.sync_engine, "after_cursor_execute", record)
+        async with self.database.session_maker() as session:
+            await UserRepository(session).get_active_users(page=3, page_size=20)
+
+        self.assertEqual(hits, [True])
+
+    async def test_connection_count_is_capped_by_the_pool(self) -> None:
+        report = await warm_up(self.database, [], connections=10)
+
+        self.assertEqual(report.connections, 3)
+        self.assertEqual(report.statements, 0)
+
+    async def test_failed_warm_up_is_logged_not_raised(self) -> None:
+        with self.assertLogs("core.infrastructure.database.warmup", "WARNING"):
+            report = await warm_up(self.database, [BrokenRepository])
+
+        self.assertEqual(report.connections, 0)
+
+    async def test_failed_connect_releases_the_other_connections(self) -> None:
+        engine = self.database.engine
+        await engine.dispose()  # drop the schema connection: warm-up opens all
+        attempts = 0
+
+        def refuse_second(dbapi_connection, connection_record) -> None:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 2:
+                raise ConnectionRefusedError("too many clients")
+
+        event.listen(engine.sync_engine, "connect", refuse_second)
+        with self.assertLogs("core.infrastructure.database.warmup", "WARNING"):
+            report = await warm_up(self.database, [UserRepository])
+
+        self.assertEqual(report.connections, 0)
+        self.assertEqual(engine.pool.checkedout(), 0)
+        self.assertEqual(asyncio.all_tasks(), {asyncio.current_task()})
+
+    async def test_timeout_releases_the_connections(self) -> None:
+        with self.assertLogs("core.infrastructure.database.warmup", "WARNING"):
+            report = await warm_up(self.database, [SlowRepository], timeout=0.2)
+
+        self.assertEqual(report.connections, 0)
+        self.assertEqual(self.database.engine.pool.checkedout(), 0)
+        self.assertEqual(asyncio.all_tasks(), {asyncio.current_task()})
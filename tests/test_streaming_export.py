@@ -0,0 +1,147 @@
+import csv
+import importlib
+import io
+import json
+import os
+import unittest
+from datetime import datetime, timezone
+
+from dependency_injector import providers
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from core.application.dtos.user_dto import CreateUserRequestDto, UserResponseDto
+from core.infrastructure.database.models.user import UserModel
+from core.specs.common import OrderBy, Where
+from core.specs.base import SpecChain
+from server.infrastructure.repositories.user_repository import UserRepository
+from tests._support import SQLiteTestCase
+
+
+def _dto(i: int) -> UserResponseDto:
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return UserResponseDto(
+        id=i,
+        name=f"user{i}",
+        email=f"user{i}@example.com",
+        password_hash="x",
+        role="user",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class StreamTest(SQLiteTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+
+        async with self.session_maker() as session:
+            users = await UserRepository(session).create_many(
+                [
+                    CreateUserRequestDto(
+                        name=f"user{i}",
+                        email=f"user{i}@example.com",
+                        password_hash="x",
+                        role="admin" if i % 2 else "user",
+                    )
+                    for i in range(5)
+                ]
+            )
+            await session.execute(
+                update(UserModel)
+                .where(UserModel.id == users[0].id)
+                .values(deleted_at=datetime.now(timezone.utc))
+            )
+            await session.commit()
+
+    async def test_repository_streams_in_chunks_honouring_specs(self) -> None:
+        spec = SpecChain(
+            [Where.of(UserModel.role == "user"), OrderBy.of(UserModel.id.desc())]
+        )
+        async with self.session_maker() as session:
+            names = [
+                u.name
+                async for u in UserRepository(session)
+                .including_deleted()
+                .stream(spec=spec, chunk_size=1)
+            ]
+
+        self.assertEqual(names, ["user4", "user2", "user0"])
+
+    async def test_service_export_skips_deleted_users(self) -> None:
+        service = self.user_service()
+
+        default = [u.name async for u in service.export_users(chunk_size=2)]
+        everyone = [
+            u.name async for u in service.export_users(include_deleted=True)
+        ]
+        active = [
+            u.name
+            async for u in service.export_users(active_only=True, include_deleted=True)
+        ]
+
+        self.assertEqual(default, [f"user{i}" for i in range(1, 5)])
+        self.assertEqual(everyone, [f"user{i}" for i in range(5)])
+        self.assertEqual(active, [f"user{i}" for i in range(1, 5)])
+
+
+class _FakeUserService:
+    def __init__(self) -> None:
+        self.closed = False
+        self.calls: list[dict] = []
+
+    async def export_users(self, *, chunk_size=None, **filters):
+        self.calls.append(filters)
+        try:
+            for i in range(3):
+                yield _dto(i)
+        finally:
+            self.closed = True
+
+
+class ExportEndpointTest(unittest.TestCase):
+    def setUp(self) -> None:
+        os.environ.setdefault("DATABASE_USER", "test_user")
+        os.environ.setdefault("DATABASE_PASSWORD", "test_password")
+        os.environ.setdefault("DATABASE_HOST", "127.0.0.1")
+        os.environ.setdefault("DATABASE_PORT", "5432")
+        os.environ.setdefault("DATABASE_NAME", "test_db")
+        self.server_app = importlib.reload(importlib.import_module("server.app"))
+        self.app = self.server_app.create_app()
+        self.service = _FakeUserService()
+
+    def _get(self, **params):
+        container = self.server_app.container
+        with container.user_service.override(providers.Object(self.service)):
+            with TestClient(self.app) as client:
+                return client.get("/users/export", params=params)
+
+    def test_ndjson_export(self) -> None:
+        response = self._get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("application/x-ndjson"))
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual([line["name"] for line in lines], ["user0", "user1", "user2"])
+        self.assertTrue(self.service.closed)
+
+    def test_csv_export(self) -> None:
+        response = self._get(format="csv")
+
+        self.assertEqual(response.status_code, 200)
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        self.assertEqual([r["id"] for r in rows], ["0", "1", "2"])
+        self.assertEqual(rows[0]["deleted_at"], "")
+        self.assertEqual(set(rows[0]), set(UserResponseDto.model_fields))
+
+    def test_filters_are_passed_through(self) -> None:
+        self._get()
+        self._get(include_deleted="true")
+
+        self.assertEqual(
+            self.service.calls,
+            [
+                {"active_only": False, "include_deleted": False},
+                {"active_only": False, "include_deleted": True},
+            ],
+        )
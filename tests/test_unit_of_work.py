@@ -0,0 +1,101 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import event
+
+from core.application.dtos.user_dto import UpdateUserRequestDto, UserResponseDto
+from core.infrastructure.cache.backends import InMemoryCacheBackend
+from core.infrastructure.cache.entity_cache import EntityCache
+from core.infrastructure.database.session import on_commit
+from core.infrastructure.database.unit_of_work import UnitOfWorkMiddleware
+from tests._support import SQLiteTestCase, user_dto
+
+
+class UnitOfWorkTest(SQLiteTestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.service = self.user_service()
+        self.user = await self.service.create(user_dto(0))
+
+        self.checkouts = 0
+
+        def count_checkout(*args) -> None:
+            self.checkouts += 1
+
+        event.listen(self.engine.sync_engine.pool, "checkout", count_checkout)
+        self.events: list[str] = []
+
+    def _app(self, *, request_scope: bool) -> FastAPI:
+        app = FastAPI()
+        service = self.service
+
+        @app.post("/rename/{user_id}")
+        async def rename(user_id: int, fail: bool = False):
+            before = await service.get_by_id(user_id)
+            await service.update_by_id(user_id, UpdateUserRequestDto(name="renamed"))
+            async with service._session_factory() as session:
+                on_commit(session, self._record("callback"))
+                await session.commit()
+            after = await service.get_by_id(user_id)
+            await asyncio.gather(service.count(), service.get_users(1, 10))
+            self.events.append("handler done")
+            if fail:
+                raise RuntimeError("boom")
+            return {"before": before.name, "after": after.name}
+
+        if request_scope:
+            app.add_middleware(UnitOfWorkMiddleware)
+        return app
+
+    def _record(self, name: str):
+        async def record() -> None:
+            self.events.append(name)
+
+        return record
+
+    async def _post(self, app: FastAPI, path: str) -> httpx.Response:
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+            return await client.post(path)
+
+    async def test_request_scope_uses_one_connection_and_commits_once(self) -> None:
+        response = await self._post(
+            self._app(request_scope=True), f"/rename/{self.user.id}"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"before": "user0", "after": "renamed"})
+        self.assertEqual(self.checkouts, 1)
+        self.assertEqual(self.events, ["handler done", "callback"])
+        self.assertEqual((await self.service.get_by_id(self.user.id)).name, "renamed")
+
+    async def test_call_scope_keeps_one_transaction_per_call(self) -> None:
+        response = await self._post(
+            self._app(request_scope=False), f"/rename/{self.user.id}"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(self.checkouts, 1)
+        self.assertEqual(self.events, ["callback", "handler done"])
+
+    async def test_failure_rolls_back_the_whole_request(self) -> None:
+        response = await self._post(
+            self._app(request_scope=True), f"/rename/{self.user.id}?fail=true"
+        )
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(self.events, ["handler done"])
+        self.assertEqual((await self.service.get_by_id(self.user.id)).name, "user0")
+
+    async def test_rolled_back_writes_never_reach_the_cache(self) -> None:
+        cache = EntityCache(InMemoryCacheBackend(), UserResponseDto, namespace="uow")
+        self.service = self.user_service(cache=cache)
+        await self.service.get_by_id(self.user.id)  # cached before the request
+
+        response = await self._post(
+            self._app(request_scope=True), f"/rename/{self.user.id}?fail=true"
+        )
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual((await self.service.get_by_id(self.user.id)).name, "user0")
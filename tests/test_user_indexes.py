@@ -0,0 +1,119 @@
+import os
+import unittest
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from core.application.dtos.user_dto import CreateUserRequestDto
+from core.domain.repositories.base import ConflictError
+from core.infrastructure.database.models.user import UserModel
+from core.specs.common import Where
+from server.application.controllers.user_controller import EMAIL_TAKEN
+from server.infrastructure.repositories.user_repository import UserRepository
+from tests._explain import assert_uses_index, explain
+from tests._support import SQLiteTestCase
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+def _user(email: str) -> CreateUserRequestDto:
+    return CreateUserRequestDto(
+        name=email.split("@")[0], email=email, password_hash="x", role="user"
+    )
+
+
+class UserIndexesTest(SQLiteTestCase):
+    """Runs on SQLite; ``PostgresUserIndexesTest`` repeats it on a real server."""
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.statements: list[tuple[str, object]] = []
+        event.listen(self.engine.sync_engine, "before_cursor_execute", self._record)
+        async with self.session_maker() as session:
+            await UserRepository(session).create_many(
+                [_user(f"user{i}@example.com") for i in range(20)]
+            )
+            await session.commit()
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append((statement, parameters))
+
+    async def _explain_last(self, session, index: str) -> None:
+        sql, params = self.statements[-1]
+        await assert_uses_index(session, sql, index, params)
+
+    async def test_get_by_email_is_case_insensitive_and_indexed(self) -> None:
+        async with self.session_maker() as session:
+            repo = UserRepository(session)
+            user = await repo.get_by_email("User7@Example.COM")
+            await self._explain_last(session, "ux_user_email_lower")
+
+            self.assertEqual(user.email, "user7@example.com")
+            self.assertIsNone(await repo.get_by_email("nobody@example.com"))
+
+    async def test_created_at_range_uses_its_index(self) -> None:
+        since = datetime.now() - timedelta(days=1)
+        async with self.session_maker() as session:
+            users = await UserRepository(session).get_list(
+                spec=Where.of(UserModel.created_at >= since)
+            )
+            await self._explain_last(session, "ix_user_created_at")
+
+        self.assertEqual(len(users), 20)
+
+    async def test_email_is_unique_among_live_users(self) -> None:
+        async with self.session_maker() as session:
+            repo = UserRepository(session)
+            with self.assertRaises(ConflictError) as raised:
+                await repo.create(_user("USER1@example.com"))
+            self.assertIsInstance(raised.exception.__cause__, IntegrityError)
+            await session.rollback()
+
+            old = await repo.get_by_email("user1@example.com")
+            await repo.delete_by_id(old.id)
+            new = await repo.create(_user("User1@example.com"))
+            await session.commit()
+
+            self.assertEqual((await repo.get_by_email("user1@example.com")).id, new.id)
+
+    async def test_duplicate_email_is_a_409(self) -> None:
+        client = await self.api_client(self.user_service())
+        taken = _user("User2@Example.com").model_dump()
+
+        created = await client.post("/users/", json=taken)
+        bulk = await client.post(
+            "/users/bulk", json=[_user("new@example.com").model_dump(), taken]
+        )
+        user = (await client.get("/users/", params={"page_size": 1})).json()[0]
+        renamed = await client.put(
+            f"/users/{user['id']}", json={"email": "USER3@example.com"}
+        )
+
+        self.assertEqual((created.status_code, bulk.status_code), (409, 409))
+        self.assertEqual(renamed.status_code, 409)
+        self.assertEqual(created.json(), {"detail": EMAIL_TAKEN})
+        async with self.session_maker() as session:
+            repo = UserRepository(session)
+            self.assertEqual(await repo.count(), 20)  # the bulk insert rolled back
+            self.assertIsNone(await repo.get_by_email("new@example.com"))
+
+    async def test_get_by_field_takes_column_names(self) -> None:
+        async with self.session_maker() as session:
+            repo = UserRepository(session)
+            user = await repo.get_by_field("name", "user3")
+            plan = await explain(
+                session, "SELECT id FROM \"user\" WHERE name = 'x'", seqscan=True
+            )
+
+            self.assertEqual(user.email, "user3@example.com")
+            self.assertIn("user", plan.seq_scans)
+            with self.assertRaises(ValueError):
+                await repo.get_by_field("nickname", "x")
+
+
+@unittest.skipUnless(POSTGRES_URL, "set TEST_POSTGRES_URL to run against Postgres")
+class PostgresUserIndexesTest(UserIndexesTest):
+    def create_engine(self, url: str) -> AsyncEngine:
+        return create_async_engine(POSTGRES_URL)